@@ -1,6 +1,7 @@
 import pytest
 
 from typing import Callable, Optional
+from django.core.cache import cache
 from django.test import Client
 
 from src.user.models import User
@@ -54,3 +55,10 @@ def authenticated_client(client, user) -> Client:
     """
     client.force_login(user)
     return client
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Keeps cached values from outliving the rolled back transaction of a test."""
+    yield
+    cache.clear()
@@ -2,6 +2,7 @@ from django.contrib import admin
 from .models import (
     Article,
     ArticleCategory,
+    AttributeConfiguration,
     Board,
     ExternalShop,
     ExternalBoardOptions,
@@ -14,3 +15,20 @@ admin.site.register(Board)
 admin.site.register(ExternalShop)
 admin.site.register(ExternalBoardOptions)
 admin.site.register(OfferedBoardOptions)
+
+
+@admin.register(AttributeConfiguration)
+class AttributeConfigurationAdmin(admin.ModelAdmin):
+    """Read-only, since the boards and order items referencing a configuration
+    rely on its attributes matching its digest.
+    """
+    list_display = ["digest", "created"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,81 @@
+import datetime
+from typing import Iterable, Optional
+
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from auditlog.models import LogEntry
+
+from core.audit import log_bulk_changes
+from core.chunked_deletion import raw_delete
+from user.basket_management import invalidate_basket_summary
+
+from .models import Article, Board
+
+
+def get_stale_boards(retention: datetime.timedelta) -> QuerySet:
+    """Returns all boards that have never been ordered, were created before the
+    retention window and have not been touched in a basket within it.
+    """
+    cutoff = timezone.now() - retention
+    return (
+        Board.objects
+        .filter(created__lt=cutoff, article2order__isnull=True)
+        .exclude(basketitem__changed__gte=cutoff)
+    )
+
+
+def delete_boards(
+        board_ids: Iterable[int],
+        actor: Optional[User] = None,
+        retention: Optional[datetime.timedelta] = None
+) -> int:
+    """Deletes the given boards together with their basket items and article rows,
+    with one DELETE per table and one bulk insert of audit log entries.
+
+    The boards are selected again and locked inside the transaction, and only those
+    that are still not ordered (and, with <retention>, still stale) are deleted.
+    A board that was ordered or put in a basket since the ids were collected is kept.
+    Returns the number of deleted boards.
+    """
+    BasketItem = apps.get_model("user", "BasketItem")
+    board_ids = list(board_ids)
+    if retention is None:
+        deletable = Board.objects.filter(article2order__isnull=True)
+    else:
+        deletable = get_stale_boards(retention)
+
+    with transaction.atomic():
+        # Only the board rows are locked, the outer join to the order items cannot be
+        boards = dict(
+            deletable
+            .filter(pk__in=board_ids)
+            .select_for_update(of=("self",))
+            .values_list("pk", "owner_id")
+        )
+        basket_items = dict(BasketItem.objects.filter(article_id__in=boards).values_list("pk", "owner_id"))
+
+        raw_delete(BasketItem.objects.filter(pk__in=basket_items))
+        raw_delete(Board.objects.filter(pk__in=boards))
+        raw_delete(Article.objects.filter(pk__in=boards))
+
+        log_bulk_changes(
+            BasketItem,
+            {pk: {"owner": [str(owner_id), None]} for pk, owner_id in basket_items.items()},
+            action=LogEntry.Action.DELETE,
+            actor=actor
+        )
+        log_bulk_changes(
+            Board,
+            {pk: {"owner": [str(owner_id), None]} for pk, owner_id in boards.items()},
+            action=LogEntry.Action.DELETE,
+            actor=actor
+        )
+
+    for owner_id in set(basket_items.values()):
+        invalidate_basket_summary(owner_id)
+
+    return len(boards)
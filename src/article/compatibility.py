@@ -0,0 +1,163 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.apps import apps
+from django.db.models import QuerySet
+
+
+class CompatibilityIndex:
+    """Index over the latest board options of all external shops.
+
+    Every shop is a bit in a shop mask. The choices of each label are numbered
+    in a global value dictionary, so that
+
+    - <choice_shops> maps each (label, choice) to the mask of the shops offering it and
+    - <shop_choices> maps each (label, shop) to the mask of the choices it offers.
+
+    Ranges are kept as parallel arrays of minimums, maximums and shop bits per label.
+    Questions like "which shops can produce this board?" then take a few bitwise ANDs.
+    """
+    def __init__(self, shop_options: Dict[str, dict]):
+        self.shops: List[str] = list(shop_options)
+        self.all_shops = (1 << len(self.shops)) - 1
+
+        self.value_ids: Dict[str, Dict[Any, int]] = {}
+        self.choice_shops: Dict[str, Dict[Any, int]] = {}
+        self.shop_choices: Dict[str, Dict[int, int]] = {}
+        self.ranges: Dict[str, Tuple[List[float], List[float], List[int]]] = {}
+
+        for position, options in enumerate(shop_options.values()):
+            shop_bit = 1 << position
+            for label, values in options.items():
+                if "choices" in values:
+                    self._add_choices(label, values["choices"], shop_bit)
+                elif "range" in values:
+                    mins, maxs, shop_bits = self.ranges.setdefault(label, ([], [], []))
+                    mins.append(values["range"]["min"])
+                    maxs.append(values["range"]["max"])
+                    shop_bits.append(shop_bit)
+
+    def _add_choices(self, label: str, choices: list, shop_bit: int) -> None:
+        value_ids = self.value_ids.setdefault(label, {})
+        choice_shops = self.choice_shops.setdefault(label, {})
+
+        value_mask = 0
+        for choice in choices:
+            value_id = value_ids.setdefault(choice, len(value_ids))
+            choice_shops[choice] = choice_shops.get(choice, 0) | shop_bit
+            value_mask |= 1 << value_id
+        self.shop_choices.setdefault(label, {})[shop_bit] = value_mask
+
+    def get_shop_names(self, shop_mask: int) -> List[str]:
+        return [shop for position, shop in enumerate(self.shops) if shop_mask >> position & 1]
+
+    def _get_range_shops(self, label: str, low, high) -> int:
+        """Returns the mask of the shops whose range for <label> contains [low, high]."""
+        shop_mask = 0
+        mins, maxs, shop_bits = self.ranges.get(label, ([], [], []))
+        for minimum, maximum, shop_bit in zip(mins, maxs, shop_bits):
+            if minimum <= low and high <= maximum:
+                shop_mask |= shop_bit
+        return shop_mask
+
+    def get_value_shops(self, label: str, value) -> int:
+        """Returns the mask of the shops that offer <value> for <label>."""
+        shop_mask = self.choice_shops.get(label, {}).get(value, 0)
+        if label in self.ranges and isinstance(value, (int, float)):
+            shop_mask |= self._get_range_shops(label, value, value)
+        return shop_mask
+
+    def get_option_shops(self, label: str, values: dict) -> int:
+        """Returns the mask of the shops that offer all of <values>
+        ({"choices": [...]} or {"range": {"min", "max"}}) for <label>.
+        """
+        if "range" in values:
+            return self._get_range_shops(label, values["range"]["min"], values["range"]["max"])
+        if "choices" not in values:
+            return 0
+
+        value_ids = self.value_ids.get(label, {})
+        if any(choice not in value_ids for choice in values["choices"]):
+            return 0
+
+        wanted = 0
+        for choice in values["choices"]:
+            wanted |= 1 << value_ids[choice]
+        return sum(
+            shop_bit
+            for shop_bit, offered in self.shop_choices.get(label, {}).items()
+            if wanted & ~offered == 0
+        )
+
+    def get_board_shops(self, attributes: dict) -> List[str]:
+        """Returns the names of the shops that can produce a board with <attributes>."""
+        shop_mask = self.all_shops
+        for label, value in attributes.items():
+            shop_mask &= self.get_value_shops(label, value)
+            if not shop_mask:
+                break
+        return self.get_shop_names(shop_mask)
+
+    def get_covering_shops(self, options: dict) -> List[str]:
+        """Returns the names of the shops that offer all of the board <options>."""
+        shop_mask = self.all_shops
+        for label, values in options.items():
+            shop_mask &= self.get_option_shops(label, values)
+            if not shop_mask:
+                break
+        return self.get_shop_names(shop_mask)
+
+    def get_coverage_report(self, options: dict) -> dict:
+        """Returns, per label of the board <options>, which shops cover it and,
+        for choices, which of them each shop is missing.
+        """
+        report = {}
+        for label, values in options.items():
+            shop_mask = self.get_option_shops(label, values)
+            shops = {}
+            for position, shop in enumerate(self.shops):
+                coverage = {"covered": bool(shop_mask >> position & 1)}
+                if "choices" in values:
+                    coverage["missing"] = [
+                        choice for choice in values["choices"]
+                        if not self.choice_shops.get(label, {}).get(choice, 0) >> position & 1
+                    ]
+                shops[shop] = coverage
+            report[label] = {"covering_shops": self.get_shop_names(shop_mask), "shops": shops}
+
+        return {
+            "shops": self.shops,
+            "covering_shops": self.get_covering_shops(options),
+            "labels": report,
+        }
+
+
+_index: Optional[CompatibilityIndex] = None
+_index_version: Optional[tuple] = None
+
+
+def _get_latest_rows() -> QuerySet:
+    """Returns the latest external options row of every shop."""
+    ExternalBoardOptions = apps.get_model('article', 'ExternalBoardOptions')
+    return ExternalBoardOptions.objects.order_by("external_shop", "-created").distinct("external_shop")
+
+
+def get_latest_shop_options() -> Dict[str, dict]:
+    """Returns the latest board options of every external shop, keyed by shop name."""
+    latest = _get_latest_rows().select_related("external_shop")
+    return {options.external_shop.name: options.attribute_options for options in latest}
+
+
+def get_compatibility_index() -> CompatibilityIndex:
+    """Returns the index over the shops' latest options.
+
+    The index is only rebuilt if the latest row, the content hash of its
+    options (which changes when a row is edited in place) or the name
+    of any shop changed since. Checking that is a single small query.
+    """
+    global _index, _index_version
+    version = tuple(_get_latest_rows().values_list("id", "content_hash", "external_shop__name"))
+
+    if _index is None or version != _index_version:
+        _index = CompatibilityIndex(get_latest_shop_options())
+        _index_version = version
+    return _index
@@ -0,0 +1,14 @@
+import json
+import hashlib
+
+
+def canonical_json(data) -> str:
+    """Returns a JSON encoding of <data> that does not depend on key order or whitespace."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def canonical_hash(data) -> str:
+    """Returns the SHA-256 hex digest of the canonical JSON encoding of <data>.
+    Equal attribute or option dicts always produce the same hash.
+    """
+    return hashlib.sha256(canonical_json(data).encode()).hexdigest()
@@ -0,0 +1,48 @@
+# Generated by Django 3.1.6 on 2026-10-19 10:04
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from article.hashing import canonical_hash
+
+
+def intern_board_attributes(apps, schema_editor):
+    """Links every existing board to the configuration of its attributes."""
+    Board = apps.get_model('article', 'Board')
+    AttributeConfiguration = apps.get_model('article', 'AttributeConfiguration')
+
+    # The historical Board cannot resolve its default ordering by the parent's 'created'
+    for board in Board.objects.order_by().only('pk', 'attributes').iterator(chunk_size=2000):
+        configuration, _ = AttributeConfiguration.objects.get_or_create(
+            digest=canonical_hash(board.attributes),
+            defaults={'attributes': board.attributes}
+        )
+        Board.objects.filter(pk=board.pk).update(configuration=configuration)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0013_auto_20210430_1835'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttributeConfiguration',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('digest', models.CharField(max_length=64, unique=True)),
+                ('attributes', models.JSONField()),
+            ],
+            options={
+                'verbose_name': 'Attribute Configuration',
+            },
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='configuration',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='boards', to='article.attributeconfiguration'),
+        ),
+        migrations.RunPython(intern_board_attributes, migrations.RunPython.noop),
+    ]
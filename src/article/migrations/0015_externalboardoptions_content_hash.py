@@ -0,0 +1,34 @@
+# Generated by Django 3.1.6 on 2026-10-19 15:40
+
+from django.db import migrations, models
+
+from article.hashing import canonical_hash
+
+
+def add_content_hashes(apps, schema_editor):
+    ExternalBoardOptions = apps.get_model('article', 'ExternalBoardOptions')
+
+    options = list(ExternalBoardOptions.objects.only('id', 'attribute_options'))
+    for external_options in options:
+        external_options.content_hash = canonical_hash(external_options.attribute_options)
+    ExternalBoardOptions.objects.bulk_update(options, ['content_hash'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0014_attributeconfiguration'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='externalboardoptions',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='externalboardoptions',
+            index=models.Index(fields=['external_shop', '-created'], name='article_ext_externa_d318de_idx'),
+        ),
+        migrations.RunPython(add_content_hashes, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
 from django.dispatch import receiver
 from django.apps import apps
 from django.db.models.signals import post_save
@@ -7,6 +8,7 @@ from django.db.models.signals import post_save
 from auditlog.registry import auditlog
 
 from .validators import validate_external_consistency
+from .hashing import canonical_hash
 
 # Let's set a default category ("Misc", for example)
 # that products can fall back to in the unlikely event that we delete a category.
@@ -44,6 +46,47 @@ class Article(models.Model):
         ordering = ['-created']
 
 
+class AttributeConfigurationManager(models.Manager):
+    def intern(self, attributes: dict) -> "AttributeConfiguration":
+        """Returns the stored configuration for the given attributes,
+        creating it if it does not exist yet.
+        """
+        configuration, _ = self.get_or_create(
+            digest=canonical_hash(attributes),
+            defaults={"attributes": attributes}
+        )
+        return configuration
+
+
+class AttributeConfiguration(models.Model):
+    """Model for a distinct set of board attributes.
+
+    Each configuration is stored only once, identified by a canonical hash
+    of its attributes, and is never changed afterwards. Boards and order
+    items reference it instead of copying the attributes.
+    """
+    created = models.DateTimeField(auto_now_add=True)
+    digest = models.CharField(max_length=64, unique=True)
+    attributes = models.JSONField()
+
+    objects = AttributeConfigurationManager()
+
+    class Meta:
+        verbose_name = "Attribute Configuration"
+
+    def __str__(self):
+        return f"<AttributeConfiguration {self.digest[:12]}>"
+
+    def save(self, *args, **kwargs):
+        """Only inserts new configurations, with the digest of their attributes.
+        A stored configuration is shared by boards and order items and cannot be changed.
+        """
+        if not self._state.adding:
+            raise ValidationError("Stored attribute configurations cannot be changed.", code="immutable")
+        self.digest = canonical_hash(self.attributes)
+        super().save(*args, **kwargs)
+
+
 class Board(Article):
     """Model for PCBs"""
     owner = models.ForeignKey(
@@ -57,6 +100,13 @@ class Board(Article):
     gerberHash = models.CharField(max_length=100)
 
     attributes = models.JSONField()
+    configuration = models.ForeignKey(
+        AttributeConfiguration,
+        related_name='boards',
+        null=True,
+        blank=True,
+        on_delete=models.PROTECT
+    )
 
     class Meta:
         ordering = ['-created']
@@ -64,6 +114,11 @@ class Board(Article):
     def __str__(self):
         return f"<Board by user {self.owner.email}>"
 
+    def save(self, *args, **kwargs):
+        """Ensures that the board references the configuration of its current attributes."""
+        self.configuration = AttributeConfiguration.objects.intern(self.attributes)
+        super().save(*args, **kwargs)
+
 
 @receiver(post_save, sender=Board)
 def create_basket_item(sender, instance, created, **kwargs):
@@ -105,24 +160,38 @@ class OfferedBoardOptions(models.Model):
 
 
 class ExternalBoardOptions(models.Model):
-    """Model to store the board options externally available in some PCB shop at any given time."""
+    """Model to store the board options externally available in some PCB shop at any given time.
+
+    A new row is only added when a shop's options change, which is detected
+    through the canonical hash of the options.
+    """
     created = models.DateTimeField(auto_now_add=True)
     external_shop = models.ForeignKey(ExternalShop, on_delete=models.DO_NOTHING)
     attribute_options = models.JSONField()
+    content_hash = models.CharField(max_length=64, blank=True)
 
     class Meta:
         ordering = ['-created']
         verbose_name = "External Board Options"
         verbose_name_plural = "External Board Options List"
 
-        indexes = [models.Index(fields=["-created"])]
+        indexes = [
+            models.Index(fields=["-created"]),
+            models.Index(fields=["external_shop", "-created"]),
+        ]
 
     def __str__(self):
         return f"<ExternalBoardOptions from shop '{self.external_shop.name}'>"
 
+    def save(self, *args, **kwargs):
+        """Ensures that the content hash matches the current options."""
+        self.content_hash = canonical_hash(self.attribute_options)
+        super().save(*args, **kwargs)
+
 
 auditlog.register(ArticleCategory)
 auditlog.register(Article)
+auditlog.register(AttributeConfiguration)
 auditlog.register(Board)
 auditlog.register(ExternalShop)
 auditlog.register(OfferedBoardOptions)
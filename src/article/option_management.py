@@ -0,0 +1,29 @@
+from typing import Tuple
+
+from django.db import transaction
+
+from .hashing import canonical_hash
+from .models import ExternalShop, ExternalBoardOptions
+
+
+def store_external_options(shop: ExternalShop, attribute_options: dict) -> Tuple[ExternalBoardOptions, bool]:
+    """Stores the shop's current board options, unless they equal its latest stored options.
+
+    Returns the shop's latest options and whether they were newly created.
+    """
+    digest = canonical_hash(attribute_options)
+
+    with transaction.atomic():
+        # Serializes concurrent ingestions for the same shop
+        ExternalShop.objects.select_for_update().filter(pk=shop.pk).exists()
+
+        latest = (
+            ExternalBoardOptions.objects
+            .filter(external_shop=shop)
+            .only("id", "created", "content_hash", "external_shop_id")
+            .first()
+        )
+        if latest is not None and latest.content_hash == digest:
+            return latest, False
+
+        return ExternalBoardOptions.objects.create(external_shop=shop, attribute_options=attribute_options), True
@@ -1,11 +1,13 @@
 from django.core.validators import ValidationError
 from rest_framework import serializers
 
+from core.fieldsets import SparseFieldsetSerializerMixin
+
 from .models import Board, Article, OfferedBoardOptions
 from .validators import AttributeValidator
 
 
-class BoardSerializer(serializers.ModelSerializer):
+class BoardSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     owner = serializers.CharField(source="owner.email", read_only=True)
     category = serializers.CharField(source="category.name", read_only=True)
 
@@ -20,7 +22,7 @@ class BoardSerializer(serializers.ModelSerializer):
     class Meta:
         model = Board
         fields = "__all__"
-        read_only_fields = ["gerberFileName", "gerberHash"]
+        read_only_fields = ["gerberFileName", "gerberHash", "configuration"]
 
 
 class OfferedBoardOptionsSerializer(serializers.ModelSerializer):
@@ -0,0 +1,138 @@
+import json
+import uuid
+
+import pytest
+
+from django.urls import reverse
+
+from src.article.models import Board
+from src.core.idempotency import IdempotencyKeyInFlight, IdempotencyStore
+
+from .conftest import VALID_BOARD_DATA
+
+
+def get_board_data(**fields) -> dict:
+    data = {**VALID_BOARD_DATA, **fields}
+    data["attributes"] = json.dumps(data["attributes"])
+    return data
+
+
+class TestIdempotencyStore:
+    def test_key_in_flight_is_shared_between_stores(self):
+        """GIVEN a request whose key was acquired by one worker's store
+
+        WHEN a duplicate reaches another worker before the first one finished
+
+        THEN the duplicate is told the key is in flight, and gets the stored
+        response once the first request finished.
+        """
+        key = str(uuid.uuid4())
+        first, second = IdempotencyStore(wait_timeout=0), IdempotencyStore(wait_timeout=0)
+
+        assert first.acquire(key, "fingerprint") is None
+        with pytest.raises(IdempotencyKeyInFlight):
+            second.acquire(key, "fingerprint")
+
+        first.save(key, "fingerprint", 201, {"id": 1})
+        assert second.acquire(key, "fingerprint") == ("fingerprint", 201, {"id": 1})
+
+    def test_released_key_can_be_acquired_again(self):
+        key = str(uuid.uuid4())
+        store = IdempotencyStore(wait_timeout=0)
+
+        assert store.acquire(key, "fingerprint") is None
+        store.release(key)
+        assert store.acquire(key, "fingerprint") is None
+
+
+@pytest.mark.django_db
+class TestBoardCreationIdempotency:
+    def test_retry_with_same_key_creates_one_board(self, authenticated_client, user):
+        """GIVEN an authenticated user
+
+        WHEN that user sends the same board creation request twice
+        with the same Idempotency-Key header
+
+        THEN only one board is created and both responses are identical.
+        """
+        data = get_board_data()
+        key = str(uuid.uuid4())
+
+        responses = [
+            authenticated_client.post(path=reverse("shop:board_list"), data=data, HTTP_IDEMPOTENCY_KEY=key)
+            for _ in range(2)
+        ]
+
+        assert [response.status_code for response in responses] == [201, 201]
+        assert responses[0].json() == responses[1].json()
+        assert responses[1]["Idempotent-Replayed"] == "true"
+        assert Board.objects.filter(owner=user).count() == 1
+
+    def test_same_key_with_different_data_is_rejected(self, authenticated_client):
+        """GIVEN an authenticated user who has created a board with an Idempotency-Key
+
+        WHEN that user reuses the key for a different board
+
+        THEN a 422 status code is returned.
+        """
+        key = str(uuid.uuid4())
+        authenticated_client.post(path=reverse("shop:board_list"), data=get_board_data(), HTTP_IDEMPOTENCY_KEY=key)
+
+        data = get_board_data(gerberFileName="other_gerber.zip")
+        response = authenticated_client.post(path=reverse("shop:board_list"), data=data, HTTP_IDEMPOTENCY_KEY=key)
+        assert response.status_code == 422
+
+    def test_failed_request_is_not_replayed(self, authenticated_client, user):
+        """GIVEN an authenticated user whose board creation was rejected as invalid
+
+        WHEN that user retries with corrected data and the same Idempotency-Key
+
+        THEN the corrected request is processed and the board is created.
+        """
+        key = str(uuid.uuid4())
+        invalid_data = get_board_data()
+        del invalid_data["gerberFileName"]
+
+        response = authenticated_client.post(
+            path=reverse("shop:board_list"), data=invalid_data, HTTP_IDEMPOTENCY_KEY=key
+        )
+        assert response.status_code == 400
+
+        response = authenticated_client.post(
+            path=reverse("shop:board_list"), data=get_board_data(), HTTP_IDEMPOTENCY_KEY=key
+        )
+        assert response.status_code == 201
+        assert "Idempotent-Replayed" not in response
+        assert Board.objects.filter(owner=user).count() == 1
+
+
+@pytest.mark.django_db
+class TestBoardListFields:
+    def test_board_list_contains_only_requested_fields(self, create_boards, user, authenticated_client):
+        """GIVEN an authenticated user who has created some boards
+
+        WHEN that user requests a list of their boards with a fields query param
+
+        THEN each board in the list contains exactly the requested fields.
+        """
+        create_boards(num_boards=2)
+
+        response = authenticated_client.get(path=reverse("shop:board_list"), data={"fields": "owner,created"})
+        assert response.status_code == 200
+
+        for board in response.json():
+            assert set(board) == {"owner", "created"}
+            assert board["owner"] == user.email
+
+    def test_unknown_fields_are_ignored(self, create_boards, authenticated_client):
+        create_boards()
+
+        response = authenticated_client.get(path=reverse("shop:board_list"), data={"fields": "id,unknown"})
+        assert response.status_code == 200
+        assert [set(board) for board in response.json()] == [{"id"}]
+
+    def test_all_fields_are_returned_by_default(self, create_boards, authenticated_client):
+        create_boards()
+
+        response = authenticated_client.get(path=reverse("shop:board_list"))
+        assert {"id", "owner", "created", "attributes"} <= set(response.json()[0])
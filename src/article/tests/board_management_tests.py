@@ -0,0 +1,102 @@
+import datetime
+
+import pytest
+
+from django.utils import timezone
+
+from src.article.board_management import delete_boards, get_stale_boards
+from src.article.models import Article, ArticleCategory, Board
+from src.order.models import Article2Order, Order, OrderState, PaymentState, ShippingMethod
+from src.user.address_management import Address
+from src.user.models import BasketItem
+
+
+RETENTION = datetime.timedelta(days=30)
+
+
+def create_board(user, age_days: int = 60) -> Board:
+    """Creates a board of <user> together with its basket item, both last touched <age_days> ago."""
+    board = Board.objects.create(
+        owner=user,
+        category=ArticleCategory.objects.get(name="PCB"),
+        gerberFileName="gerber.zip",
+        gerberHash="blablub123",
+        attributes={"layers": 2}
+    )
+    touched = timezone.now() - datetime.timedelta(days=age_days)
+    Article.objects.filter(pk=board.pk).update(created=touched)
+    BasketItem.objects.filter(article_id=board.pk).update(created=touched, changed=touched)
+    return board
+
+
+def order_board(user, board: Board) -> Article2Order:
+    """Orders <board> alone. Placing an order moves the whole basket into it,
+    so the user's other basket items are removed first.
+    """
+    BasketItem.objects.filter(owner=user).exclude(article_id=board.pk).delete()
+    address = Address.objects.create(
+        user=user, receiver_first_name="Max", receiver_last_name="Mustermann",
+        street="Musterstraße", house_number="99", zip_code="99999", city="Berlin"
+    )
+    order = Order.objects.create(
+        user=user,
+        shipping_method=ShippingMethod.objects.first(),
+        shipping_address=address,
+        billing_address=address,
+        amount=15.99,
+        vat=1.12,
+        order_state=OrderState.objects.get(name="received"),
+        payment_state=PaymentState.objects.get(name="pending")
+    )
+    return Article2Order.objects.get(order=order, article_id=board.pk)
+
+
+@pytest.mark.django_db
+class TestStaleBoards:
+    def test_only_old_unordered_untouched_boards_are_stale(self, user):
+        stale = create_board(user)
+        create_board(user, age_days=1)
+        order_board(user, create_board(user))
+
+        assert list(get_stale_boards(RETENTION).values_list("pk", flat=True)) == [stale.pk]
+
+    def test_stale_boards_are_deleted_with_their_basket_items(self, user):
+        boards = [create_board(user) for _ in range(2)]
+        board_ids = list(get_stale_boards(RETENTION).values_list("pk", flat=True))
+
+        assert delete_boards(board_ids, retention=RETENTION) == 2
+        assert not Board.objects.filter(pk__in=[board.pk for board in boards]).exists()
+        assert not Article.objects.filter(pk__in=[board.pk for board in boards]).exists()
+        assert not BasketItem.objects.filter(owner=user).exists()
+
+    def test_board_ordered_after_selection_is_kept(self, user):
+        """GIVEN two stale boards whose ids were collected for deletion
+
+        WHEN one of them is ordered before the deletion runs
+
+        THEN only the other one is deleted.
+        """
+        kept, deleted = create_board(user), create_board(user)
+        board_ids = list(get_stale_boards(RETENTION).values_list("pk", flat=True))
+        order_board(user, kept)
+
+        assert delete_boards(board_ids, retention=RETENTION) == 1
+        assert Board.objects.filter(pk=kept.pk).exists()
+        assert not Board.objects.filter(pk=deleted.pk).exists()
+
+    def test_board_touched_in_basket_after_selection_is_kept(self, user):
+        kept, deleted = create_board(user), create_board(user)
+        board_ids = list(get_stale_boards(RETENTION).values_list("pk", flat=True))
+        BasketItem.objects.get(article_id=kept.pk).save()
+
+        assert delete_boards(board_ids, retention=RETENTION) == 1
+        assert BasketItem.objects.filter(article_id=kept.pk).exists()
+        assert not Board.objects.filter(pk=deleted.pk).exists()
+
+    def test_ordered_boards_are_kept_without_retention(self, user):
+        ordered, unordered = create_board(user, age_days=1), create_board(user, age_days=1)
+        order_board(user, ordered)
+
+        assert delete_boards([ordered.pk, unordered.pk]) == 1
+        assert Board.objects.filter(pk=ordered.pk).exists()
+        assert not Board.objects.filter(pk=unordered.pk).exists()
@@ -0,0 +1,120 @@
+import pytest
+
+from django.core.exceptions import ValidationError
+from django.urls import reverse
+
+from src.article.compatibility import CompatibilityIndex, get_compatibility_index
+from src.article.models import ExternalShop, ExternalBoardOptions, OfferedBoardOptions
+from src.article.validators import BoardOptionValidator
+
+
+SHOP_OPTIONS = {
+    "Shop A": {
+        "layers": {"choices": [1, 2, 4]},
+        "color": {"choices": ["green", "red"]},
+        "dimensionX": {"range": {"min": 5, "max": 400}},
+    },
+    "Shop B": {
+        "layers": {"choices": [1, 2, 4, 6, 8]},
+        "color": {"choices": ["green"]},
+        "dimensionX": {"range": {"min": 10, "max": 600}},
+    },
+}
+
+
+@pytest.fixture
+def index() -> CompatibilityIndex:
+    return CompatibilityIndex(SHOP_OPTIONS)
+
+
+class TestCompatibilityIndex:
+    def test_board_shops(self, index):
+        assert index.get_board_shops({"layers": 2, "color": "green", "dimensionX": 100}) == ["Shop A", "Shop B"]
+        assert index.get_board_shops({"layers": 6, "dimensionX": 500}) == ["Shop B"]
+        assert index.get_board_shops({"layers": 6, "color": "red"}) == []
+        assert index.get_board_shops({"goldFingers": "yes"}) == []
+
+    def test_covering_shops(self, index):
+        """GIVEN the latest options of two shops
+
+        WHEN it is checked which shops offer all of a set of internal options
+
+        THEN only shops offering every choice and the whole range are returned.
+        """
+        assert index.get_covering_shops({"layers": {"choices": [1, 2]}}) == ["Shop A", "Shop B"]
+        assert index.get_covering_shops({"layers": {"choices": [2, 6]}}) == ["Shop B"]
+        assert index.get_covering_shops({"color": {"choices": ["red"]}, "layers": {"choices": [6]}}) == []
+        assert index.get_covering_shops({"dimensionX": {"range": {"min": 5, "max": 100}}}) == ["Shop A"]
+        assert index.get_covering_shops({"layers": {"choices": [3]}}) == []
+
+    def test_coverage_report(self, index):
+        report = index.get_coverage_report({"color": {"choices": ["green", "red"]}})
+
+        assert report["covering_shops"] == ["Shop A"]
+        assert report["labels"]["color"]["shops"]["Shop B"] == {"covered": False, "missing": ["red"]}
+
+
+@pytest.mark.django_db
+class TestMultiShopValidation:
+    @pytest.fixture(autouse=True)
+    def shops(self):
+        for name, options in SHOP_OPTIONS.items():
+            shop = ExternalShop.objects.create(name=name, country="Germany")
+            ExternalBoardOptions.objects.create(external_shop=shop, attribute_options=options)
+
+    def test_options_covered_by_one_shop_are_valid(self):
+        BoardOptionValidator().validate({"layers": {"choices": [6, 8]}, "color": {"choices": ["green"]}})
+
+    def test_options_not_covered_by_any_single_shop_are_invalid(self):
+        with pytest.raises(ValidationError):
+            BoardOptionValidator().validate({"layers": {"choices": [8]}, "color": {"choices": ["red"]}})
+
+    def test_coverage_report_is_admin_only(self, client, user, user_factory):
+        OfferedBoardOptions.objects.create(attribute_options={"layers": {"choices": [1, 8]}})
+        url = reverse("shop:shop_coverage")
+
+        client.force_login(user)
+        assert client.get(url).status_code == 403
+
+        admin = user_factory(email="admin@gmail.com", username="admin", is_staff=True)
+        client.force_login(admin)
+        response = client.get(url)
+
+        assert response.status_code == 200
+        assert response.json()["labels"]["layers"]["covering_shops"] == ["Shop B"]
+
+
+@pytest.mark.django_db
+class TestCachedCompatibilityIndex:
+    @pytest.fixture
+    def shops(self):
+        shops = {}
+        for name, options in SHOP_OPTIONS.items():
+            shop = ExternalShop.objects.create(name=name, country="Germany")
+            shops[name] = ExternalBoardOptions.objects.create(external_shop=shop, attribute_options=options)
+        return shops
+
+    def test_index_is_reused_while_options_are_unchanged(self, shops):
+        assert get_compatibility_index() is get_compatibility_index()
+
+    def test_index_follows_options_edited_in_place(self, shops):
+        """GIVEN a cached compatibility index
+
+        WHEN the latest options of a shop are edited without adding a new row
+
+        THEN the next index reflects the edited options.
+        """
+        assert get_compatibility_index().get_board_shops({"layers": 8}) == ["Shop B"]
+
+        options = shops["Shop A"]
+        options.attribute_options = {**SHOP_OPTIONS["Shop A"], "layers": {"choices": [1, 2, 4, 8]}}
+        options.save()
+
+        assert get_compatibility_index().get_board_shops({"layers": 8}) == ["Shop A", "Shop B"]
+
+    def test_index_follows_shop_renames(self, shops):
+        assert "Shop A" in get_compatibility_index().shops
+
+        ExternalShop.objects.filter(name="Shop A").update(name="Shop C")
+
+        assert get_compatibility_index().shops == ["Shop C", "Shop B"]
@@ -0,0 +1,147 @@
+import importlib
+
+import pytest
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.core.exceptions import ValidationError
+from django.urls import reverse
+
+from src.article.hashing import canonical_hash
+from src.article.models import ArticleCategory, AttributeConfiguration, Board, OfferedBoardOptions
+from src.article.validators import AttributeValidator
+
+
+ATTRIBUTES = {"layers": 2, "color": "green", "thickness": 1.6}
+REORDERED_ATTRIBUTES = {"thickness": 1.6, "color": "green", "layers": 2}
+
+
+def create_board(user, attributes: dict) -> Board:
+    return Board.objects.create(
+        owner=user,
+        category=ArticleCategory.objects.get(name="PCB"),
+        gerberFileName="gerber.zip",
+        gerberHash="blablub123",
+        attributes=attributes
+    )
+
+
+class TestCanonicalHash:
+    def test_key_order_does_not_matter(self):
+        assert canonical_hash(ATTRIBUTES) == canonical_hash(REORDERED_ATTRIBUTES)
+
+    def test_different_values_differ(self):
+        assert canonical_hash(ATTRIBUTES) != canonical_hash({**ATTRIBUTES, "layers": 4})
+
+
+@pytest.mark.django_db
+class TestInterning:
+    def test_same_attributes_are_stored_once(self):
+        """GIVEN the same attributes in a different key order
+
+        WHEN they are interned twice
+
+        THEN both calls return the same configuration row.
+        """
+        first = AttributeConfiguration.objects.intern(ATTRIBUTES)
+        second = AttributeConfiguration.objects.intern(REORDERED_ATTRIBUTES)
+
+        assert first.pk == second.pk
+        assert AttributeConfiguration.objects.filter(digest=canonical_hash(ATTRIBUTES)).count() == 1
+
+    def test_boards_share_configurations(self, user):
+        first = create_board(user, ATTRIBUTES)
+        second = create_board(user, REORDERED_ATTRIBUTES)
+        other = create_board(user, {**ATTRIBUTES, "layers": 4})
+
+        assert first.configuration_id == second.configuration_id
+        assert other.configuration_id != first.configuration_id
+        assert first.configuration.attributes == ATTRIBUTES
+
+    def test_changed_attributes_get_new_configuration(self, user):
+        board = create_board(user, ATTRIBUTES)
+        old_configuration_id = board.configuration_id
+
+        board.attributes = {**ATTRIBUTES, "color": "red"}
+        board.save()
+
+        assert board.configuration_id != old_configuration_id
+        assert AttributeConfiguration.objects.filter(pk=old_configuration_id).exists()
+
+    def test_stored_configurations_cannot_be_changed(self):
+        configuration = AttributeConfiguration.objects.intern(ATTRIBUTES)
+        configuration.attributes = {**ATTRIBUTES, "layers": 4}
+
+        with pytest.raises(ValidationError):
+            configuration.save()
+        assert AttributeConfiguration.objects.get(pk=configuration.pk).attributes == ATTRIBUTES
+
+    def test_configurations_are_read_only_in_admin(self, client, user_factory):
+        """GIVEN a stored configuration and a superuser
+
+        WHEN the superuser opens it in the admin and submits changed attributes
+
+        THEN it can be viewed, but neither changed nor added.
+        """
+        configuration = AttributeConfiguration.objects.intern(ATTRIBUTES)
+        client.force_login(user_factory(email="admin@gmail.com", username="admin", is_staff=True, is_superuser=True))
+        change_url = reverse("admin:article_attributeconfiguration_change", args=[configuration.pk])
+
+        assert client.get(change_url).status_code == 200
+        client.post(change_url, data={"digest": configuration.digest, "attributes": '{"layers": 4}'})
+
+        assert AttributeConfiguration.objects.get(pk=configuration.pk).attributes == ATTRIBUTES
+        assert client.get(reverse("admin:article_attributeconfiguration_add")).status_code == 403
+
+    def test_migration_links_existing_boards(self, user):
+        """GIVEN boards without configuration, as before the migration
+
+        WHEN the data migration runs
+
+        THEN every board references the configuration of its attributes.
+        The migration gets the historical models, as during `manage.py migrate`.
+        """
+        boards = [create_board(user, ATTRIBUTES), create_board(user, REORDERED_ATTRIBUTES)]
+        Board.objects.filter(pk__in=[board.pk for board in boards]).update(configuration=None)
+
+        migration = importlib.import_module("article.migrations.0014_attributeconfiguration")
+        state = MigrationExecutor(connection).loader.project_state(("article", "0014_attributeconfiguration"))
+        migration.intern_board_attributes(state.apps, None)
+
+        configuration_ids = set(
+            Board.objects.filter(pk__in=[board.pk for board in boards]).values_list("configuration_id", flat=True)
+        )
+        assert configuration_ids == {AttributeConfiguration.objects.get(digest=canonical_hash(ATTRIBUTES)).pk}
+
+
+@pytest.mark.django_db
+class TestValidatedDigestCache:
+    @pytest.fixture(autouse=True)
+    def offered_options(self):
+        OfferedBoardOptions.objects.create(attribute_options={
+            "layers": {"choices": [1, 2, 4]},
+            "color": {"choices": ["green", "red"]},
+            "thickness": {"range": {"min": 0.4, "max": 2.0}},
+        })
+
+    def test_valid_configurations_are_remembered(self):
+        AttributeValidator().validate(ATTRIBUTES)
+
+        assert AttributeValidator()._is_known_valid(canonical_hash(REORDERED_ATTRIBUTES))
+
+    def test_invalid_configurations_are_not_remembered(self):
+        invalid = {**ATTRIBUTES, "layers": 3}
+
+        with pytest.raises(ValidationError):
+            AttributeValidator().validate(invalid)
+
+        assert not AttributeValidator()._is_known_valid(canonical_hash(invalid))
+
+    def test_new_offered_options_reset_the_cache(self):
+        AttributeValidator().validate(ATTRIBUTES)
+        OfferedBoardOptions.objects.create(attribute_options={"layers": {"choices": [1]}})
+
+        validator = AttributeValidator()
+        assert not validator._is_known_valid(canonical_hash(ATTRIBUTES))
+        with pytest.raises(ValidationError):
+            validator.validate(ATTRIBUTES)
@@ -0,0 +1,28 @@
+import pytest
+
+from src.article.models import ExternalShop, ExternalBoardOptions
+from src.article.option_management import store_external_options
+
+
+@pytest.mark.django_db
+class TestStoreExternalOptions:
+    def test_only_changed_options_are_stored(self):
+        """GIVEN an external shop with stored board options
+
+        WHEN the same options are stored again, with keys in another order,
+        and then different options are stored
+
+        THEN only the first and the last options are written.
+        """
+        shop = ExternalShop.objects.create(name="JLCPCB", country="China")
+
+        first, created = store_external_options(shop, {"layers": {"choices": [1, 2]}, "color": {"choices": ["green"]}})
+        assert created
+
+        latest, created = store_external_options(shop, {"color": {"choices": ["green"]}, "layers": {"choices": [1, 2]}})
+        assert not created
+        assert latest.pk == first.pk
+
+        _, created = store_external_options(shop, {"layers": {"choices": [1, 2, 4]}})
+        assert created
+        assert ExternalBoardOptions.objects.filter(external_shop=shop).count() == 2
@@ -8,4 +8,5 @@ urlpatterns = [
     path('user/boards/', views.BoardList.as_view(), name='board_list'),
     path('user/boards/<int:pk>/', views.BoardDetails.as_view(), name='board_details'),
     path('available-board-options/', views.BoardOptions.as_view(), name='board_options'),
+    path('shop-coverage/', views.ShopCoverage.as_view(), name='shop_coverage'),
 ]
@@ -1,20 +1,48 @@
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 from django.core.exceptions import ValidationError
 from django.apps import apps
 
+from .hashing import canonical_hash
+from .compatibility import get_compatibility_index
+
 
 class AttributeValidator:
     """Validates a specific attribute configuration against the
     currently offered board options.
+
+    Configurations that passed validation are remembered by their digest
+    (see AttributeConfiguration), so validating a known configuration again
+    against the same offered options is a set lookup.
     """
+    MAX_REMEMBERED_CONFIGURATIONS = 10000
+
+    # Shared across instances; reset whenever the offered options change.
+    _validated_options_id: Optional[int] = None
+    _validated_digests: set = set()
+
     def __init__(self):
-        self.offered_options: dict = self._get_current_options()
+        self.offered_options_id, self.offered_options = self._get_current_options()
 
     @staticmethod
-    def _get_current_options() -> dict:
-        """Returns the most up-to-date version of the internally offered board options."""
+    def _get_current_options() -> Tuple[int, dict]:
+        """Returns id and content of the most up-to-date version of the internally offered board options."""
         OfferedBoardOptions = apps.get_model('article', 'OfferedBoardOptions')
-        return OfferedBoardOptions.objects.latest("created").attribute_options
+        latest = OfferedBoardOptions.objects.only("id", "attribute_options").latest("created")
+        return latest.id, latest.attribute_options
+
+    def _is_known_valid(self, digest: str) -> bool:
+        cls = AttributeValidator
+        return cls._validated_options_id == self.offered_options_id and digest in cls._validated_digests
+
+    def _remember_valid(self, digest: str) -> None:
+        cls = AttributeValidator
+        if (
+                cls._validated_options_id != self.offered_options_id
+                or len(cls._validated_digests) >= self.MAX_REMEMBERED_CONFIGURATIONS
+        ):
+            cls._validated_options_id = self.offered_options_id
+            cls._validated_digests = set()
+        cls._validated_digests.add(digest)
 
     @staticmethod
     def _validate_choice(value: Union[str, int, float], offered_values: list, label: str) -> None:
@@ -54,22 +82,30 @@ No choices or range attribute is present.""")
 
         Returns None otherwise.
         """
+        digest = canonical_hash(attributes)
+        if self._is_known_valid(digest):
+            return None
+
         for label, value in attributes.items():
             self._validate_attribute(label, value)
 
+        self._remember_valid(digest)
         return None
 
 
 class BoardOptionValidator:
     """Validates a set of internally offered board options
     against a set of externally available options.
+
+    Without a <shop>, the options are valid if at least one external
+    shop offers all of them (see article.compatibility).
     """
-    def __init__(self, shop: Optional[str] = None):
-        if shop is None:
-            ExternalShop = apps.get_model('article', 'ExternalShop')
-            shop = ExternalShop.objects.get(name="Example PCB Shop")
+    def __init__(self, shop=None):
         self.shop = shop
-        self.external_options = self._get_external_options()
+        if shop is None:
+            self.index = get_compatibility_index()
+        else:
+            self.external_options = self._get_external_options()
 
     def _get_external_options(self):
         """Returns the most up-to-date version of the board options
@@ -135,6 +171,14 @@ class BoardOptionValidator:
 
         Returns None otherwise.
         """
+        if self.shop is None:
+            if not self.index.get_covering_shops(options):
+                raise ValidationError(
+                    "No external shop offers all of the internal board options.",
+                    code="not_covered"
+                )
+            return None
+
         for label, values in options.items():
             self._validate_option(label, values)
 
@@ -2,17 +2,27 @@ from django.http import JsonResponse, Http404
 from django.core.validators import ValidationError
 
 from rest_framework import generics
+from rest_framework.views import APIView
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from .permissions import IsBoardOwner
 
+from core.idempotency import IdempotentCreateMixin
+from core.fieldsets import SparseFieldsetMixin
+
 from .models import Board, ArticleCategory, OfferedBoardOptions
 from .serializers import BoardSerializer, OfferedBoardOptionsSerializer
 from .validators import BoardOptionValidator
+from .compatibility import get_compatibility_index
 
 
-class BoardList(generics.ListCreateAPIView):
+class BoardList(IdempotentCreateMixin, SparseFieldsetMixin, generics.ListCreateAPIView):
     """Provides functionality to list all PCBs the calling user has
     created (GET) or to create a new PCB (POST).
+
+    GET requests may restrict the returned fields, e.g. ?fields=id,created.
+
+    POST requests may carry an Idempotency-Key header, so that retries
+    do not create the same board twice.
     """
     serializer_class = BoardSerializer
 
@@ -75,3 +85,18 @@ class BoardOptions(generics.RetrieveAPIView):
                 data={"detail": "We are currently maintaining our offer. Please try again later."}
             )
         return JsonResponse(status=200, data=board_options)
+
+
+class ShopCoverage(APIView):
+    """GET: Reports which external shops cover the currently offered
+    board options, in total and per option label.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        offered_options = OfferedBoardOptions.objects.first()
+        if offered_options is None:
+            return JsonResponse(status=404, data={"Error": "There are no offered board options."})
+
+        report = get_compatibility_index().get_coverage_report(offered_options.attribute_options)
+        return JsonResponse(report)
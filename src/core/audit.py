@@ -0,0 +1,41 @@
+import json
+from typing import Any, Dict, List, Optional
+
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+
+from auditlog.models import LogEntry
+
+
+def log_bulk_changes(
+        model,
+        changes: Dict[Any, dict],
+        action: int = LogEntry.Action.UPDATE,
+        actor: Optional[User] = None
+) -> List[LogEntry]:
+    """Writes one audit log entry per object in <changes> with a single INSERT.
+
+    <changes> maps primary keys to diffs in auditlog's format ({field: [old, new]}).
+    Use this for queryset updates, bulk_create and raw deletes, which bypass
+    the signal handlers auditlog relies on.
+    """
+    if not changes:
+        return []
+
+    if actor is not None and not actor.is_authenticated:
+        actor = None
+
+    content_type = ContentType.objects.get_for_model(model)
+    entries = [
+        LogEntry(
+            content_type=content_type,
+            object_pk=str(pk),
+            object_id=pk if isinstance(pk, int) else None,
+            object_repr=f"{model.__name__} {pk}",
+            action=action,
+            changes=json.dumps(diff, default=str),
+            actor=actor
+        )
+        for pk, diff in changes.items()
+    ]
+    return LogEntry.objects.bulk_create(entries)
@@ -0,0 +1,68 @@
+import time
+import logging
+from typing import Callable, Iterator, Tuple
+
+from django.db.models import Max, Min, QuerySet
+
+
+logger = logging.getLogger(__name__)
+
+
+def raw_delete(queryset: QuerySet) -> int:
+    """Deletes the rows of <queryset> with a single DELETE statement and returns their number.
+
+    QuerySet.delete() first loads every row to collect cascades and to send
+    delete signals per object. Bulk jobs that delete many rows and write
+    their audit log entries themselves (see core.audit) avoid that cost here.
+    The caller must delete dependent rows first, as nothing cascades.
+
+    This wraps QuerySet._raw_delete(), Django's private API for exactly this,
+    so that it is only used in one place.
+    """
+    return queryset._raw_delete(queryset.db)
+
+
+def iter_pk_ranges(queryset: QuerySet, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    """Yields half-open primary key ranges [start, end) of width <chunk_size>
+    that together cover all rows of <queryset>.
+
+    Each range selects at most <chunk_size> rows, however sparse the table is.
+    """
+    bounds = queryset.aggregate(first=Min("pk"), last=Max("pk"))
+    if bounds["first"] is None:
+        return
+
+    for start in range(bounds["first"], bounds["last"] + 1, chunk_size):
+        yield start, start + chunk_size
+
+
+def process_in_chunks(
+        queryset: QuerySet,
+        process_chunk: Callable[[list], int],
+        chunk_size: int = 500,
+        sleep: float = 0.0,
+        report: Callable[[str], None] = logger.info
+) -> int:
+    """Calls <process_chunk> with the primary keys of <queryset>, one primary key
+    range at a time, and sleeps <sleep> seconds in between, so that no chunk
+    holds its locks for long and other queries get their turn.
+
+    <process_chunk> returns the number of processed rows. Progress is passed
+    to <report> after every non-empty chunk. Returns the total number of processed rows.
+    """
+    total = 0
+    started = time.monotonic()
+
+    for start, end in iter_pk_ranges(queryset, chunk_size):
+        pks = list(queryset.filter(pk__gte=start, pk__lt=end).values_list("pk", flat=True))
+        if not pks:
+            continue
+
+        total += process_chunk(pks)
+        elapsed = time.monotonic() - started
+        report(f"pk {start}-{end - 1}: {total} rows processed in {elapsed:.1f}s ({total / elapsed:.0f} rows/s)")
+
+        if sleep:
+            time.sleep(sleep)
+
+    return total
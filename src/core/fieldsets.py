@@ -0,0 +1,89 @@
+from typing import Optional, Set
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import QuerySet
+
+
+FIELDS_PARAM = "fields"
+
+
+def get_requested_fields(request) -> Optional[Set[str]]:
+    """Returns the field names given in the fields query param of a GET request,
+    e.g. ?fields=id,created, or None if all fields are requested.
+    """
+    if request is None or request.method != "GET":
+        return None
+
+    param = request.query_params.get(FIELDS_PARAM)
+    if not param:
+        return None
+    return {name.strip() for name in param.split(",") if name.strip()}
+
+
+def get_required_columns(queryset: QuerySet, serializer_class, field_names: Set[str]) -> Optional[Set[str]]:
+    """Returns the names of the model fields that have to be loaded to serialize
+    <field_names>, or None if that cannot be determined for one of them,
+    e.g. for serializer method fields.
+    """
+    serializer = serializer_class()
+    model = queryset.model
+
+    columns = {model._meta.pk.name}
+
+    # Relations that are joined must not be deferred
+    if isinstance(queryset.query.select_related, dict):
+        columns.update(queryset.query.select_related)
+
+    for name in field_names & set(serializer.fields):
+        attribute = serializer.fields[name].source.split(".")[0]
+        if attribute in queryset.query.annotations:
+            continue
+        try:
+            model_field = model._meta.get_field(attribute)
+        except FieldDoesNotExist:
+            return None
+        if not model_field.concrete:
+            return None
+        columns.add(attribute)
+
+    return columns
+
+
+class SparseFieldsetSerializerMixin:
+    """Serializer mixin that only outputs the fields given in the
+    fields query param of GET requests. Unknown field names are ignored.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        requested = get_requested_fields(self.context.get("request"))
+        if requested:
+            for name in set(self.fields) - requested:
+                self.fields.pop(name)
+
+
+class SparseFieldsetMixin:
+    """View mixin that restricts the loaded columns to those needed for the
+    fields in the fields query param of GET requests, so that unrequested
+    columns, e.g. large JSON fields, are never fetched.
+
+    Use together with a serializer that inherits SparseFieldsetSerializerMixin.
+    """
+    def filter_queryset(self, queryset: QuerySet) -> QuerySet:
+        queryset = super().filter_queryset(queryset)
+
+        requested = get_requested_fields(self.request)
+        if not requested:
+            return queryset
+
+        columns = get_required_columns(queryset, self.get_serializer_class(), requested)
+        if columns is None:
+            return queryset
+
+        # Cursor pagination reads its ordering fields from the last object of a page
+        ordering = getattr(self.paginator, "ordering", None) or []
+        if isinstance(ordering, str):
+            ordering = [ordering]
+        columns.update(name.lstrip("-") for name in ordering)
+
+        return queryset.only(*columns)
@@ -0,0 +1,169 @@
+import json
+import hashlib
+import time
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+from django.core.cache import cache as default_cache
+from rest_framework import status
+from rest_framework.response import Response
+
+
+IDEMPOTENCY_HEADER = "HTTP_IDEMPOTENCY_KEY"
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyKeyInFlight(Exception):
+    """Raised if a request with the same key did not finish in time."""
+
+
+class IdempotencyKeyReused(Exception):
+    """Raised if a key is sent again together with a different request body."""
+
+
+class StoredResponse(NamedTuple):
+    fingerprint: str
+    status_code: int
+    data: object
+
+
+class IdempotencyStore:
+    """Expiring map from idempotency keys to finished responses, kept in the
+    cache shared by all worker processes, so that a retry is answered by
+    whichever process receives it.
+
+    While a request is being processed, its key is marked as in flight with
+    cache.add(), which only one process can win. A concurrent duplicate polls
+    until the first request has finished instead of redoing its work. The mark
+    expires after <lock_timeout> seconds, in case its process dies.
+    """
+    def __init__(
+            self,
+            cache=None,
+            ttl: float = 24 * 60 * 60,
+            wait_timeout: float = 30,
+            lock_timeout: float = 5 * 60,
+            poll_interval: float = 0.1
+    ):
+        self.cache = cache or default_cache
+        self.ttl = ttl
+        self.wait_timeout = wait_timeout
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+
+    @staticmethod
+    def _cache_key(key: str, kind: str) -> str:
+        # Client keys may contain characters and lengths that cache backends reject
+        return f"idempotency:{kind}:{hashlib.sha256(key.encode()).hexdigest()}"
+
+    def acquire(self, key: str, fingerprint: str) -> Optional[StoredResponse]:
+        """Returns the stored response for <key>, if there is one.
+
+        Otherwise, the key is marked as in flight and None is returned; the caller
+        then has to either save() a response or release() the key.
+        """
+        deadline = time.monotonic() + self.wait_timeout
+
+        while True:
+            stored = self.cache.get(self._cache_key(key, "response"))
+            if stored is not None:
+                stored = StoredResponse(*stored)
+                if stored.fingerprint != fingerprint:
+                    raise IdempotencyKeyReused(key)
+                return stored
+
+            if self.cache.add(self._cache_key(key, "lock"), fingerprint, timeout=self.lock_timeout):
+                # The first request may have finished between the get() and the add()
+                stored = self.cache.get(self._cache_key(key, "response"))
+                if stored is None:
+                    return None
+                self.release(key)
+                continue
+
+            if time.monotonic() >= deadline:
+                raise IdempotencyKeyInFlight(key)
+            time.sleep(self.poll_interval)
+
+    def save(self, key: str, fingerprint: str, status_code: int, data: object) -> None:
+        """Stores the finished response for <key>, which ends waiting duplicates."""
+        self.cache.set(self._cache_key(key, "response"), (fingerprint, status_code, data), timeout=self.ttl)
+        self.release(key)
+
+    def release(self, key: str) -> None:
+        """Gives up an in-flight key without storing a response,
+        so that the next request with that key is processed again.
+        """
+        self.cache.delete(self._cache_key(key, "lock"))
+
+
+def get_default_store() -> IdempotencyStore:
+    """Returns a store in the default cache, configured through the IDEMPOTENCY_* settings."""
+    return IdempotencyStore(
+        ttl=settings.IDEMPOTENCY_KEY_TTL,
+        wait_timeout=settings.IDEMPOTENCY_WAIT_TIMEOUT,
+        lock_timeout=settings.IDEMPOTENCY_LOCK_TIMEOUT,
+    )
+
+
+def get_request_fingerprint(request) -> str:
+    """Returns a hash of the request data, used to detect reuse of a key for a different request."""
+    body = json.dumps(request.data, sort_keys=True, default=str)
+    return hashlib.sha256(body.encode()).hexdigest()
+
+
+class IdempotentCreateMixin:
+    """Mixin for create views that honours the Idempotency-Key header.
+
+    A POST that repeats the key of an earlier POST by the same user receives
+    the stored response of the earlier request and does not create anything.
+    """
+    def get_idempotency_store(self) -> IdempotencyStore:
+        return get_default_store()
+
+    def create(self, request, *args, **kwargs):
+        key = request.META.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return super().create(request, *args, **kwargs)
+
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={"detail": f"Idempotency-Key must not be longer than {MAX_KEY_LENGTH} characters."}
+            )
+
+        store = self.get_idempotency_store()
+        store_key = f"{request.user.pk}:{self.__class__.__name__}:{key}"
+        fingerprint = get_request_fingerprint(request)
+
+        try:
+            stored = store.acquire(store_key, fingerprint)
+        except IdempotencyKeyReused:
+            return Response(
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                data={"detail": "This Idempotency-Key was already used for a different request."}
+            )
+        except IdempotencyKeyInFlight:
+            return Response(
+                status=status.HTTP_409_CONFLICT,
+                data={"detail": "A request with this Idempotency-Key is still being processed."}
+            )
+
+        if stored is not None:
+            return Response(
+                status=stored.status_code,
+                data=stored.data,
+                headers={"Idempotent-Replayed": "true"}
+            )
+
+        try:
+            response = super().create(request, *args, **kwargs)
+        except Exception:
+            store.release(store_key)
+            raise
+
+        # Errors are not replayed, so that a corrected retry with the same key is processed
+        if response.status_code < 400:
+            store.save(store_key, fingerprint, response.status_code, response.data)
+        else:
+            store.release(store_key)
+        return response
@@ -0,0 +1,27 @@
+import csv
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from user.zip_codes import build_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the zip code index from a GeoNames postal code export "
+        "(tab-separated: country code, postal code, place name, ...)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("source", help="Path to the GeoNames export, e.g. DE.txt")
+        parser.add_argument("--country", default="DE")
+        parser.add_argument("--output", default=str(settings.ZIP_CODE_INDEX_PATH))
+
+    def handle(self, *args, **options):
+        with open(options["source"], newline="", encoding="utf-8") as f:
+            rows = csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE)
+            pairs = [(row[1], row[2]) for row in rows if len(row) > 2 and row[0] == options["country"]]
+
+        settings.ZIP_CODE_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        num_pairs = build_index(pairs, options["output"])
+        self.stdout.write(f"Indexed {num_pairs} zip code/city pairs in {options['output']}")
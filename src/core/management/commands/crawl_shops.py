@@ -0,0 +1,51 @@
+from functools import partial
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from article.models import ExternalShop
+from scraper.registry import CRAWL_MODES, get_crawlable_shops
+from scraper.runner import crawl, run_crawls
+from scraper.snapshots import SnapshotStore
+
+
+class Command(BaseCommand):
+    help = "Crawl the board options of all external shops that have a crawler, concurrently."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--shop", action="append", help="Only crawl this shop (can be repeated)")
+        parser.add_argument("--max-per-host", type=int, default=1, help="Concurrent crawls per host")
+        parser.add_argument("--min-interval", type=float, default=1.0, help="Seconds between crawls of one host")
+        parser.add_argument("--mode", choices=CRAWL_MODES, default="dom", help="Scrape the page or its JSON data")
+        parser.add_argument("--no-snapshots", action="store_true", help="Parse every page, even if it did not change")
+
+    def handle(self, *args, **options):
+        shop_names = ExternalShop.objects.values_list("name", flat=True)
+        if options["shop"]:
+            shop_names = shop_names.filter(name__in=options["shop"])
+
+        crawlers = get_crawlable_shops(shop_names, options["mode"])
+        if not crawlers:
+            raise CommandError("None of the shops has a crawler.")
+
+        store = None
+        if not options["no_snapshots"]:
+            store = SnapshotStore(settings.SCRAPER_SNAPSHOT_DIR, keep=settings.SCRAPER_SNAPSHOTS_KEPT)
+
+        results = run_crawls(
+            crawlers,
+            max_per_host=options["max_per_host"],
+            min_interval=options["min_interval"],
+            crawl_function=partial(crawl, store=store, mode=options["mode"])
+        )
+        for result in results:
+            if not result.ok:
+                status = f"failed ({result.error})"
+            elif result.unchanged:
+                status = "unchanged"
+            else:
+                status = f"{len(result.options)} options"
+            self.stdout.write(f"{result.shop}: {status}, waited {result.waited:.1f}s, crawled in {result.duration:.1f}s")
+
+        if not all(result.ok for result in results):
+            raise CommandError("Some shops could not be crawled.")
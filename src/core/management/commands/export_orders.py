@@ -0,0 +1,32 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.streaming import encode_rows, CONTENT_TYPES
+from order.export import EXPORT_HEADER, iter_export_rows, parse_created_bound
+
+
+class Command(BaseCommand):
+    help = "Stream all order items with order, shipping and address data as CSV or NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--type", choices=list(CONTENT_TYPES), default="csv")
+        parser.add_argument("--created-after", help="ISO date or datetime (inclusive)")
+        parser.add_argument("--created-before", help="ISO date or datetime (exclusive)")
+        parser.add_argument("--output", help="File to write to. Defaults to stdout.")
+
+    def handle(self, *args, **options):
+        try:
+            created_after = parse_created_bound(options["created_after"])
+            created_before = parse_created_bound(options["created_before"], end_of_day=True)
+        except ValueError as e:
+            raise CommandError(e)
+
+        rows = iter_export_rows(created_after, created_before)
+        chunks = encode_rows(options["type"], EXPORT_HEADER, rows)
+
+        if options["output"]:
+            with open(options["output"], "w", newline="") as f:
+                f.writelines(chunks)
+        else:
+            sys.stdout.writelines(chunks)
@@ -0,0 +1,27 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from user.models import User
+from user.data_export import export_personal_data
+
+
+class Command(BaseCommand):
+    help = "Stream all personal data of a user (account, boards, orders, addresses, audit history) as a zip archive."
+
+    def add_arguments(self, parser):
+        parser.add_argument("email", help="Email address of the user")
+        parser.add_argument("--output", help="File to write to. Defaults to stdout.")
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(email=options["email"]).first()
+        if user is None:
+            raise CommandError(f"There is no user with email '{options['email']}'.")
+
+        chunks = export_personal_data(user)
+
+        if options["output"]:
+            with open(options["output"], "wb") as f:
+                f.writelines(chunks)
+        else:
+            sys.stdout.buffer.writelines(chunks)
@@ -0,0 +1,68 @@
+from functools import partial
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from article.models import ExternalShop
+from article.option_management import store_external_options
+from scraper.normalization import OPTION_MAPPINGS, normalize_options
+from scraper.registry import CRAWL_MODES, get_crawlable_shops
+from scraper.runner import crawl, run_crawls
+from scraper.snapshots import SnapshotStore, save_snapshot
+
+
+class Command(BaseCommand):
+    help = "Crawl the external shops and store their board options, if they changed since the last ingestion."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--shop", action="append", help="Only ingest this shop (can be repeated)")
+        parser.add_argument("--mode", choices=CRAWL_MODES, default="dom", help="Scrape the page or its JSON data")
+        parser.add_argument("--no-snapshots", action="store_true", help="Parse every page, even if it did not change")
+
+    def handle(self, *args, **options):
+        shops = {shop.name: shop for shop in ExternalShop.objects.all()}
+        if options["shop"]:
+            shops = {name: shop for name, shop in shops.items() if name in options["shop"]}
+
+        crawlers = {
+            name: crawler_class
+            for name, crawler_class in get_crawlable_shops(shops, options["mode"]).items()
+            if name in OPTION_MAPPINGS
+        }
+        if not crawlers:
+            raise CommandError("None of the shops has a crawler and an option mapping.")
+
+        # The snapshots have their own directory, since pages stored by crawl_shops were never ingested
+        store = None
+        if not options["no_snapshots"]:
+            store = SnapshotStore(settings.SCRAPER_INGEST_SNAPSHOT_DIR, keep=settings.SCRAPER_SNAPSHOTS_KEPT)
+
+        # Crawled pages are only stored as snapshots once their options were ingested,
+        # so that a page whose ingestion failed is not skipped as unchanged next time
+        unsaved = {}
+        results = run_crawls(crawlers, crawl_function=partial(crawl, store=store, unsaved=unsaved, mode=options["mode"]))
+        for result in results:
+            if not result.ok:
+                self.stdout.write(f"{result.shop}: failed ({result.error})")
+                continue
+            if result.unchanged:
+                self.stdout.write(f"{result.shop}: page unchanged")
+                continue
+
+            normalized = normalize_options(result.options, OPTION_MAPPINGS[result.shop])
+            if not normalized.attribute_options:
+                self.stdout.write(f"{result.shop}: no known options found, nothing stored")
+                continue
+
+            _, created = store_external_options(shops[result.shop], normalized.attribute_options)
+            if result.shop in unsaved:
+                save_snapshot(result.shop, unsaved[result.shop], store, options["mode"])
+            status = "stored new options" if created else "options unchanged"
+            self.stdout.write(f"{result.shop}: {status} ({len(normalized.attribute_options)} options)")
+            if normalized.unmapped_labels:
+                self.stdout.write(f"  unmapped labels: {', '.join(normalized.unmapped_labels)}")
+            for label, value in normalized.invalid_values:
+                self.stdout.write(f"  invalid value for {label}: '{value}'")
+
+        if not all(result.ok for result in results):
+            raise CommandError("Some shops could not be ingested.")
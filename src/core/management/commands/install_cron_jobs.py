@@ -0,0 +1,14 @@
+from crontab import CronTab
+from django.core.management.base import BaseCommand
+
+from core.scheduling import install_cron_jobs
+
+
+class Command(BaseCommand):
+    help = "Install the scheduled jobs from settings.CRON_JOBS into the current user's crontab."
+
+    def handle(self, *args, **options):
+        jobs = install_cron_jobs(CronTab(user=True))
+        for job in jobs:
+            self.stdout.write(str(job))
+        self.stdout.write(f"Installed {len(jobs)} cron jobs")
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from user.account_deletion import get_pending_jobs, run_deletion_job
+
+
+class Command(BaseCommand):
+    help = "Delete the accounts of users who requested their deletion, in small chunks per table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500, help="Width of each primary key range")
+        parser.add_argument("--sleep", type=float, default=0.2, help="Seconds to pause between chunks")
+
+    def handle(self, *args, **options):
+        for job in get_pending_jobs():
+            job = run_deletion_job(job, chunk_size=options["chunk_size"], sleep=options["sleep"])
+            if job is not None:
+                self.stdout.write(f"User {job.user_pk}: {job.status} {job.progress}")
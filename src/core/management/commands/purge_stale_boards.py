@@ -0,0 +1,34 @@
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from article.board_management import get_stale_boards, delete_boards
+from core.chunked_deletion import process_in_chunks
+
+
+class Command(BaseCommand):
+    help = "Delete boards that were never ordered and are older than the retention window, in small chunks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--retention-days", type=int, default=settings.BOARD_RETENTION_DAYS)
+        parser.add_argument("--chunk-size", type=int, default=500, help="Width of each primary key range")
+        parser.add_argument("--sleep", type=float, default=0.5, help="Seconds to pause between chunks")
+        parser.add_argument("--dry-run", action="store_true", help="Only count the stale boards")
+
+    def handle(self, *args, **options):
+        retention = datetime.timedelta(days=options["retention_days"])
+        stale_boards = get_stale_boards(retention)
+
+        if options["dry_run"]:
+            self.stdout.write(f"{stale_boards.count()} stale boards would be deleted")
+            return
+
+        deleted = process_in_chunks(
+            stale_boards,
+            lambda board_ids: delete_boards(board_ids, retention=retention),
+            chunk_size=options["chunk_size"],
+            sleep=options["sleep"],
+            report=self.stdout.write
+        )
+        self.stdout.write(f"Done. Deleted {deleted} stale boards")
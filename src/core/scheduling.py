@@ -0,0 +1,38 @@
+import os
+import re
+import sys
+
+from django.conf import settings
+
+
+# Comment prefix that marks cron entries managed by this project.
+CRON_COMMENT_PREFIX = "pcb_shop:"
+
+
+def build_cron_command(command: str) -> str:
+    """Returns the shell command that runs a management command from cron."""
+    settings_module = os.environ.get("DJANGO_SETTINGS_MODULE", "pcb_shop.settings.dev")
+    log_file = settings.CRON_LOG_DIR / f"{command}.log"
+    return (
+        f"cd {settings.BASE_DIR} && DJANGO_SETTINGS_MODULE={settings_module} "
+        f"{sys.executable} manage.py {command} >> {log_file} 2>&1"
+    )
+
+
+def install_cron_jobs(cron) -> list:
+    """Replaces all project entries in the given python-crontab CronTab
+    by the jobs in settings.CRON_JOBS and writes it.
+
+    Returns the installed jobs.
+    """
+    cron.remove_all(comment=re.compile(f"^{re.escape(CRON_COMMENT_PREFIX)}"))
+    settings.CRON_LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+    jobs = []
+    for schedule, command in settings.CRON_JOBS:
+        job = cron.new(command=build_cron_command(command), comment=f"{CRON_COMMENT_PREFIX}{command}")
+        job.setall(schedule)
+        jobs.append(job)
+
+    cron.write()
+    return jobs
@@ -0,0 +1,121 @@
+import csv
+import time
+import zipfile
+from typing import Iterable, Iterator, List, Sequence, Tuple, Union
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+# Rows are joined into chunks of roughly this size before they are
+# handed to the response, so that we don't flush once per row.
+CHUNK_SIZE = 64 * 1024
+
+
+class Echo:
+    """Pseudo-buffer that returns the written value instead of storing it."""
+    def write(self, value: str) -> str:
+        return value
+
+
+def csv_lines(header: Sequence[str], rows: Iterable[Sequence]) -> Iterator[str]:
+    """Yields the header and all rows as CSV lines."""
+    writer = csv.writer(Echo())
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def ndjson_lines(header: Sequence[str], rows: Iterable[Sequence]) -> Iterator[str]:
+    """Yields one JSON object per row, keyed by the header."""
+    encoder = DjangoJSONEncoder()
+    for row in rows:
+        yield encoder.encode(dict(zip(header, row))) + "\n"
+
+
+def chunked(lines: Iterable[str], chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Joins consecutive lines into chunks of at least <chunk_size> characters."""
+    buffer = []
+    buffered = 0
+    for line in lines:
+        buffer.append(line)
+        buffered += len(line)
+        if buffered >= chunk_size:
+            yield "".join(buffer)
+            buffer = []
+            buffered = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+LINE_WRITERS = {
+    "csv": csv_lines,
+    "ndjson": ndjson_lines,
+}
+
+CONTENT_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def encode_rows(file_type: str, header: Sequence[str], rows: Iterable[Sequence]) -> Iterator[str]:
+    """Returns a chunked CSV or NDJSON encoding of <rows>."""
+    return chunked(LINE_WRITERS[file_type](header, rows))
+
+
+class ZipBuffer:
+    """Write-only, unseekable file object for zipfile.ZipFile.
+
+    It keeps track of the position but only holds the bytes written since
+    the last call to pop(). As it cannot seek, ZipFile writes sizes and
+    checksums in data descriptors after each entry instead of going back.
+    """
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.buffered = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        self.buffered += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def pop(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        self.buffered = 0
+        return data
+
+
+def zip_stream(
+        entries: Iterable[Tuple[str, Iterable[Union[str, bytes]]]],
+        chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Yields a deflated zip archive of <entries>, given as (file name, content chunks) pairs.
+
+    The archive is built while the entries' content is consumed, so neither the
+    archive nor a complete entry is ever held in memory. Text chunks are
+    encoded as UTF-8.
+    """
+    buffer = ZipBuffer()
+    date_time = time.localtime()[:6]
+
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, chunks in entries:
+            info = zipfile.ZipInfo(name, date_time=date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with archive.open(info, mode="w", force_zip64=True) as entry:
+                for chunk in chunks:
+                    entry.write(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+                    if buffer.buffered >= chunk_size:
+                        yield buffer.pop()
+            yield buffer.pop()
+
+    yield buffer.pop()
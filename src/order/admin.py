@@ -1,8 +1,38 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.core.exceptions import ValidationError
 
 from order.models import Order, OrderState, PaymentState, Article2Order, ShippingMethod, ShippingProvider
+from order.state_transitions import ORDER_STATE_TRANSITIONS, transition_orders
+
+
+def make_transition_action(target_state_name: str):
+    """Returns an admin action that moves the selected orders to the given state."""
+    def transition_action(modeladmin, request, queryset):
+        order_ids = list(queryset.values_list("id", flat=True))
+        try:
+            updated = transition_orders(order_ids, target_state_name, actor=request.user)
+        except ValidationError as e:
+            modeladmin.message_user(request, " ".join(e.messages), level=messages.ERROR)
+            return
+        modeladmin.message_user(request, f"{updated} orders marked as {target_state_name}.")
+
+    transition_action.__name__ = f"mark_{target_state_name}"
+    transition_action.short_description = f"Mark selected orders as {target_state_name}"
+    return transition_action
+
+
+@admin.register(Order)
+class OrderAdmin(admin.ModelAdmin):
+    list_display = ["id", "user", "order_state", "payment_state", "created"]
+    list_filter = ["order_state", "payment_state"]
+    list_select_related = ["user", "order_state", "payment_state"]
+    # One action per target state, as several states may lead to the same one
+    actions = [
+        make_transition_action(target)
+        for target in sorted({target for targets in ORDER_STATE_TRANSITIONS.values() for target in targets})
+    ]
+
 
-admin.site.register(Order)
 admin.site.register(OrderState)
 admin.site.register(PaymentState)
 admin.site.register(Article2Order)
@@ -0,0 +1,94 @@
+import datetime
+from typing import Iterator, Optional, Tuple
+
+from django.db.models import QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .models import Order
+
+
+# Rows fetched per round trip from the server-side cursor.
+EXPORT_CHUNK_SIZE = 2000
+
+# (column name, lookup) pairs of the accounting export.
+# Each row is one order item; orders without items appear once with empty item columns.
+EXPORT_COLUMNS = [
+    ("order_id", "id"),
+    ("created", "created"),
+    ("user_id", "user_id"),
+    ("order_state", "order_state__name"),
+    ("payment_state", "payment_state__name"),
+    ("amount", "amount"),
+    ("vat", "vat"),
+    ("shipping_cost", "shipping_cost"),
+    ("shipping_provider", "shipping_method__shipping_provider__name"),
+    ("shipping_first_name", "shipping_address__receiver_first_name"),
+    ("shipping_last_name", "shipping_address__receiver_last_name"),
+    ("shipping_street", "shipping_address__street"),
+    ("shipping_house_number", "shipping_address__house_number"),
+    ("shipping_zip_code", "shipping_address__zip_code"),
+    ("shipping_city", "shipping_address__city"),
+    ("billing_first_name", "billing_address__receiver_first_name"),
+    ("billing_last_name", "billing_address__receiver_last_name"),
+    ("billing_street", "billing_address__street"),
+    ("billing_house_number", "billing_address__house_number"),
+    ("billing_zip_code", "billing_address__zip_code"),
+    ("billing_city", "billing_address__city"),
+    ("article_id", "article2order__article_id"),
+    ("unit_price", "article2order__unit_price"),
+    ("quantity", "article2order__quantity"),
+]
+
+EXPORT_HEADER = [column for column, _ in EXPORT_COLUMNS]
+
+
+def parse_created_bound(value: Optional[str], end_of_day: bool = False) -> Optional[datetime.datetime]:
+    """Parses an ISO date or datetime string. Plain dates are interpreted as
+    start of day, or as start of the following day if <end_of_day> is True.
+
+    Raises ValueError if the value cannot be parsed.
+    """
+    if not value:
+        return None
+
+    parsed = parse_datetime(value)
+    if parsed is None:
+        date = parse_date(value)
+        if date is None:
+            raise ValueError(f"'{value}' is not a valid ISO date or datetime.")
+        if end_of_day:
+            date += datetime.timedelta(days=1)
+        parsed = datetime.datetime.combine(date, datetime.time.min)
+
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def get_export_queryset(
+        created_after: Optional[datetime.datetime] = None,
+        created_before: Optional[datetime.datetime] = None
+) -> QuerySet:
+    """Returns one flat row per order item, joined with order, states,
+    shipping method and both addresses in a single query.
+    """
+    orders = Order.objects.all()
+    if created_after is not None:
+        orders = orders.filter(created__gte=created_after)
+    if created_before is not None:
+        orders = orders.filter(created__lt=created_before)
+
+    lookups = [lookup for _, lookup in EXPORT_COLUMNS]
+    return orders.order_by("created", "id").values_list(*lookups)
+
+
+def iter_export_rows(
+        created_after: Optional[datetime.datetime] = None,
+        created_before: Optional[datetime.datetime] = None,
+        chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[Tuple]:
+    """Iterates over the export rows through a server-side cursor,
+    so that memory stays flat regardless of the number of orders.
+    """
+    return get_export_queryset(created_after, created_before).iterator(chunk_size=chunk_size)
@@ -0,0 +1,17 @@
+# Generated by Django 3.1.6 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0009_auto_20210430_1523'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['created'], name='order_order_created_ef2486_idx'),
+        ),
+    ]
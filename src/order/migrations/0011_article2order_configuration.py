@@ -0,0 +1,32 @@
+# Generated by Django 3.1.6 on 2026-10-19 10:04
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+def link_order_item_configurations(apps, schema_editor):
+    """Links existing order items to the configuration of their board."""
+    Article2Order = apps.get_model('order', 'Article2Order')
+    Board = apps.get_model('article', 'Board')
+
+    # The historical Board cannot resolve its default ordering by the parent's 'created'
+    board_configuration = Board.objects.filter(pk=OuterRef('article_id')).order_by().values('configuration_id')[:1]
+    Article2Order.objects.filter(configuration__isnull=True).update(configuration=Subquery(board_configuration))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0014_attributeconfiguration'),
+        ('order', '0010_order_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article2order',
+            name='configuration',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='article.attributeconfiguration'),
+        ),
+        migrations.RunPython(link_order_item_configurations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 3.1.6 on 2026-10-19 11:30
+
+from django.db import migrations
+
+
+def add_production_order_states(apps, schema_editor):
+    OrderState = apps.get_model('order', 'OrderState')
+    order_state = OrderState(
+        name="produced",
+        description="Boards of the order have been produced."
+    )
+    order_state.save()
+
+    order_state = OrderState(
+        name="shipped",
+        description="Order has been handed over to the shipping provider."
+    )
+    order_state.save()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0011_article2order_configuration'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_production_order_states)
+    ]
@@ -5,10 +5,10 @@ from django.db.models.signals import post_save
 
 from auditlog.registry import auditlog
 
-from article.models import Article, Board
+from article.models import Article, AttributeConfiguration
 from user.models import BasketItem
 from user.address_management import Address
-from price.calculate_board_price import BoardPriceCalculator
+from price.cache import get_configuration_prices
 
 
 class ShippingProvider(models.Model):
@@ -44,7 +44,12 @@ class PaymentState(models.Model):
 
 
 class Order(models.Model):
-    """Model for Order"""
+    """Model for Order.
+
+    The board attributes of each ordered item are referenced through
+    Article2Order.configuration. The items field only holds the attribute
+    copies of orders placed before configurations were introduced.
+    """
     user = models.ForeignKey(User, on_delete=models.DO_NOTHING)
     items = models.JSONField(null=True, blank=True)
     shipping_method = models.ForeignKey(ShippingMethod, on_delete=models.DO_NOTHING)
@@ -66,6 +71,9 @@ class Order(models.Model):
     created = models.DateTimeField(auto_now_add=True)
     changed = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [models.Index(fields=["created"])]
+
     def save(self, *args, **kwargs):
         """Ensured that shipping cost is equal to the current price
         of the chosen shipping method.
@@ -79,6 +87,12 @@ class Article2Order(models.Model):
     """Model for Article 2 Order"""
     article = models.ForeignKey(Article, on_delete=models.DO_NOTHING)
     order = models.ForeignKey(Order, on_delete=models.DO_NOTHING)
+    configuration = models.ForeignKey(
+        AttributeConfiguration,
+        null=True,
+        blank=True,
+        on_delete=models.PROTECT
+    )
     unit_price = models.DecimalField(max_digits=6, decimal_places=2)
     quantity = models.IntegerField()
     created = models.DateTimeField(auto_now_add=True)
@@ -88,23 +102,34 @@ class Article2Order(models.Model):
         unique_together = ['order', 'article']
 
 
-def get_board_attrs(basket_item: BasketItem) -> dict:
-    """Returns the board attributes of a given basket item."""
-    board = Board.objects.get(pk=basket_item.article.pk)
-    return board.attributes
+def ensure_configuration(board) -> AttributeConfiguration:
+    """Returns the board's configuration, linking the board to it first
+    if the board has none yet.
+    """
+    if board.configuration is None:
+        # Board.save() interns the configuration of the board's attributes
+        board.save(update_fields=["configuration"])
+    return board.configuration
+
 
+def create_order_item(basket_item: BasketItem, order: Order, unit_prices: dict) -> Article2Order:
+    """Creates an order item based on a given basket item, whose article has
+    to be loaded with its board and configuration. <unit_prices> maps
+    configuration ids to current prices; missing prices are looked up.
 
-def create_order_item(basket_item: BasketItem, order: Order, calculator: BoardPriceCalculator) -> Article2Order:
-    """Creates an order item based on a given basket item.
     The order item is returned, but not saved in the database yet.
     """
-    board_attrs = get_board_attrs(basket_item)
-    unit_price = calculator.calculate_price(board_attrs)
+    configuration = ensure_configuration(basket_item.article.board)
+    unit_price = unit_prices.get(configuration.id)
+    if unit_price is None:
+        unit_price = get_configuration_prices([configuration])[configuration.id]
+
     order_item = Article2Order(
-        article=basket_item.article,
+        article_id=basket_item.article_id,
         order=order,
+        configuration=configuration,
         unit_price=unit_price,
-        quantity=1
+        quantity=basket_item.quantity
     )
     return order_item
 
@@ -113,21 +138,24 @@ def create_order_item(basket_item: BasketItem, order: Order, calculator: BoardPr
 def handle_order_items(sender, instance, created, **kwargs):
     """Takes care that upon Order creation, all the user's basket items are added
     to the order and are then deleted from the user's basket.
+
+    The order items reference the boards' attribute configurations,
+    so the attributes are not copied into the order. Unit prices are the
+    same (cached) prices the basket summary shows.
     """
     if created:
-        basket_items = BasketItem.objects.filter(owner=instance.user)
-        calculator = BoardPriceCalculator()
-        item_list = []
+        basket_items = list(
+            BasketItem.objects
+            .filter(owner=instance.user)
+            .select_related("article__board__configuration")
+        )
+        unit_prices = get_configuration_prices(ensure_configuration(item.article.board) for item in basket_items)
 
         for basket_item in basket_items:
-            order_item = create_order_item(basket_item, instance, calculator)
+            order_item = create_order_item(basket_item, instance, unit_prices)
             order_item.save()
-            item_list.append(get_board_attrs(basket_item))
             basket_item.delete()
 
-        instance.items = item_list
-        instance.save()
-
 
 auditlog.register(ShippingProvider)
 auditlog.register(ShippingMethod)
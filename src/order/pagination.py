@@ -0,0 +1,13 @@
+from rest_framework.pagination import CursorPagination
+
+
+class OrderCursorPagination(CursorPagination):
+    """Paginates orders by creation time, newest first.
+
+    Cursor pagination keeps page retrieval cheap for users with many orders,
+    as it never has to count or skip rows.
+    """
+    ordering = "-created"
+    page_size = 20
+    page_size_query_param = "page-size"
+    max_page_size = 100
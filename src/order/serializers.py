@@ -1,8 +1,21 @@
 from rest_framework import serializers
+
+from core.fieldsets import SparseFieldsetSerializerMixin
 from .models import Order
 
 
 class OrderSerializer(serializers.ModelSerializer):
+    items = serializers.SerializerMethodField()
+
+    @staticmethod
+    def get_items(order: Order) -> list:
+        """Returns the attributes of all ordered boards. Older orders
+        still carry a copy of them, newer ones reference configurations.
+        """
+        if order.items is not None:
+            return order.items
+        return [item.configuration.attributes for item in order.article2order_set.all() if item.configuration]
+
     class Meta:
         model = Order
         fields = "__all__"
@@ -16,3 +29,29 @@ class OrderSerializer(serializers.ModelSerializer):
             "shipping_cost",
             "items"
         ]
+        # Fall back to the user's default addresses if not given
+        extra_kwargs = {
+            "shipping_address": {"required": False},
+            "billing_address": {"required": False},
+        }
+
+
+class OrderListSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    """Compact order representation for order lists. Instead of the full
+    items snapshot, only the number of items and their total is given.
+    Requires a queryset annotated with item_count and total.
+    """
+    order_state = serializers.CharField(source="order_state.name", read_only=True)
+    payment_state = serializers.CharField(source="payment_state.name", read_only=True)
+    item_count = serializers.IntegerField(read_only=True)
+    total = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
+
+    class Meta:
+        model = Order
+        exclude = ["items", "user"]
+
+
+class OrderTransitionSerializer(serializers.Serializer):
+    """Input for moving a set of orders to a new order state."""
+    order_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=10000)
+    order_state = serializers.CharField(max_length=100)
@@ -0,0 +1,74 @@
+from typing import Iterable, Optional
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from core.audit import log_bulk_changes
+
+from .models import Order, OrderState
+
+
+# Maps each order state name to the names of the states an order may move on to.
+ORDER_STATE_TRANSITIONS = {
+    "received": ["confirmed", "produced"],
+    "confirmed": ["produced"],
+    "produced": ["shipped"],
+}
+
+
+def get_source_states(target_state_name: str) -> set:
+    """Returns the names of all states from which an order may move to the target state."""
+    return {
+        source for source, targets in ORDER_STATE_TRANSITIONS.items()
+        if target_state_name in targets
+    }
+
+
+def transition_orders(order_ids: Iterable[int], target_state_name: str, actor: Optional[User] = None) -> int:
+    """Moves all given orders to the target state with a single UPDATE
+    and writes the audit log entries in bulk.
+
+    Raises ValidationError, and changes nothing, if any of the orders does
+    not exist or may not move to the target state. Returns the number of
+    updated orders otherwise.
+    """
+    order_ids = set(order_ids)
+    source_states = get_source_states(target_state_name)
+
+    try:
+        target_state = OrderState.objects.get(name=target_state_name)
+    except OrderState.DoesNotExist:
+        raise ValidationError(f"Order state '{target_state_name}' does not exist.", code="unknown_state")
+
+    with transaction.atomic():
+        current_states = dict(
+            Order.objects
+            .select_for_update(of=("self",))
+            .filter(id__in=order_ids)
+            .values_list("id", "order_state__name")
+        )
+
+        missing = order_ids - current_states.keys()
+        if missing:
+            raise ValidationError(f"Orders {sorted(missing)} do not exist.", code="missing_orders")
+
+        invalid = sorted(pk for pk, state in current_states.items() if state not in source_states)
+        if invalid:
+            raise ValidationError(
+                f"Orders {invalid} cannot be moved to '{target_state_name}' from their current state.",
+                code="invalid_transition"
+            )
+
+        updated = Order.objects.filter(id__in=order_ids).update(
+            order_state=target_state,
+            changed=timezone.now()
+        )
+        log_bulk_changes(
+            Order,
+            {pk: {"order_state": [state, target_state_name]} for pk, state in current_states.items()},
+            actor=actor
+        )
+
+    return updated
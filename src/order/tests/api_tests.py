@@ -0,0 +1,87 @@
+from decimal import Decimal
+
+import pytest
+
+from django.urls import reverse
+
+from .conftest import BOARD_ATTRIBUTES
+
+
+@pytest.mark.django_db
+class TestOrderList:
+    def test_compact_representation(self, authenticated_client, create_order):
+        """GIVEN an order with two items
+
+        WHEN the user lists their orders
+
+        THEN the order carries its item count and total instead of its items.
+        """
+        order = create_order(num_items=2)
+
+        response = authenticated_client.get(reverse("order:order_list"))
+
+        assert response.status_code == 200
+        [listed_order] = response.json()["results"]
+        assert listed_order["id"] == order.id
+        assert listed_order["item_count"] == 2
+        # Unit price 2.50, quantities 1 and 2
+        assert Decimal(listed_order["total"]) == Decimal("7.50")
+        assert listed_order["order_state"] == "received"
+        assert "items" not in listed_order
+        assert "user" not in listed_order
+
+    def test_only_own_orders_are_listed(self, authenticated_client, create_order, other_user):
+        create_order(owner=other_user)
+
+        response = authenticated_client.get(reverse("order:order_list"))
+
+        assert response.json()["results"] == []
+
+    def test_cursor_pagination(self, authenticated_client, create_order):
+        orders = [create_order() for _ in range(3)]
+
+        first_page = authenticated_client.get(reverse("order:order_list") + "?page-size=2").json()
+        second_page = authenticated_client.get(first_page["next"]).json()
+
+        assert "count" not in first_page
+        assert [order["id"] for order in first_page["results"]] == [orders[2].id, orders[1].id]
+        assert [order["id"] for order in second_page["results"]] == [orders[0].id]
+        assert second_page["next"] is None
+
+    def test_number_of_queries_does_not_grow_with_orders(
+            self, authenticated_client, create_order, django_assert_max_num_queries
+    ):
+        create_order(num_items=1)
+        with django_assert_max_num_queries(10) as few_orders:
+            authenticated_client.get(reverse("order:order_list"))
+
+        for _ in range(5):
+            create_order(num_items=2)
+        with django_assert_max_num_queries(len(few_orders.captured_queries)):
+            authenticated_client.get(reverse("order:order_list"))
+
+    def test_sparse_fields(self, authenticated_client, create_order):
+        create_order(num_items=1)
+
+        response = authenticated_client.get(reverse("order:order_list") + "?fields=id,total")
+
+        [listed_order] = response.json()["results"]
+        assert set(listed_order) == {"id", "total"}
+
+
+@pytest.mark.django_db
+class TestOrderDetails:
+    def test_items_are_returned(self, authenticated_client, create_order):
+        order = create_order(num_items=2)
+
+        response = authenticated_client.get(reverse("order:order_details", args=[order.id]))
+
+        assert response.status_code == 200
+        assert response.json()["items"] == [BOARD_ATTRIBUTES, BOARD_ATTRIBUTES]
+
+    def test_other_users_orders_are_not_found(self, authenticated_client, create_order, other_user):
+        order = create_order(owner=other_user)
+
+        response = authenticated_client.get(reverse("order:order_details", args=[order.id]))
+
+        assert response.status_code == 404
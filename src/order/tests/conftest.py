@@ -0,0 +1,87 @@
+import pytest
+
+from typing import Callable, Optional
+
+from src.article.models import ArticleCategory, Board
+from src.order.models import Article2Order, Order, OrderState, PaymentState, ShippingMethod
+from src.user.address_management import Address
+from src.user.models import BasketItem
+
+
+BOARD_ATTRIBUTES = {
+    "dimensionX": 100,
+    "dimensionY": 100,
+    "castellatedHoles": "no",
+    "num_designs": 1,
+    "quantity": 10
+}
+
+
+@pytest.fixture
+def create_address(user) -> Callable:
+    def _create_address(owner=None, **fields) -> Address:
+        """Closure to create an address of the given user (default: the standard user)."""
+        data = {
+            "receiver_first_name": "Max",
+            "receiver_last_name": "Mustermann",
+            "street": "Musterstraße",
+            "house_number": "99",
+            "zip_code": "99999",
+            "city": "Berlin",
+        }
+        data.update(fields)
+        return Address.objects.create(user=owner or user, **data)
+    return _create_address
+
+
+@pytest.fixture
+def create_board(user) -> Callable:
+    def _create_board(owner=None, attributes: Optional[dict] = None) -> Board:
+        """Closure to create a board of the given user (default: the standard user)."""
+        return Board.objects.create(
+            owner=owner or user,
+            category=ArticleCategory.objects.get(name="PCB"),
+            gerberFileName="gerber.zip",
+            gerberHash="blablub123",
+            attributes=attributes or BOARD_ATTRIBUTES
+        )
+    return _create_board
+
+
+@pytest.fixture
+def create_order(user, create_address, create_board) -> Callable:
+    def _create_order(owner=None, order_state: str = "received", num_items: int = 0) -> Order:
+        """Closure to create an order of the given user (default: the standard user)
+        in the given order state, with <num_items> ordered boards.
+        Like placing an order, it leaves the user's basket empty.
+        """
+        owner = owner or user
+        address = create_address(owner)
+        order = Order.objects.create(
+            user=owner,
+            shipping_method=ShippingMethod.objects.first(),
+            shipping_address=address,
+            billing_address=address,
+            amount=15.99,
+            vat=1.12,
+            order_state=OrderState.objects.get(name=order_state),
+            payment_state=PaymentState.objects.get(name="pending")
+        )
+        for quantity in range(1, num_items + 1):
+            board = create_board(owner)
+            Article2Order.objects.create(
+                article=board,
+                order=order,
+                configuration=board.configuration,
+                unit_price=2.50,
+                quantity=quantity
+            )
+        # The boards were added to the basket when they were created
+        BasketItem.objects.filter(owner=owner).delete()
+        return order
+    return _create_order
+
+
+@pytest.fixture
+def staff_user(user_factory):
+    return user_factory(email="admin@gmail.com", username="admin", is_staff=True)
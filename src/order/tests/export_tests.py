@@ -0,0 +1,104 @@
+import csv
+import io
+import json
+import datetime
+
+import pytest
+
+from django.urls import reverse
+from django.utils import timezone
+
+from src.order.export import EXPORT_HEADER, iter_export_rows, parse_created_bound
+from src.order.models import Order
+
+
+def get_content(response) -> str:
+    return b"".join(response.streaming_content).decode("utf-8")
+
+
+class TestParseCreatedBound:
+    def test_date_is_start_of_day(self):
+        parsed = parse_created_bound("2021-04-30")
+        assert timezone.is_aware(parsed)
+        assert (parsed.date(), parsed.time()) == (datetime.date(2021, 4, 30), datetime.time.min)
+
+    def test_end_of_day_is_start_of_next_day(self):
+        parsed = parse_created_bound("2021-04-30", end_of_day=True)
+        assert parsed.date() == datetime.date(2021, 5, 1)
+
+    def test_invalid_value(self):
+        with pytest.raises(ValueError):
+            parse_created_bound("yesterday")
+
+
+@pytest.mark.django_db
+class TestExportRows:
+    def test_one_row_per_item(self, create_order):
+        """GIVEN an order with two items and an order without items
+
+        WHEN the export rows are iterated
+
+        THEN there is one row per item and one row for the empty order.
+        """
+        order_with_items = create_order(num_items=2)
+        empty_order = create_order()
+
+        rows = list(iter_export_rows(chunk_size=1))
+
+        order_ids = [row[EXPORT_HEADER.index("order_id")] for row in rows]
+        assert order_ids == [order_with_items.id, order_with_items.id, empty_order.id]
+        assert rows[-1][EXPORT_HEADER.index("article_id")] is None
+
+    def test_created_bounds(self, create_order):
+        old_order = create_order()
+        new_order = create_order()
+        Order.objects.filter(id=old_order.id).update(created=timezone.now() - datetime.timedelta(days=10))
+
+        rows = list(iter_export_rows(created_after=timezone.now() - datetime.timedelta(days=1)))
+
+        assert [row[0] for row in rows] == [new_order.id]
+
+
+@pytest.mark.django_db
+class TestOrderExportView:
+    def test_csv_export(self, client, create_order, staff_user):
+        order = create_order(num_items=2)
+        client.force_login(staff_user)
+
+        response = client.get(reverse("order:order_export"))
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["Content-Type"] == "text/csv"
+        assert response["Content-Disposition"] == 'attachment; filename="orders.csv"'
+
+        rows = list(csv.reader(io.StringIO(get_content(response))))
+        assert rows[0] == EXPORT_HEADER
+        assert len(rows) == 3
+        assert {row[0] for row in rows[1:]} == {str(order.id)}
+
+    def test_ndjson_export(self, client, create_order, staff_user):
+        order = create_order(num_items=1)
+        client.force_login(staff_user)
+
+        response = client.get(reverse("order:order_export") + "?type=ndjson")
+
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in get_content(response).splitlines()]
+        assert len(lines) == 1
+        assert list(lines[0]) == EXPORT_HEADER
+        assert lines[0]["order_id"] == order.id
+        assert lines[0]["quantity"] == 1
+
+    @pytest.mark.parametrize("query", ["?type=xml", "?created-after=yesterday"])
+    def test_invalid_query_params(self, client, staff_user, query):
+        client.force_login(staff_user)
+
+        response = client.get(reverse("order:order_export") + query)
+
+        assert response.status_code == 400
+        assert "Error" in response.json()
+
+    def test_regular_users_are_rejected(self, authenticated_client):
+        response = authenticated_client.get(reverse("order:order_export"))
+        assert response.status_code == 403
@@ -0,0 +1,85 @@
+import importlib
+
+import pytest
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+
+from src.article.models import Board
+from src.order.models import Article2Order, Order, OrderState, PaymentState, ShippingMethod
+from src.order.serializers import OrderSerializer
+from src.user.models import BasketItem
+
+from .conftest import BOARD_ATTRIBUTES
+
+
+@pytest.fixture
+def place_order(user, create_address):
+    def _place_order() -> Order:
+        """Closure to place an order with all items in the user's basket."""
+        address = create_address()
+        return Order.objects.create(
+            user=user,
+            shipping_method=ShippingMethod.objects.first(),
+            shipping_address=address,
+            billing_address=address,
+            amount=15.99,
+            vat=1.12,
+            order_state=OrderState.objects.get(name="received"),
+            payment_state=PaymentState.objects.get(name="pending")
+        )
+    return _place_order
+
+
+@pytest.mark.django_db
+class TestOrderItems:
+    def test_basket_items_become_order_items(self, user, create_board, place_order):
+        """GIVEN two boards in the user's basket
+
+        WHEN the user places an order
+
+        THEN the order items reference the boards' configurations,
+        have a unit price and the basket is empty.
+        """
+        boards = [create_board(), create_board(attributes={**BOARD_ATTRIBUTES, "quantity": 20})]
+
+        order = place_order()
+
+        order_items = {item.article_id: item for item in Article2Order.objects.filter(order=order)}
+        assert set(order_items) == {board.pk for board in boards}
+        for board in boards:
+            assert order_items[board.pk].configuration_id == board.configuration_id
+            assert order_items[board.pk].unit_price > 0
+        assert not BasketItem.objects.filter(owner=user).exists()
+
+    def test_order_items_keep_attributes_of_ordered_configuration(self, create_board, place_order):
+        board = create_board()
+        order = place_order()
+
+        board.attributes = {**BOARD_ATTRIBUTES, "quantity": 50}
+        board.save()
+
+        assert OrderSerializer(order).data["items"] == [BOARD_ATTRIBUTES]
+
+    def test_boards_without_configuration_are_linked(self, create_board, place_order):
+        board = create_board()
+        Board.objects.filter(pk=board.pk).update(configuration=None)
+
+        order = place_order()
+
+        order_item = Article2Order.objects.get(order=order)
+        assert order_item.configuration is not None
+        assert order_item.configuration.attributes == BOARD_ATTRIBUTES
+        assert Board.objects.get(pk=board.pk).configuration_id == order_item.configuration_id
+
+    def test_migration_links_existing_order_items(self, create_order):
+        order = create_order(num_items=2)
+        Article2Order.objects.filter(order=order).update(configuration=None)
+
+        migration = importlib.import_module("order.migrations.0011_article2order_configuration")
+        # The historical models, as during `manage.py migrate`
+        state = MigrationExecutor(connection).loader.project_state(("order", "0011_article2order_configuration"))
+        migration.link_order_item_configurations(state.apps, None)
+
+        for order_item in Article2Order.objects.filter(order=order).select_related("article__board"):
+            assert order_item.configuration_id == order_item.article.board.configuration_id
@@ -0,0 +1,107 @@
+import pytest
+
+from django.core.exceptions import ValidationError
+from django.urls import reverse
+
+from auditlog.models import LogEntry
+
+from src.order.admin import OrderAdmin
+from src.order.models import Order
+from src.order.state_transitions import transition_orders
+
+
+def get_state_names(orders) -> list:
+    return list(
+        Order.objects.filter(id__in=[order.id for order in orders])
+        .order_by("id")
+        .values_list("order_state__name", flat=True)
+    )
+
+
+class TestAdminActions:
+    def test_action_names_are_unique(self):
+        """Django rejects admin actions with duplicate names (admin.E130)."""
+        names = [action.__name__ for action in OrderAdmin.actions]
+        assert sorted(names) == sorted(set(names))
+        assert set(names) == {"mark_confirmed", "mark_produced", "mark_shipped"}
+
+
+@pytest.mark.django_db
+class TestTransitionOrders:
+    def test_orders_are_moved_and_audited(self, create_order, staff_user):
+        """GIVEN received and confirmed orders
+
+        WHEN they are moved to 'produced'
+
+        THEN all of them are in the new state and an audit entry is written per order.
+        """
+        orders = [create_order(order_state="received"), create_order(order_state="confirmed")]
+
+        updated = transition_orders([order.id for order in orders], "produced", actor=staff_user)
+
+        assert updated == 2
+        assert get_state_names(orders) == ["produced", "produced"]
+        assert LogEntry.objects.filter(
+            object_pk__in=[str(order.id) for order in orders],
+            action=LogEntry.Action.UPDATE,
+            actor=staff_user
+        ).count() == 2
+
+    def test_invalid_transition_changes_nothing(self, create_order):
+        orders = [create_order(order_state="received"), create_order(order_state="produced")]
+
+        with pytest.raises(ValidationError):
+            transition_orders([order.id for order in orders], "confirmed")
+
+        assert get_state_names(orders) == ["received", "produced"]
+
+    def test_missing_orders_are_rejected(self, create_order):
+        order = create_order()
+
+        with pytest.raises(ValidationError):
+            transition_orders([order.id, order.id + 1000], "confirmed")
+
+        assert get_state_names([order]) == ["received"]
+
+
+@pytest.mark.django_db
+class TestOrderTransitionView:
+    def test_staff_can_move_orders(self, client, create_order, staff_user):
+        orders = [create_order(), create_order()]
+        client.force_login(staff_user)
+
+        response = client.post(
+            reverse("order:order_transition"),
+            data={"order_ids": [order.id for order in orders], "order_state": "confirmed"},
+            content_type="application/json"
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"updated": 2}
+        assert get_state_names(orders) == ["confirmed", "confirmed"]
+
+    def test_invalid_transition_returns_400(self, client, create_order, staff_user):
+        order = create_order(order_state="shipped")
+        client.force_login(staff_user)
+
+        response = client.post(
+            reverse("order:order_transition"),
+            data={"order_ids": [order.id], "order_state": "confirmed"},
+            content_type="application/json"
+        )
+
+        assert response.status_code == 400
+        assert "Error" in response.json()
+        assert get_state_names([order]) == ["shipped"]
+
+    def test_regular_users_are_rejected(self, authenticated_client, create_order):
+        order = create_order()
+
+        response = authenticated_client.post(
+            reverse("order:order_transition"),
+            data={"order_ids": [order.id], "order_state": "confirmed"},
+            content_type="application/json"
+        )
+
+        assert response.status_code == 403
+        assert get_state_names([order]) == ["received"]
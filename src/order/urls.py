@@ -6,4 +6,7 @@ app_name = 'order'
 
 urlpatterns = [
     path('user/orders/', views.OrderList.as_view(), name='order_list'),
+    path('user/orders/<int:pk>/', views.OrderDetails.as_view(), name='order_details'),
+    path('admin/orders/export/', views.OrderExport.as_view(), name='order_export'),
+    path('admin/orders/transition/', views.OrderTransition.as_view(), name='order_transition'),
 ]
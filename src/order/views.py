@@ -1,21 +1,77 @@
-from rest_framework import generics
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Sum, F, DecimalField
+from django.http import JsonResponse, StreamingHttpResponse
 
-from .serializers import OrderSerializer
+from rest_framework import generics, serializers
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAdminUser
+
+from core.idempotency import IdempotentCreateMixin
+from core.fieldsets import SparseFieldsetMixin
+from core.streaming import encode_rows, CONTENT_TYPES
+from user.address_management import get_default_address_ids
+
+from .serializers import OrderSerializer, OrderListSerializer, OrderTransitionSerializer
+from .pagination import OrderCursorPagination
 from .models import Order, OrderState, PaymentState
+from .export import EXPORT_HEADER, iter_export_rows, parse_created_bound
+from .state_transitions import transition_orders
 
 
-class OrderList(generics.ListCreateAPIView):
-    """GET: Returns a list of all orders the current user has made.
+class OrderList(IdempotentCreateMixin, SparseFieldsetMixin, generics.ListCreateAPIView):
+    """GET: Returns a cursor-paginated list of the orders the current user has made,
+    newest first. Each order contains its item count and total instead of the
+    full items, which are available through the order details. The returned
+    fields can be restricted, e.g. ?fields=id,created,total.
 
     POST: Accepts a shipping method, a billing and a shipping address
     and creates an order with all the items present in the current user's
-    shopping basket.
+    shopping basket. If no shipping or billing address is given, the user's
+    default address of that type is used. A retried POST with the same Idempotency-Key header
+    returns the original response instead of creating a second order.
     """
-    serializer_class = OrderSerializer
+    pagination_class = OrderCursorPagination
+
+    def get_serializer_class(self):
+        if self.request.method == "GET":
+            return OrderListSerializer
+        return OrderSerializer
 
     def get_queryset(self):
         user = self.request.user
-        return Order.objects.filter(user=user)
+        return (
+            Order.objects
+            .filter(user=user)
+            .select_related("order_state", "payment_state")
+            .defer("items")
+            .annotate(
+                item_count=Count("article2order"),
+                total=Sum(
+                    F("article2order__unit_price") * F("article2order__quantity"),
+                    output_field=DecimalField(max_digits=10, decimal_places=2)
+                )
+            )
+        )
+
+    @staticmethod
+    def get_missing_addresses(serializer, user) -> dict:
+        """Returns the ids of the user's default addresses for all address
+        types the serializer did not receive an address for.
+        """
+        default_address_ids = get_default_address_ids(user)
+        addresses = {}
+
+        for address_type in ["shipping", "billing"]:
+            if f"{address_type}_address" in serializer.validated_data:
+                continue
+
+            if default_address_ids[address_type] is None:
+                raise serializers.ValidationError(
+                    {f"{address_type}_address": ["This field is required if no default address is set."]}
+                )
+            addresses[f"{address_type}_address_id"] = default_address_ids[address_type]
+
+        return addresses
 
     def perform_create(self, serializer):
         order_state = OrderState.objects.get(name="received")
@@ -29,4 +85,74 @@ class OrderList(generics.ListCreateAPIView):
             user=user,
             amount=amount,
             vat=vat,
+            **self.get_missing_addresses(serializer, user)
+        )
+
+
+class OrderDetails(generics.RetrieveAPIView):
+    """Returns details for one of the current user's orders (GET),
+    including all of its items.
+    """
+    serializer_class = OrderSerializer
+
+    def get_queryset(self):
+        user = self.request.user
+        return (
+            Order.objects
+            .filter(user=user)
+            .select_related("order_state", "payment_state")
+            .prefetch_related("article2order_set__configuration")
+        )
+
+
+class OrderExport(APIView):
+    """GET: Streams all order items, joined with their orders, shipping methods
+    and addresses, as CSV (default) or NDJSON for accounting.
+
+    Query params: type (csv or ndjson), created-after and created-before
+    (ISO dates or datetimes; created-before is exclusive).
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        file_type = request.query_params.get("type", "csv")
+        if file_type not in CONTENT_TYPES:
+            return JsonResponse(status=400, data={"Error": "Query param type must be csv or ndjson."})
+
+        try:
+            created_after = parse_created_bound(request.query_params.get("created-after"))
+            created_before = parse_created_bound(request.query_params.get("created-before"), end_of_day=True)
+        except ValueError as e:
+            return JsonResponse(status=400, data={"Error": str(e)})
+
+        rows = iter_export_rows(created_after, created_before)
+        response = StreamingHttpResponse(
+            encode_rows(file_type, EXPORT_HEADER, rows),
+            content_type=CONTENT_TYPES[file_type]
         )
+        response["Content-Disposition"] = f'attachment; filename="orders.{file_type}"'
+        return response
+
+
+class OrderTransition(APIView):
+    """POST: Moves a set of orders to a new order state in one statement.
+    Accepts a list of order_ids and the name of the target order_state.
+
+    Nothing is changed if any of the orders may not move to that state.
+    """
+    permission_classes = [IsAdminUser]
+
+    def post(self, request):
+        serializer = OrderTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            updated = transition_orders(
+                serializer.validated_data["order_ids"],
+                serializer.validated_data["order_state"],
+                actor=request.user
+            )
+        except ValidationError as e:
+            return JsonResponse(status=400, data={"Error": " ".join(e.messages)})
+
+        return JsonResponse({"updated": updated})
@@ -87,9 +87,28 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
 
+    ],
+    # Bearer tokens are checked first and without database queries.
+    # Requests without one fall back to session and basic authentication.
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'user.authentication.JWTAuthentication',
+        'rest_framework.authentication.SessionAuthentication',
+        'rest_framework.authentication.BasicAuthentication',
     ]
 }
 
+# Lifetimes of JWT access and refresh tokens, in seconds
+JWT_SIGNING_KEY = SECRET_KEY
+JWT_ACCESS_TOKEN_LIFETIME = 5 * 60
+JWT_REFRESH_TOKEN_LIFETIME = 7 * 24 * 60 * 60
+
+# Successful responses to POSTs with an Idempotency-Key header are kept in
+# the cache and replayed for retries within IDEMPOTENCY_KEY_TTL seconds.
+# A request holds its key for at most IDEMPOTENCY_LOCK_TIMEOUT seconds.
+IDEMPOTENCY_KEY_TTL = 24 * 60 * 60
+IDEMPOTENCY_WAIT_TIMEOUT = 30
+IDEMPOTENCY_LOCK_TIMEOUT = 5 * 60
+
 ACCOUNT_AUTHENTICATION_METHOD = "email"
 ACCOUNT_EMAIL_REQUIRED = True
 ACCOUNT_USERNAME_REQUIRED = False
@@ -126,6 +145,41 @@ TEMPLATES = [
 WSGI_APPLICATION = 'pcb_shop.wsgi.application'
 
 
+# Shared by all web workers and the cron jobs, so that invalidations made by
+# management commands reach the web processes. A cache hit is a memcached
+# round trip instead of a database query. The tests use a local memory cache.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.memcached.MemcachedCache',
+        'LOCATION': os.environ.get('MEMCACHED_LOCATION', 'memcached:11211'),
+    }
+}
+
+PRICE_CACHE_TIMEOUT = 60 * 60
+BASKET_SUMMARY_TIMEOUT = PRICE_CACHE_TIMEOUT
+DEFAULT_ADDRESS_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+# Built with `manage.py build_zip_code_index`. Zip code validation
+# and city autocomplete are disabled while the file does not exist.
+ZIP_CODE_INDEX_PATH = BASE_DIR / 'user' / 'data' / 'zip_codes.bin'
+
+# Boards that were never ordered are purged this many days after creation.
+BOARD_RETENTION_DAYS = 90
+
+# (cron schedule, management command) pairs, installed with `manage.py install_cron_jobs`.
+CRON_JOBS = [
+    ("30 3 * * *", "purge_stale_boards"),
+    ("*/5 * * * *", "process_user_deletions"),
+]
+CRON_LOG_DIR = BASE_DIR.parent / 'logs'
+
+# Gzipped pages fetched by the scraper, used to skip unchanged shop pages
+SCRAPER_SNAPSHOT_DIR = BASE_DIR.parent / 'snapshots'
+SCRAPER_INGEST_SNAPSHOT_DIR = BASE_DIR.parent / 'ingest_snapshots'
+SCRAPER_SNAPSHOTS_KEPT = 30
+
+
 DBBACKUP_STORAGE = 'django.core.files.storage.FileSystemStorage'
 DBBACKUP_STORAGE_OPTIONS = {'location': BASE_DIR / 'db_backups/'}
 
@@ -0,0 +1,9 @@
+from .dev import *
+
+
+# Every test process gets its own cache, so tests do not depend on memcached
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
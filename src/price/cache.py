@@ -0,0 +1,39 @@
+from decimal import Decimal
+from typing import Dict, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .calculate_board_price import BoardPriceCalculator
+
+
+def price_cache_key(configuration_id: int) -> str:
+    return f"price:configuration:{configuration_id}"
+
+
+def get_configuration_prices(configurations: Iterable) -> Dict[int, Decimal]:
+    """Returns the current unit prices of the given attribute configurations, keyed by configuration id.
+
+    Prices are looked up in the cache with one batch request. Only the
+    missing ones are calculated, and they are cached for PRICE_CACHE_TIMEOUT seconds.
+    """
+    configurations = {configuration.id: configuration for configuration in configurations}
+    keys = {price_cache_key(configuration_id): configuration_id for configuration_id in configurations}
+
+    cached = cache.get_many(keys)
+    prices = {keys[key]: price for key, price in cached.items()}
+
+    missing = [configuration_id for configuration_id in configurations if configuration_id not in prices]
+    if missing:
+        calculator = BoardPriceCalculator()
+        calculated = {
+            configuration_id: Decimal(str(calculator.calculate_price(configurations[configuration_id].attributes)))
+            for configuration_id in missing
+        }
+        cache.set_many(
+            {price_cache_key(configuration_id): price for configuration_id, price in calculated.items()},
+            timeout=settings.PRICE_CACHE_TIMEOUT
+        )
+        prices.update(calculated)
+
+    return prices
@@ -1,33 +1,215 @@
 import os
-
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+import time
+import atexit
+import logging
+import threading
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
 
 
 os.environ['WDM_PRINT_FIRST_LINE'] = 'False'
 os.environ['WDM_LOG_LEVEL'] = '0'
 
+logger = logging.getLogger(__name__)
+
+SUPPORTED_BROWSERS = ["Chrome"]
+
+# JavaScript heap of the current page in bytes (Chrome only), used to detect leaking browsers
+MEMORY_SCRIPT = "return window.performance.memory ? window.performance.memory.usedJSHeapSize : null;"
+
+
+class DriverPoolExhausted(Exception):
+    """Raised if no driver could be leased from the pool in time."""
+
+
+def chrome_driver_factory(page_load_timeout: float, performance_log: bool = False):
+    """Launches a headless Chrome whose page loads time out after <page_load_timeout> seconds.
+    With <performance_log>, its network events can be read with driver.get_log("performance").
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    opts = Options()
+    opts.headless = True
+    opts.add_argument('log-level=3')
+    if performance_log:
+        opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    driver = webdriver.Chrome(ChromeDriverManager().install(), chrome_options=opts)
+    driver.set_page_load_timeout(page_load_timeout)
+    return driver
+
+
+class PooledDriver:
+    """A browser process owned by a WebDriverPool, with its usage statistics."""
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.created = time.monotonic()
+        self.baseline_memory: Optional[int] = None
+
+
+class WebDriverPool:
+    """Bounded pool of warm browser processes.
+
+    Drivers are created lazily up to <size> and handed out one lease at a time.
+    When a lease ends, the driver is checked and replaced if it failed, is
+    unresponsive, has served <max_pages> pages or its page memory grew by more
+    than <max_memory_growth> bytes since its first page. Drivers that do not
+    quit within <kill_timeout> seconds are killed.
+
+    <driver_factory> is called with the page load timeout and returns a new
+    driver; tests pass a fake one.
+    """
+    def __init__(
+            self,
+            size: int = 2,
+            max_pages: int = 50,
+            max_memory_growth: int = 200 * 1024 * 1024,
+            page_load_timeout: float = 30,
+            kill_timeout: float = 10,
+            lease_timeout: float = 120,
+            driver_factory: Callable[[float], Any] = chrome_driver_factory
+    ):
+        self.size = size
+        self.max_pages = max_pages
+        self.max_memory_growth = max_memory_growth
+        self.page_load_timeout = page_load_timeout
+        self.kill_timeout = kill_timeout
+        self.lease_timeout = lease_timeout
+        self.driver_factory = driver_factory
+
+        self._idle: List[PooledDriver] = []
+        self._num_drivers = 0
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def acquire(self) -> PooledDriver:
+        """Returns an idle driver, or a new one if the pool is not full yet.
+        Waits up to <self.lease_timeout> seconds for a driver to be released otherwise.
+        """
+        deadline = time.monotonic() + self.lease_timeout
+
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("The driver pool has been closed.")
+                if self._idle:
+                    return self._idle.pop()
+                if self._num_drivers < self.size:
+                    self._num_drivers += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._condition.wait(remaining):
+                    raise DriverPoolExhausted(f"No driver was released within {self.lease_timeout} seconds.")
+
+        # Launching a browser takes seconds, so it happens outside the lock
+        try:
+            return PooledDriver(self.driver_factory(self.page_load_timeout))
+        except Exception:
+            self._forget_driver()
+            raise
+
+    def release(self, pooled: PooledDriver, failed: bool = False) -> None:
+        """Returns a driver to the pool, or replaces it if it should not be reused."""
+        pooled.pages += 1
+
+        if failed or self._closed or not self._is_reusable(pooled):
+            self._discard(pooled)
+            return
+
+        with self._condition:
+            self._idle.append(pooled)
+            self._condition.notify()
+
+    def _is_reusable(self, pooled: PooledDriver) -> bool:
+        """Health check: the browser has to answer and must not exceed its page or memory budget."""
+        if pooled.pages >= self.max_pages:
+            return False
+        try:
+            memory = pooled.driver.execute_script(MEMORY_SCRIPT)
+        except Exception:
+            logger.warning("Driver did not respond to the health check")
+            return False
+
+        if memory is None:
+            return True
+        if pooled.baseline_memory is None:
+            pooled.baseline_memory = memory
+        return memory - pooled.baseline_memory <= self.max_memory_growth
+
+    def _forget_driver(self) -> None:
+        with self._condition:
+            self._num_drivers -= 1
+            self._condition.notify()
+
+    def _discard(self, pooled: PooledDriver) -> None:
+        """Quits the browser and frees its slot in the pool."""
+        self._forget_driver()
+        self._quit(pooled.driver)
+
+    def _quit(self, driver) -> None:
+        """Quits <driver>, killing its process if it hangs for longer than <self.kill_timeout> seconds."""
+        quitter = threading.Thread(target=driver.quit, daemon=True)
+        quitter.start()
+        quitter.join(self.kill_timeout)
+        if not quitter.is_alive():
+            return
+
+        logger.warning("Driver did not quit in time and is killed")
+        process = getattr(getattr(driver, "service", None), "process", None)
+        if process is not None:
+            process.kill()
+
+    def close(self) -> None:
+        """Quits all idle drivers. Leased drivers are quit when they are released."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+
+        for pooled in idle:
+            self._discard(pooled)
+
+
+_default_pools: Dict[bool, WebDriverPool] = {}
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool(performance_log: bool = False) -> WebDriverPool:
+    """Returns the process-wide driver pool, creating it on first use.
+
+    Drivers that record the performance log are pooled separately, since
+    the log grows with every page until it is read.
+    """
+    with _default_pool_lock:
+        if performance_log not in _default_pools:
+            pool = WebDriverPool(driver_factory=partial(chrome_driver_factory, performance_log=performance_log))
+            atexit.register(pool.close)
+            _default_pools[performance_log] = pool
+        return _default_pools[performance_log]
+
 
 class WebDriver:
-    """Context Manager for clean web scraping."""
-    def __init__(self, browser: str = "Chrome"):
-        if browser not in ["Chrome"]:
+    """Context Manager for clean web scraping.
+
+    Leases a warm browser from <pool> (the process-wide pool by default)
+    and returns it on exit. If the block raises, the browser is replaced.
+    """
+    def __init__(self, browser: str = "Chrome", pool: Optional[WebDriverPool] = None):
+        if browser not in SUPPORTED_BROWSERS:
             raise Exception(f"The browser '{browser}' is currently not supported")
 
         self.browser = browser
-        self.opts = Options()
-        self.opts.headless = True
-        self.opts.add_argument('log-level=3')
-
-        if self.browser == "Chrome":
-            self.driver = webdriver.Chrome(
-                ChromeDriverManager().install(),
-                chrome_options=self.opts
-            )
+        self.pool = pool if pool is not None else get_default_pool()
+        self._pooled: Optional[PooledDriver] = None
 
     def __enter__(self):
-        return self.driver
+        self._pooled = self.pool.acquire()
+        return self._pooled.driver
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.driver.quit()
\ No newline at end of file
+        self.pool.release(self._pooled, failed=exc_type is not None)
+        self._pooled = None
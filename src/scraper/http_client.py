@@ -0,0 +1,205 @@
+import time
+import codecs
+import random
+import logging
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Mapping, NamedTuple, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+logger = logging.getLogger(__name__)
+
+# Statuses that are worth retrying, since the next attempt may succeed
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class FetchError(Exception):
+    """Raised if a page cannot be fetched, after all retries."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class ResponseTooLarge(FetchError):
+    """Raised if a response body exceeds the client's size limit."""
+
+
+class RequestTiming(NamedTuple):
+    url: str
+    status: Optional[int]
+    attempts: int
+    # Seconds until the response headers of the last attempt arrived,
+    # and for the whole request including retries and the body
+    first_byte: Optional[float]
+    total: float
+    size: int
+
+
+class HttpResponse(NamedTuple):
+    url: str
+    status: int
+    headers: Mapping[str, str]
+    text: str
+    timing: RequestTiming
+
+
+class HttpClient:
+    """HTTP client for crawlers of static pages.
+
+    Keeps one connection-pooled session per host, so that repeated crawls reuse
+    their connections. Failed connections and retryable statuses are retried up
+    to <max_retries> times with jittered exponential backoff (honoring Retry-After).
+    Bodies are streamed and decoded incrementally, and responses larger than
+    <max_bytes> are aborted. The timings of the last <keep_timings> requests are
+    kept in <self.timings>.
+    """
+    def __init__(
+            self,
+            max_retries: int = 3,
+            backoff: float = 0.5,
+            max_backoff: float = 10.0,
+            connect_timeout: float = 3.05,
+            read_timeout: float = 10.0,
+            max_bytes: int = 5 * 1024 * 1024,
+            pool_size: int = 4,
+            user_agent: str = "pcb-shop-crawler",
+            keep_timings: int = 1000
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_bytes = max_bytes
+        self.pool_size = pool_size
+        self.user_agent = user_agent
+
+        self.timings: Deque[RequestTiming] = deque(maxlen=keep_timings)
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def session(self, host: str) -> requests.Session:
+        """Returns the pooled session for <host>, creating it on first use."""
+        with self._lock:
+            if host not in self._sessions:
+                session = requests.Session()
+                # Retries are handled by the client, to add jitter and measure them
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=0)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["User-Agent"] = self.user_agent
+                self._sessions[host] = session
+            return self._sessions[host]
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def _get_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Returns the seconds to wait before retry number <attempt> (starting at 1)."""
+        if retry_after is not None and retry_after.isdigit():
+            return min(float(retry_after), self.max_backoff)
+        # "Full jitter" spreads the retries of concurrent crawls over the whole interval
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+    def _read_body(self, response: requests.Response) -> Tuple[str, int]:
+        """Streams the body of <response>, decodes it chunk by chunk and
+        returns it together with its size in bytes.
+        """
+        content_length = response.headers.get("Content-Length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_bytes:
+            raise ResponseTooLarge(f"{response.url} is larger than {self.max_bytes} bytes", response.status_code)
+
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+        chunks: List[str] = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            size += len(chunk)
+            if size > self.max_bytes:
+                raise ResponseTooLarge(f"{response.url} is larger than {self.max_bytes} bytes", response.status_code)
+            chunks.append(decoder.decode(chunk))
+        chunks.append(decoder.decode(b"", final=True))
+
+        return "".join(chunks), size
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+        """Sends a GET request to <url> and returns the decoded response.
+        304 Not Modified is returned with an empty body. Raises FetchError
+        if the request fails after all retries or returns an error status.
+        """
+        session = self.session(urlparse(url).netloc)
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            status = None
+            first_byte = None
+            retry_after = None
+            try:
+                with session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+                    first_byte = time.monotonic() - started
+                    status = response.status_code
+                    retry_after = response.headers.get("Retry-After")
+
+                    if status not in RETRY_STATUSES:
+                        if status >= 400:
+                            raise FetchError(f"{url} returned {status} {response.reason}", status)
+                        text, size = self._read_body(response) if status != 304 else ("", 0)
+                        timing = self._record(url, status, attempt, first_byte, started, size)
+                        return HttpResponse(url=response.url, status=status, headers=response.headers, text=text,
+                                            timing=timing)
+                    error = FetchError(f"{url} returned {status} {response.reason}", status)
+            except FetchError:
+                self._record(url, status, attempt, first_byte, started, 0)
+                raise
+            except requests.exceptions.RequestException as e:
+                error = FetchError(f"Connection denied: {e}")
+
+            if attempt > self.max_retries:
+                self._record(url, status, attempt, first_byte, started, 0)
+                raise error
+
+            delay = self._get_delay(attempt, retry_after)
+            logger.info(f"Retrying {url} in {delay:.2f}s after: {error}")
+            time.sleep(delay)
+
+    def _record(
+            self,
+            url: str,
+            status: Optional[int],
+            attempts: int,
+            first_byte: Optional[float],
+            started: float,
+            size: int
+    ) -> RequestTiming:
+        timing = RequestTiming(
+            url=url,
+            status=status,
+            attempts=attempts,
+            first_byte=first_byte,
+            total=time.monotonic() - started,
+            size=size
+        )
+        self.timings.append(timing)
+        logger.debug(f"GET {url}: {timing}")
+        return timing
+
+
+_default_client: Optional[HttpClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> HttpClient:
+    """Returns the process-wide HTTP client, creating it on first use."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
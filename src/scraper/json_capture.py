@@ -0,0 +1,73 @@
+import re
+import json
+import time
+import base64
+from typing import Dict, Optional
+
+
+class PayloadNotCaptured(Exception):
+    """Raised if the page did not load a matching JSON payload in time."""
+
+
+def _get_network_events(driver):
+    """Yields the Network.* events from the browser's performance log since the last call."""
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        if message.get("method", "").startswith("Network."):
+            yield message["method"], message.get("params", {})
+
+
+def _get_response_body(driver, request_id: str) -> str:
+    response = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+    if response.get("base64Encoded"):
+        return base64.b64decode(response["body"]).decode("utf-8")
+    return response["body"]
+
+
+def capture_json_payload(
+        driver,
+        url: str,
+        url_pattern: str,
+        timeout: float = 10,
+        poll_interval: float = 0.2
+) -> str:
+    """Loads <url> in <driver> and returns the body of the first JSON response
+    whose URL matches <url_pattern>, as soon as it has finished loading.
+
+    The driver must record Chrome's performance log (see chrome_driver_factory).
+    The page does not need to finish rendering, and its DOM is never read.
+    Raises PayloadNotCaptured if there is no such response within <timeout> seconds.
+    """
+    pattern = re.compile(url_pattern)
+
+    # Discards events of pages that were loaded before with this driver
+    driver.get_log("performance")
+    driver.get(url)
+
+    # Matching JSON responses by request id, until they finished loading
+    pending: Dict[str, str] = {}
+    deadline = time.monotonic() + timeout
+    while True:
+        for method, params in _get_network_events(driver):
+            if method == "Network.responseReceived":
+                response = params["response"]
+                if "json" in response.get("mimeType", "") and pattern.search(response["url"]):
+                    pending[params["requestId"]] = response["url"]
+            elif method == "Network.loadingFinished" and params["requestId"] in pending:
+                return _get_response_body(driver, params["requestId"])
+
+        if time.monotonic() >= deadline:
+            raise PayloadNotCaptured(f"No JSON response matching '{url_pattern}' was loaded by {url}.")
+        time.sleep(poll_interval)
+
+
+def get_path(payload, path) -> Optional[object]:
+    """Returns the value at <path> (a sequence of keys and list indices) in <payload>,
+    or None if it does not exist.
+    """
+    for key in path:
+        try:
+            payload = payload[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return payload
@@ -0,0 +1,94 @@
+import re
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+
+OptionValue = Union[str, int, float]
+
+NUMBER_PATTERN = re.compile(r"-?\d+(?:[.,]\d+)?")
+
+
+def to_number(value: str) -> OptionValue:
+    """Returns the first number in <value> (e.g. 1.6 for '1.6mm'), as int if it has no decimals.
+    Raises ValueError if there is none.
+    """
+    match = NUMBER_PATTERN.search(value)
+    if match is None:
+        raise ValueError(f"'{value}' does not contain a number.")
+    number = float(match.group().replace(",", "."))
+    return int(number) if number.is_integer() else number
+
+
+def to_choice(value: str) -> str:
+    """Returns <value> with collapsed whitespace, in lower case."""
+    return " ".join(value.split()).lower()
+
+
+class OptionMapping(NamedTuple):
+    """How a scraped option is stored in the internal schema.
+
+    <kind> is "choices" (all scraped values) or "range" (minimum and maximum
+    of the scraped values), and <convert> turns a scraped button text into a value.
+    """
+    label: str
+    kind: str
+    convert: Callable[[str], OptionValue]
+
+
+# Maps the option labels scraped from each shop to internal option labels
+OPTION_MAPPINGS: Dict[str, Dict[str, OptionMapping]] = {
+    "JLCPCB": {
+        "Base Material": OptionMapping("baseMaterial", "choices", to_choice),
+        "Layers": OptionMapping("layers", "choices", to_number),
+        "Different Design": OptionMapping("num_designs", "choices", to_number),
+        "PCB Qty": OptionMapping("quantity", "choices", to_number),
+        "PCB Thickness": OptionMapping("thickness", "choices", to_number),
+        "PCB Color": OptionMapping("color", "choices", to_choice),
+        "Surface Finish": OptionMapping("surfaceFinish", "choices", to_choice),
+        "Outer Copper Weight": OptionMapping("copperWeight", "choices", to_number),
+        "Castellated Holes": OptionMapping("castellatedHoles", "choices", to_choice),
+    },
+}
+
+
+class NormalizedOptions(NamedTuple):
+    attribute_options: dict
+    # Scraped labels without a mapping, and (label, value) pairs that could not be converted
+    unmapped_labels: List[str]
+    invalid_values: List[Tuple[str, str]]
+
+
+def normalize_options(
+        scraped_options: Dict[str, Optional[List[str]]],
+        mappings: Dict[str, OptionMapping]
+) -> NormalizedOptions:
+    """Converts scraped options (label -> list of button texts) into the
+    internal schema ({label: {"choices": [...]}} or {label: {"range": {"min", "max"}}}).
+
+    Choices are deduplicated and sorted, so that the same offer always results
+    in the same options. Labels without values are skipped.
+    """
+    attribute_options = {}
+    unmapped_labels = []
+    invalid_values = []
+
+    for scraped_label, scraped_values in scraped_options.items():
+        mapping = mappings.get(scraped_label)
+        if mapping is None:
+            unmapped_labels.append(scraped_label)
+            continue
+
+        values = set()
+        for scraped_value in scraped_values or []:
+            try:
+                values.add(mapping.convert(scraped_value))
+            except ValueError:
+                invalid_values.append((scraped_label, scraped_value))
+        if not values:
+            continue
+
+        if mapping.kind == "range":
+            attribute_options[mapping.label] = {"range": {"min": min(values), "max": max(values)}}
+        else:
+            attribute_options[mapping.label] = {"choices": sorted(values)}
+
+    return NormalizedOptions(attribute_options, unmapped_labels, invalid_values)
@@ -0,0 +1,58 @@
+import time
+from typing import Optional
+
+
+class RenderTimeout(Exception):
+    """Raised if a page is not ready within the timeout."""
+
+
+# Number of option buttons in the container, or null if the container is not rendered yet
+OPTION_COUNT_SCRIPT = """
+var container = document.querySelector(arguments[0]);
+return container ? container.querySelectorAll(arguments[1]).length : null;
+"""
+
+
+def wait_for_stable_count(
+        driver,
+        container_selector: str,
+        item_selector: str = "button",
+        timeout: float = 10,
+        initial_delay: float = 0.05,
+        max_delay: float = 0.5,
+        backoff: float = 1.5,
+        stable_polls: int = 2
+) -> float:
+    """Polls the page until <container_selector> exists and the number of
+    <item_selector> elements within it is positive and the same for
+    <stable_polls> consecutive polls.
+
+    The delay between polls starts at <initial_delay> seconds and grows by
+    <backoff> up to <max_delay>. Returns the seconds it took until the page
+    was ready. Raises RenderTimeout after <timeout> seconds.
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    delay = initial_delay
+
+    last_count: Optional[int] = None
+    repetitions = 0
+
+    while True:
+        count = driver.execute_script(OPTION_COUNT_SCRIPT, container_selector, item_selector)
+        if count and count == last_count:
+            repetitions += 1
+        else:
+            repetitions = 1 if count else 0
+        last_count = count
+
+        if repetitions >= stable_polls:
+            return time.monotonic() - started
+
+        now = time.monotonic()
+        if now >= deadline:
+            raise RenderTimeout(
+                f"'{container_selector}' was not ready after {timeout} seconds (last count: {count})."
+            )
+        time.sleep(min(delay, deadline - now))
+        delay = min(delay * backoff, max_delay)
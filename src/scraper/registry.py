@@ -0,0 +1,38 @@
+from typing import Dict, Iterable, Type
+
+from .web_scrapers import Crawler, JLCCrawler, JLCJsonCrawler
+
+
+# "dom" crawlers render the shop's page and scrape it, "json" crawlers
+# read the JSON data that the page renders its options from
+CRAWL_MODES = ["dom", "json"]
+
+# Maps ExternalShop names to the crawlers of their websites, per crawl mode
+CRAWLERS: Dict[str, Dict[str, Type[Crawler]]] = {
+    "dom": {
+        "JLCPCB": JLCCrawler,
+    },
+    "json": {
+        "JLCPCB": JLCJsonCrawler,
+    },
+}
+
+
+def register_crawler(shop_name: str, crawler_class: Type[Crawler], mode: str = "dom") -> None:
+    """Makes <crawler_class> the crawler of the external shop with the given name in <mode>."""
+    CRAWLERS[mode][shop_name] = crawler_class
+
+
+def get_crawler_class(shop_name: str, mode: str = "dom") -> Type[Crawler]:
+    """Returns the crawler of the external shop with the given name in <mode>.
+    Raises LookupError if the shop has none.
+    """
+    try:
+        return CRAWLERS[mode][shop_name]
+    except KeyError:
+        raise LookupError(f"There is no {mode} crawler for the shop '{shop_name}'.")
+
+
+def get_crawlable_shops(shop_names: Iterable[str], mode: str = "dom") -> Dict[str, Type[Crawler]]:
+    """Returns the crawlers of all given shops that have one in <mode>, keyed by shop name."""
+    return {name: CRAWLERS[mode][name] for name in shop_names if name in CRAWLERS[mode]}
@@ -0,0 +1,224 @@
+import json
+import time
+import argparse
+import pathlib
+import statistics
+import tracemalloc
+from typing import Dict, List, NamedTuple, Optional, Type
+
+from .registry import get_crawler_class
+from .web_scrapers import PARSE_MODES, Crawler, JsonCrawler
+
+
+CORPUS_DIR = pathlib.Path(__file__).parent / "corpus"
+
+
+class ReplayCase(NamedTuple):
+    """A saved page together with the options that should be extracted from it.
+
+    Each case is a directory in the corpus:
+
+        <corpus>/<case>/page.html       the (rendered) page, or page.json for JSON crawlers
+        <corpus>/<case>/expected.json   {"shop": <ExternalShop name>, "options": {<label>: [<values>]}}
+
+    expected.json may also name the crawl <mode> (see scraper.registry), which defaults to "dom".
+    """
+    name: str
+    shop: str
+    page_path: pathlib.Path
+    expected: Dict[str, Optional[List[str]]]
+    mode: str = "dom"
+
+    def read_html(self) -> str:
+        return self.page_path.read_text(encoding="utf-8")
+
+
+class ReplayResult(NamedTuple):
+    case: str
+    parse_mode: str
+    options: Dict[str, Optional[List[str]]]
+    # Expected labels that were not extracted, extracted labels that were
+    # not expected, and labels whose values differ from the expected ones
+    missing: List[str]
+    unexpected: List[str]
+    mismatched: List[str]
+
+    @property
+    def accuracy(self) -> float:
+        """Share of all expected and extracted labels whose values were extracted correctly."""
+        total = len(self.options) + len(self.missing)
+        if total == 0:
+            return 1.0
+        return (total - len(self.missing) - len(self.unexpected) - len(self.mismatched)) / total
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing or self.unexpected or self.mismatched)
+
+
+class BenchmarkResult(NamedTuple):
+    replay: ReplayResult
+    # Median seconds to parse the page and to extract the options from it
+    parse_time: float
+    extract_time: float
+    # Peak memory in bytes allocated while parsing and extracting
+    peak_memory: int
+
+
+def load_case(case_dir: pathlib.Path) -> ReplayCase:
+    expected = json.loads((case_dir / "expected.json").read_text(encoding="utf-8"))
+    page_path = case_dir / "page.json"
+    if not page_path.exists():
+        page_path = case_dir / "page.html"
+
+    return ReplayCase(
+        name=case_dir.name,
+        shop=expected["shop"],
+        page_path=page_path,
+        expected=expected["options"],
+        mode=expected.get("mode", "dom")
+    )
+
+
+def load_corpus(corpus_dir: pathlib.Path = CORPUS_DIR) -> List[ReplayCase]:
+    """Returns all cases in <corpus_dir>, ordered by name."""
+    return [
+        load_case(case_dir)
+        for case_dir in sorted(corpus_dir.iterdir())
+        if (case_dir / "expected.json").exists()
+    ]
+
+
+def save_case(
+        corpus_dir: pathlib.Path,
+        name: str,
+        shop: str,
+        html: str,
+        options: Dict[str, Optional[List[str]]]
+) -> ReplayCase:
+    """Adds a case to the corpus, e.g. a freshly crawled page together with its
+    extracted options. The options should be checked by hand before committing the case.
+    """
+    case_dir = corpus_dir / name
+    case_dir.mkdir(parents=True, exist_ok=True)
+    (case_dir / "page.html").write_text(html, encoding="utf-8")
+    (case_dir / "expected.json").write_text(
+        json.dumps({"shop": shop, "options": options}, indent=4, ensure_ascii=False) + "\n",
+        encoding="utf-8"
+    )
+    return load_case(case_dir)
+
+
+def compare_options(case: ReplayCase, parse_mode: str, options: Dict[str, Optional[List[str]]]) -> ReplayResult:
+    return ReplayResult(
+        case=case.name,
+        parse_mode=parse_mode,
+        options=options,
+        missing=[label for label in case.expected if label not in options],
+        unexpected=[label for label in options if label not in case.expected],
+        mismatched=[
+            label for label, values in options.items()
+            if label in case.expected and values != case.expected[label]
+        ]
+    )
+
+
+def replay(case: ReplayCase, crawler_class: Optional[Type[Crawler]] = None, parse_mode: str = "fast") -> ReplayResult:
+    """Extracts the options from the case's page with <crawler_class>, without
+    a browser or network, and compares them with the expected options.
+    Defaults to the crawler registered for the case's shop.
+    """
+    crawler_class = crawler_class or get_crawler_class(case.shop, case.mode)
+    crawler = crawler_class(parse_mode=parse_mode, html=case.read_html())
+    return compare_options(case, parse_mode, crawler.get_board_options())
+
+
+def benchmark(
+        case: ReplayCase,
+        crawler_class: Optional[Type[Crawler]] = None,
+        parse_mode: str = "fast",
+        repeat: int = 20
+) -> BenchmarkResult:
+    """Replays the case <repeat> times for timing and once more under
+    tracemalloc, which slows parsing down too much to be timed at the same time.
+    """
+    crawler_class = crawler_class or get_crawler_class(case.shop, case.mode)
+    html = case.read_html()
+
+    parse_times, extract_times = [], []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        crawler = crawler_class(parse_mode=parse_mode, html=html)
+        crawler.payload if isinstance(crawler, JsonCrawler) else crawler.doc
+        parsed = time.perf_counter()
+        options = crawler.get_board_options()
+        extracted = time.perf_counter()
+
+        parse_times.append(parsed - started)
+        extract_times.append(extracted - parsed)
+
+    tracemalloc.start()
+    try:
+        crawler_class(parse_mode=parse_mode, html=html).get_board_options()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        replay=compare_options(case, parse_mode, options),
+        parse_time=statistics.median(parse_times),
+        extract_time=statistics.median(extract_times),
+        peak_memory=peak_memory
+    )
+
+
+def print_replay(result: ReplayResult) -> None:
+    status = "ok" if result.ok else "FAILED"
+    print(f"{result.case} [{result.parse_mode}]: {status}, accuracy {result.accuracy:.0%}")
+    for problem in ["missing", "unexpected", "mismatched"]:
+        labels = getattr(result, problem)
+        if labels:
+            print(f"  {problem}: {', '.join(labels)}")
+
+
+def print_benchmark(result: BenchmarkResult) -> None:
+    print_replay(result.replay)
+    print(
+        f"  parse {result.parse_time * 1000:8.2f} ms"
+        f"  extract {result.extract_time * 1000:8.2f} ms"
+        f"  peak memory {result.peak_memory / 1024:8.0f} KiB"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Replay the saved pages of the scraper corpus. Run it from the src directory "
+                    "with `python -m scraper.replay`."
+    )
+    parser.add_argument("corpus", nargs="?", type=pathlib.Path, default=CORPUS_DIR)
+    parser.add_argument("--parse-mode", choices=PARSE_MODES, action="append", help="Default: all parse modes")
+    parser.add_argument("--benchmark", action="store_true", help="Also report parse time and memory peak")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--record", metavar="SHOP", help="Crawl the shop and add its page as a new case first")
+    args = parser.parse_args()
+
+    if args.record:
+        crawler = get_crawler_class(args.record)()
+        fetched = time.strftime("%Y%m%d")
+        new_case = save_case(args.corpus, f"{args.record.lower()}_{fetched}", args.record, crawler.html,
+                             crawler.get_board_options())
+        print(f"Saved {new_case.page_path.parent}, check its expected.json before committing it.")
+
+    all_ok = True
+    for replay_case in load_corpus(args.corpus):
+        for mode in args.parse_mode or PARSE_MODES:
+            if args.benchmark:
+                benchmark_result = benchmark(replay_case, parse_mode=mode, repeat=args.repeat)
+                print_benchmark(benchmark_result)
+                all_ok &= benchmark_result.replay.ok
+            else:
+                replay_result = replay(replay_case, parse_mode=mode)
+                print_replay(replay_result)
+                all_ok &= replay_result.ok
+
+    raise SystemExit(0 if all_ok else 1)
@@ -0,0 +1,143 @@
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, List, NamedTuple, Optional, Type
+from urllib.parse import urlparse
+
+from .web_scrapers import Crawler
+from .snapshots import SnapshotStore, crawl_with_snapshot
+
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlResult(NamedTuple):
+    shop: str
+    # None if the crawl failed or the options did not change since the last snapshot
+    options: Optional[dict]
+    error: Optional[str]
+    # Seconds spent waiting for the host's concurrency and rate limits
+    waited: float
+    # Seconds spent crawling
+    duration: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def unchanged(self) -> bool:
+        return self.ok and self.options is None
+
+
+class HostLimiter:
+    """Limits the number of concurrent crawls per host to <max_concurrency>
+    and spaces their starts at least <min_interval> seconds apart.
+    """
+    def __init__(self, max_concurrency: int = 1, min_interval: float = 1.0):
+        self.max_concurrency = max_concurrency
+        self.min_interval = min_interval
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._last_start: Dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str):
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self.max_concurrency))
+        lock = self._locks.setdefault(host, asyncio.Lock())
+
+        async with semaphore:
+            async with lock:
+                wait = self._last_start.get(host, float("-inf")) + self.min_interval - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._last_start[host] = time.monotonic()
+            yield
+
+
+CrawlFunction = Callable[[str, Type[Crawler]], Optional[dict]]
+
+
+def crawl(
+        shop: str,
+        crawler_class: Type[Crawler],
+        store: Optional[SnapshotStore] = None,
+        unsaved: Optional[Dict[str, Crawler]] = None,
+        mode: str = "dom"
+) -> Optional[dict]:
+    """Fetches the shop's page and returns the board options found on it.
+
+    With a snapshot <store>, the page is stored and None is returned without
+    parsing the options if its option section did not change since the last crawl
+    in the same crawl <mode>.
+    With <unsaved>, the page is not stored yet. Its crawler is put in <unsaved>
+    instead, to be stored with save_snapshot() once its options were processed.
+    """
+    if store is None:
+        return crawler_class().get_board_options()
+
+    crawler, changed = crawl_with_snapshot(shop, crawler_class, store, save=unsaved is None, mode=mode)
+    if unsaved is not None and changed:
+        unsaved[shop] = crawler
+    return crawler.get_board_options() if changed else None
+
+
+async def crawl_shop(
+        shop: str,
+        crawler_class: Type[Crawler],
+        limiter: HostLimiter,
+        executor: ThreadPoolExecutor,
+        crawl_function: CrawlFunction = crawl
+) -> CrawlResult:
+    """Crawls a single shop in <executor>, once its host has a free slot.
+    Failures are returned as part of the result instead of being raised.
+    """
+    host = urlparse(crawler_class.url).hostname
+    loop = asyncio.get_running_loop()
+    requested = time.monotonic()
+
+    async with limiter.slot(host):
+        started = time.monotonic()
+        try:
+            options = await loop.run_in_executor(executor, crawl_function, shop, crawler_class)
+            error = None
+        except Exception as e:
+            logger.exception(f"Crawling {shop} failed")
+            options = None
+            error = f"{type(e).__name__}: {e}"
+
+    return CrawlResult(
+        shop=shop,
+        options=options,
+        error=error,
+        waited=started - requested,
+        duration=time.monotonic() - started
+    )
+
+
+async def crawl_shops(
+        crawlers: Dict[str, Type[Crawler]],
+        max_per_host: int = 1,
+        min_interval: float = 1.0,
+        crawl_function: CrawlFunction = crawl
+) -> List[CrawlResult]:
+    """Crawls all shops in <crawlers> concurrently. The blocking browser and
+    parsing work runs in a thread per shop, so the total time is that of
+    the slowest shop, as long as the shops are on different hosts.
+    """
+    if not crawlers:
+        return []
+
+    limiter = HostLimiter(max_per_host, min_interval)
+    with ThreadPoolExecutor(max_workers=len(crawlers), thread_name_prefix="crawler") as executor:
+        return list(await asyncio.gather(*(
+            crawl_shop(shop, crawler_class, limiter, executor, crawl_function)
+            for shop, crawler_class in crawlers.items()
+        )))
+
+
+def run_crawls(crawlers: Dict[str, Type[Crawler]], **kwargs) -> List[CrawlResult]:
+    """Synchronous entry point for crawl_shops()."""
+    return asyncio.run(crawl_shops(crawlers, **kwargs))
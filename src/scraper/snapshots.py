@@ -0,0 +1,124 @@
+import gzip
+import json
+import datetime
+import pathlib
+from typing import List, NamedTuple, Optional, Tuple, Type
+
+from .web_scrapers import Crawler
+
+
+class Snapshot(NamedTuple):
+    shop: str
+    fetched: str
+    path: pathlib.Path
+    content_hash: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def read_html(self) -> str:
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            return f.read()
+
+
+class SnapshotStore:
+    """Keeps fetched pages gzipped on disk, one directory per shop and crawl
+    mode (see scraper.registry) and one file per fetch, named by its UTC fetch time:
+
+        <root>/<shop>/<mode>/<fetch time>.html.gz
+        <root>/<shop>/<mode>/latest.json     metadata of the most recent snapshot
+
+    The modes fetch different pages of a shop, whose hashes and ETags must not
+    be compared with each other. Only the newest <keep> snapshots of each shop
+    and mode are kept.
+    """
+    def __init__(self, root, keep: int = 30):
+        self.root = pathlib.Path(root)
+        self.keep = keep
+
+    def _shop_dir(self, shop: str, mode: str) -> pathlib.Path:
+        return self.root / "".join(c if c.isalnum() or c in "-_" else "_" for c in shop) / mode
+
+    def latest(self, shop: str, mode: str = "dom") -> Optional[Snapshot]:
+        """Returns the most recent snapshot of the shop in <mode>, or None if there is none."""
+        index = self._shop_dir(shop, mode) / "latest.json"
+        if not index.exists():
+            return None
+
+        metadata = json.loads(index.read_text())
+        return Snapshot(shop=shop, path=self._shop_dir(shop, mode) / metadata.pop("file"), **metadata)
+
+    def save(
+            self,
+            shop: str,
+            html: str,
+            digest: str,
+            etag: Optional[str] = None,
+            last_modified: Optional[str] = None,
+            mode: str = "dom"
+    ) -> Snapshot:
+        """Stores <html> as the newest snapshot of the shop in <mode>."""
+        shop_dir = self._shop_dir(shop, mode)
+        shop_dir.mkdir(parents=True, exist_ok=True)
+
+        fetched = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%S.%fZ")
+        path = shop_dir / f"{fetched}.html.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(html)
+
+        metadata = {
+            "file": path.name,
+            "fetched": fetched,
+            "content_hash": digest,
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        # Written to a temporary file first, so that readers never see a partial index
+        index = shop_dir / "latest.json"
+        temporary_index = shop_dir / "latest.json.tmp"
+        temporary_index.write_text(json.dumps(metadata))
+        temporary_index.replace(index)
+
+        self._prune(shop_dir)
+        return self.latest(shop, mode)
+
+    def _prune(self, shop_dir: pathlib.Path) -> None:
+        snapshots = sorted(shop_dir.glob("*.html.gz"))
+        for path in snapshots[:-self.keep]:
+            path.unlink()
+
+    def history(self, shop: str, mode: str = "dom") -> List[pathlib.Path]:
+        """Returns the paths of all stored snapshots of the shop in <mode>, oldest first."""
+        return sorted(self._shop_dir(shop, mode).glob("*.html.gz"))
+
+
+def save_snapshot(shop: str, crawler: Crawler, store: SnapshotStore, mode: str = "dom") -> Snapshot:
+    """Stores the crawler's page as the newest snapshot of the shop in <mode>."""
+    return store.save(shop, crawler.html, crawler.get_content_hash(), crawler.etag, crawler.last_modified, mode)
+
+
+def crawl_with_snapshot(
+        shop: str,
+        crawler_class: Type[Crawler],
+        store: SnapshotStore,
+        save: bool = True,
+        mode: str = "dom"
+) -> Tuple[Crawler, bool]:
+    """Fetches the shop's page, stores it as a new snapshot and returns the crawler
+    together with whether the option section changed since the last snapshot
+    in the crawl <mode> of <crawler_class>.
+
+    The crawler's page is not parsed beyond what its content hash needs. Pages
+    that the server reports as not modified are not stored again. Without <save>,
+    the page is not stored either, so that the caller can store it with
+    save_snapshot() only once it has processed the options.
+    """
+    last_snapshot = store.latest(shop, mode)
+    crawler = crawler_class(last_snapshot=last_snapshot)
+
+    if crawler.not_modified:
+        return crawler, False
+
+    digest = crawler.get_content_hash()
+    if save:
+        store.save(shop, crawler.html, digest, crawler.etag, crawler.last_modified, mode)
+    return crawler, last_snapshot is None or digest != last_snapshot.content_hash
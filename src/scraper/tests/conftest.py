@@ -0,0 +1,169 @@
+import json
+import pathlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Sequence
+
+import pytest
+
+from src.scraper.context_managers import MEMORY_SCRIPT
+from src.scraper.replay import CORPUS_DIR
+
+
+# The saved JLC pages are shared with the replay corpus
+QUOTE_PAGE_PATH = CORPUS_DIR / "jlc_quote" / "page.html"
+OPTIONS_PAYLOAD_PATH = CORPUS_DIR / "jlc_options_json" / "page.json"
+
+
+class FakeDriver:
+    """Stand-in for a selenium driver that serves local HTML pages.
+
+    Every URL is answered with <page>. Memory usage grows by <memory_growth>
+    bytes per loaded page. An unresponsive driver fails health checks and
+    hangs on quit until its process is killed.
+
+    Scripts other than the memory check return the next of <option_counts>,
+    which simulates the options of a page being rendered, and then keep
+    returning the last one.
+
+    Loading a page also "loads" the <responses> (URL -> (MIME type, saved page path)),
+    which are recorded in the performance log like Chrome does.
+    """
+    def __init__(
+            self,
+            page: pathlib.Path = QUOTE_PAGE_PATH,
+            memory_growth: int = 0,
+            responsive: bool = True,
+            option_counts: Sequence[Optional[int]] = (9,),
+            responses: Optional[Dict[str, tuple]] = None
+    ):
+        self.page_source = ""
+        self.visited: List[str] = []
+        self.memory = 1000
+        self.memory_growth = memory_growth
+        self.responsive = responsive
+        self.quit_calls = 0
+        self.page_path = page
+        self.option_counts = list(option_counts)
+        self.polls = 0
+        self.responses = responses or {}
+        self.performance_log: List[dict] = []
+        self.response_bodies: Dict[str, str] = {}
+
+        self.killed = threading.Event()
+        self.service = SimpleNamespace(process=SimpleNamespace(kill=self.killed.set))
+
+    def get(self, url: str) -> None:
+        self.visited.append(url)
+        self.page_source = self.page_path.read_text(encoding="utf-8")
+        self.memory += self.memory_growth
+
+        for response_url, (mime_type, page) in self.responses.items():
+            request_id = str(len(self.response_bodies))
+            self.response_bodies[request_id] = page.read_text(encoding="utf-8")
+            self._log("Network.responseReceived", requestId=request_id,
+                      response={"url": response_url, "mimeType": mime_type})
+            self._log("Network.loadingFinished", requestId=request_id)
+
+    def _log(self, method: str, **params) -> None:
+        message = {"message": {"method": method, "params": params}, "webview": "fake"}
+        self.performance_log.append({"level": "INFO", "message": json.dumps(message)})
+
+    def get_log(self, log_type: str) -> List[dict]:
+        entries, self.performance_log = self.performance_log, []
+        return entries
+
+    def execute_cdp_cmd(self, command: str, params: dict) -> dict:
+        return {"body": self.response_bodies[params["requestId"]], "base64Encoded": False}
+
+    def execute_script(self, script: str, *args) -> Optional[int]:
+        if not self.responsive:
+            raise RuntimeError("Browser is not responding")
+        if script == MEMORY_SCRIPT:
+            return self.memory
+
+        count = self.option_counts[min(self.polls, len(self.option_counts) - 1)]
+        self.polls += 1
+        return count
+
+    def quit(self) -> None:
+        self.quit_calls += 1
+        if not self.responsive:
+            self.killed.wait(timeout=5)
+
+
+@pytest.fixture
+def fake_driver_factory():
+    """Returns a factory for FakeDrivers that remembers every driver it created."""
+    class Factory:
+        def __init__(self):
+            self.drivers: List[FakeDriver] = []
+            self.driver_kwargs = {}
+
+        def __call__(self, page_load_timeout: float) -> FakeDriver:
+            driver = FakeDriver(**self.driver_kwargs)
+            self.drivers.append(driver)
+            return driver
+
+    return Factory()
+
+
+class LocalShop:
+    """Stand-in for an external shop, served by a local HTTP server.
+
+    <pages> maps paths to (content type, body) pairs. Responses carry an ETag
+    derived from the body, and conditional requests with a matching
+    If-None-Match header are answered with 304 Not Modified.
+    <failures> maps paths to statuses that the next requests to them are answered with.
+    """
+    def __init__(self):
+        self.pages: Dict[str, tuple] = {}
+        self.failures: Dict[str, List[int]] = {}
+        self.requests: List[dict] = []
+
+        shop = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                shop.requests.append({"path": self.path, "headers": dict(self.headers)})
+                if shop.failures.get(self.path):
+                    self.send_error(shop.failures[self.path].pop(0))
+                    return
+                if self.path not in shop.pages:
+                    self.send_error(404)
+                    return
+
+                content_type, body = shop.pages[self.path]
+                etag = f'"{hash(body) & 0xffffffff:x}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def add_page(self, path: str, body: str, content_type: str = "text/html; charset=utf-8") -> str:
+        self.pages[path] = (content_type, body.encode("utf-8"))
+        return self.url + path
+
+
+@pytest.fixture
+def local_shop():
+    shop = LocalShop()
+    thread = threading.Thread(target=shop.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield shop
+    shop.server.shutdown()
+    shop.server.server_close()
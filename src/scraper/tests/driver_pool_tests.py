@@ -0,0 +1,118 @@
+import pytest
+
+from src.scraper.context_managers import WebDriver, WebDriverPool, DriverPoolExhausted
+from src.scraper.web_scrapers import JLCCrawler
+
+
+class TestWebDriverPool:
+    def test_driver_is_reused_across_leases(self, fake_driver_factory):
+        """GIVEN a driver pool
+
+        WHEN two crawls lease a driver one after the other
+
+        THEN both use the same browser, which is only launched once.
+        """
+        pool = WebDriverPool(size=2, driver_factory=fake_driver_factory)
+
+        for _ in range(2):
+            with WebDriver("Chrome", pool=pool) as driver:
+                driver.get("https://example.com")
+
+        assert len(fake_driver_factory.drivers) == 1
+        assert fake_driver_factory.drivers[0].visited == ["https://example.com"] * 2
+
+    def test_driver_is_recycled_after_max_pages(self, fake_driver_factory):
+        """GIVEN a driver pool that allows two pages per driver
+
+        WHEN three crawls lease a driver one after the other
+
+        THEN the first browser is quit after two pages and a second one is launched.
+        """
+        pool = WebDriverPool(max_pages=2, driver_factory=fake_driver_factory)
+
+        for _ in range(3):
+            with WebDriver("Chrome", pool=pool) as driver:
+                driver.get("https://example.com")
+
+        first, second = fake_driver_factory.drivers
+        assert first.quit_calls == 1
+        assert second.quit_calls == 0
+
+    def test_driver_is_recycled_on_memory_growth(self, fake_driver_factory):
+        """GIVEN a driver pool and a browser whose memory grows with every page
+
+        WHEN the memory growth exceeds the pool's limit
+
+        THEN the browser is quit and replaced.
+        """
+        fake_driver_factory.driver_kwargs = {"memory_growth": 600}
+        pool = WebDriverPool(max_memory_growth=1000, driver_factory=fake_driver_factory)
+
+        for _ in range(3):
+            with WebDriver("Chrome", pool=pool) as driver:
+                driver.get("https://example.com")
+
+        assert fake_driver_factory.drivers[0].quit_calls == 1
+
+    def test_driver_is_replaced_after_failed_lease(self, fake_driver_factory):
+        """GIVEN a driver pool
+
+        WHEN a lease ends with an exception
+
+        THEN the browser is quit and a new one is launched for the next lease.
+        """
+        pool = WebDriverPool(driver_factory=fake_driver_factory)
+
+        with pytest.raises(ValueError):
+            with WebDriver("Chrome", pool=pool):
+                raise ValueError("Page did not load")
+        with WebDriver("Chrome", pool=pool):
+            pass
+
+        assert fake_driver_factory.drivers[0].quit_calls == 1
+        assert len(fake_driver_factory.drivers) == 2
+
+    def test_hanging_driver_is_killed(self, fake_driver_factory):
+        """GIVEN a browser that fails its health check and hangs on quit
+
+        WHEN its lease ends
+
+        THEN the browser process is killed after the kill timeout.
+        """
+        fake_driver_factory.driver_kwargs = {"responsive": False}
+        pool = WebDriverPool(kill_timeout=0.05, driver_factory=fake_driver_factory)
+
+        with WebDriver("Chrome", pool=pool):
+            pass
+
+        assert fake_driver_factory.drivers[0].killed.is_set()
+
+    def test_lease_times_out_when_pool_is_exhausted(self, fake_driver_factory):
+        """GIVEN a driver pool of size one whose driver is leased
+
+        WHEN another lease is requested
+
+        THEN DriverPoolExhausted is raised after the lease timeout.
+        """
+        pool = WebDriverPool(size=1, lease_timeout=0.05, driver_factory=fake_driver_factory)
+
+        with WebDriver("Chrome", pool=pool):
+            with pytest.raises(DriverPoolExhausted):
+                pool.acquire()
+
+
+class TestJLCCrawler:
+    def test_crawler_extracts_options_from_pooled_driver(self, fake_driver_factory):
+        """GIVEN a driver pool serving a saved JLCPCB quote page
+
+        WHEN the JLC crawler collects the board options
+
+        THEN all labelled options with buttons are extracted.
+        """
+        pool = WebDriverPool(driver_factory=fake_driver_factory)
+
+        options = JLCCrawler(driver_pool=pool).get_board_options()
+
+        assert options["Base Material"] == ["FR-4", "Aluminum", "Copper Core"]
+        assert options["Layers"] == ["1", "2", "4", "6"]
+        assert options["Castellated Holes"] == ["No", "Yes"]
@@ -0,0 +1,100 @@
+import pytest
+
+from src.scraper.http_client import FetchError, HttpClient, ResponseTooLarge
+from src.scraper.web_scrapers import Crawler, CrawlerError
+
+
+def make_client(**kwargs) -> HttpClient:
+    """Returns a client that retries without waiting."""
+    return HttpClient(backoff=0, **kwargs)
+
+
+class TestHttpClient:
+    def test_page_is_decoded(self, local_shop):
+        url = local_shop.add_page("/quote", "<p>Kupfer – Ø 1,6 mm</p>")
+        client = make_client()
+
+        response = client.get(url)
+
+        assert response.status == 200
+        assert response.text == "<p>Kupfer – Ø 1,6 mm</p>"
+        assert response.timing.size == len("<p>Kupfer – Ø 1,6 mm</p>".encode("utf-8"))
+        assert list(client.timings) == [response.timing]
+
+    def test_session_is_reused_per_host(self, local_shop):
+        url = local_shop.add_page("/quote", "<p>quote</p>")
+        client = make_client()
+
+        client.get(url)
+        session = client.session(url.split("/")[2])
+        client.get(url)
+
+        assert client.session(url.split("/")[2]) is session
+        assert len(client._sessions) == 1
+
+    def test_retryable_statuses_are_retried(self, local_shop):
+        """GIVEN a shop that answers the first two requests with 503
+
+        WHEN its page is requested
+
+        THEN the request is retried and the timing counts all three attempts.
+        """
+        url = local_shop.add_page("/quote", "<p>quote</p>")
+        local_shop.failures["/quote"] = [503, 503]
+
+        response = make_client().get(url)
+
+        assert response.text == "<p>quote</p>"
+        assert response.timing.attempts == 3
+
+    def test_retries_are_limited(self, local_shop):
+        url = local_shop.add_page("/quote", "<p>quote</p>")
+        local_shop.failures["/quote"] = [503, 503, 503]
+
+        with pytest.raises(FetchError) as e:
+            make_client(max_retries=2).get(url)
+
+        assert e.value.status == 503
+        assert len(local_shop.requests) == 3
+
+    def test_client_errors_are_not_retried(self, local_shop):
+        with pytest.raises(FetchError) as e:
+            make_client().get(local_shop.url + "/missing")
+
+        assert e.value.status == 404
+        assert len(local_shop.requests) == 1
+
+    def test_large_responses_are_aborted(self, local_shop):
+        url = local_shop.add_page("/quote", "x" * 2048)
+
+        with pytest.raises(ResponseTooLarge):
+            make_client(max_bytes=1024).get(url)
+
+    def test_backoff_is_jittered_and_capped(self):
+        client = HttpClient(backoff=1, max_backoff=5)
+
+        assert all(0 <= client._get_delay(attempt) <= 5 for attempt in range(1, 10))
+        assert client._get_delay(1, retry_after="120") == 5
+
+
+class StaticCrawler(Crawler):
+    def __init__(self, url, **kwargs):
+        super().__init__(url, **kwargs)
+
+    def get_board_options(self):
+        return {}
+
+
+class TestCrawlerFetching:
+    def test_crawler_uses_client(self, local_shop):
+        url = local_shop.add_page("/quote", "<p>quote</p>")
+        client = make_client()
+
+        crawler = StaticCrawler(url, http_client=client)
+
+        assert crawler.html == "<p>quote</p>"
+        assert crawler.timing == client.timings[-1]
+
+    def test_fetch_errors_become_crawler_errors(self, local_shop):
+        with pytest.raises(CrawlerError):
+            StaticCrawler(local_shop.url + "/missing", http_client=make_client())
@@ -0,0 +1,97 @@
+import pytest
+
+from src.scraper.context_managers import WebDriverPool
+from src.scraper.json_capture import PayloadNotCaptured, capture_json_payload
+from src.scraper.normalization import OPTION_MAPPINGS, OptionMapping, normalize_options, to_number
+from src.scraper.web_scrapers import CrawlerError, JLCJsonCrawler, JsonCrawler
+
+from .conftest import OPTIONS_PAYLOAD_PATH, QUOTE_PAGE_PATH, FakeDriver
+
+
+OPTIONS_PAYLOAD = OPTIONS_PAYLOAD_PATH.read_text(encoding="utf-8")
+
+EXPECTED_OPTIONS = {
+    "Base Material": ["FR-4", "Aluminum", "Copper Core"],
+    "Layers": ["1", "2", "4", "6"],
+    "PCB Thickness": ["0.8", "1.0", "1.6"],
+    "Castellated Holes": ["No", "Yes"],
+    "Dimensions": ["5", "500"],
+    "Remark": None,
+}
+
+API_URL = "https://cart.jlcpcb.com/api/quote/options"
+
+
+class TestEndpointMode:
+    def test_options_are_read_from_endpoint(self, local_shop):
+        """GIVEN a shop that serves its options as JSON
+
+        WHEN they are crawled from that endpoint
+
+        THEN the options are returned in the same format as scraped from the page,
+        and normalize into choices and ranges.
+        """
+        endpoint = local_shop.add_page("/api/options", OPTIONS_PAYLOAD, "application/json")
+        crawler = JLCJsonCrawler(endpoint=endpoint)
+
+        assert crawler.get_board_options() == EXPECTED_OPTIONS
+
+        mappings = {**OPTION_MAPPINGS["JLCPCB"], "Dimensions": OptionMapping("dimensionX", "range", to_number)}
+        normalized = normalize_options(crawler.get_board_options(), mappings)
+        assert normalized.attribute_options["thickness"] == {"choices": [0.8, 1, 1.6]}
+        assert normalized.attribute_options["dimensionX"] == {"range": {"min": 5, "max": 500}}
+
+    def test_content_hash_ignores_formatting(self):
+        compact = OPTIONS_PAYLOAD.replace("\n", "").replace("    ", "")
+
+        original = JLCJsonCrawler(html=OPTIONS_PAYLOAD)
+        assert original.get_content_hash() == JLCJsonCrawler(html=compact).get_content_hash()
+
+    def test_invalid_payloads_are_rejected(self):
+        with pytest.raises(CrawlerError):
+            JLCJsonCrawler(html="<html></html>").get_board_options()
+
+        with pytest.raises(CrawlerError):
+            JLCJsonCrawler(html='{"data": {}}').get_board_options()
+
+    def test_crawler_needs_a_source(self):
+        with pytest.raises(CrawlerError):
+            type("UnconfiguredCrawler", (JsonCrawler,), {})(url="https://example.com")
+
+
+class TestCaptureMode:
+    def test_payload_is_captured_from_network_log(self, fake_driver_factory):
+        """GIVEN a quote page that loads its options from the shop's API
+
+        WHEN it is crawled in capture mode
+
+        THEN the options are read from the captured API response.
+        """
+        fake_driver_factory.driver_kwargs = {"responses": {
+            "https://cart.jlcpcb.com/static/app.js": ("application/javascript", QUOTE_PAGE_PATH),
+            API_URL: ("application/json", OPTIONS_PAYLOAD_PATH),
+        }}
+        pool = WebDriverPool(size=1, driver_factory=fake_driver_factory)
+
+        crawler = JLCJsonCrawler(driver_pool=pool)
+
+        assert crawler.get_board_options() == EXPECTED_OPTIONS
+        assert fake_driver_factory.drivers[0].visited == [JLCJsonCrawler.url]
+
+    def test_missing_payload_times_out(self):
+        driver = FakeDriver(responses={"https://example.com/data.json": ("application/json", OPTIONS_PAYLOAD_PATH)})
+
+        with pytest.raises(PayloadNotCaptured):
+            capture_json_payload(driver, "https://example.com", r"/api/", timeout=0.1, poll_interval=0.01)
+
+    def test_missing_payload_does_not_discard_driver(self, fake_driver_factory):
+        pool = WebDriverPool(size=1, driver_factory=fake_driver_factory)
+
+        class SlowCrawler(JLCJsonCrawler):
+            capture_timeout = 0.1
+
+        with pytest.raises(CrawlerError):
+            SlowCrawler(driver_pool=pool)
+
+        assert len(fake_driver_factory.drivers) == 1
+        assert fake_driver_factory.drivers[0].quit_calls == 0
@@ -0,0 +1,58 @@
+import pytest
+
+from src.scraper.normalization import OPTION_MAPPINGS, OptionMapping, normalize_options, to_choice, to_number
+from src.scraper.web_scrapers import JLCCrawler
+
+from .conftest import QUOTE_PAGE_PATH
+
+
+class TestConverters:
+    @pytest.mark.parametrize("value, expected", [("2", 2), ("1.6mm", 1.6), ("0,8 mm", 0.8), ("1 oz", 1)])
+    def test_to_number(self, value, expected):
+        assert to_number(value) == expected
+
+    def test_to_number_without_number(self):
+        with pytest.raises(ValueError):
+            to_number("none")
+
+    def test_to_choice(self):
+        assert to_choice("  HASL   with lead ") == "hasl with lead"
+
+
+class TestNormalizeOptions:
+    def test_choices_are_sorted_and_deduplicated(self):
+        normalized = normalize_options(
+            {"Layers": ["4", "1", "2", "2"], "PCB Color": ["Green", "Red", "green"]},
+            OPTION_MAPPINGS["JLCPCB"]
+        )
+        assert normalized.attribute_options == {
+            "layers": {"choices": [1, 2, 4]},
+            "color": {"choices": ["green", "red"]},
+        }
+
+    def test_range_options(self):
+        mappings = {"Dimensions": OptionMapping("dimensionX", "range", to_number)}
+        normalized = normalize_options({"Dimensions": ["100", "5", "500"]}, mappings)
+        assert normalized.attribute_options == {"dimensionX": {"range": {"min": 5, "max": 500}}}
+
+    def test_unmapped_and_invalid_values_are_reported(self):
+        normalized = normalize_options(
+            {"Layers": ["2", "many"], "Gold Fingers": ["Yes"], "Dimensions": None},
+            OPTION_MAPPINGS["JLCPCB"]
+        )
+        assert normalized.attribute_options == {"layers": {"choices": [2]}}
+        assert normalized.unmapped_labels == ["Gold Fingers", "Dimensions"]
+        assert normalized.invalid_values == [("Layers", "many")]
+
+    def test_saved_page(self):
+        """GIVEN the options scraped from a saved JLCPCB quote page
+
+        WHEN they are normalized
+
+        THEN the known options are converted and the others are reported.
+        """
+        html = QUOTE_PAGE_PATH.read_text(encoding="utf-8")
+        normalized = normalize_options(JLCCrawler(html=html).get_board_options(), OPTION_MAPPINGS["JLCPCB"])
+
+        assert set(normalized.attribute_options) == {"baseMaterial", "layers", "castellatedHoles"}
+        assert normalized.unmapped_labels == ["Dimensions"]
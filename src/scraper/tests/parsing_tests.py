@@ -0,0 +1,41 @@
+import pytest
+
+from src.scraper.web_scrapers import JLCCrawler
+
+from .conftest import QUOTE_PAGE_PATH
+
+
+@pytest.fixture
+def quote_page() -> str:
+    return QUOTE_PAGE_PATH.read_text(encoding="utf-8")
+
+
+class TestParseModes:
+    def test_fast_mode_only_parses_option_container(self, quote_page):
+        """GIVEN a saved JLCPCB quote page
+
+        WHEN it is parsed in fast mode
+
+        THEN the document only contains the option container, not the rest of the page.
+        """
+        crawler = JLCCrawler(parse_mode="fast", html=quote_page)
+
+        assert crawler.doc.find("div", class_="home-orderadd-pcb") is not None
+        assert crawler.doc.find("footer") is None
+
+    def test_parse_modes_extract_same_options(self, quote_page):
+        """GIVEN a saved JLCPCB quote page
+
+        WHEN the board options are extracted in full and in fast mode
+
+        THEN both modes return the same options.
+        """
+        full = JLCCrawler(parse_mode="full", html=quote_page).get_board_options()
+        fast = JLCCrawler(parse_mode="fast", html=quote_page).get_board_options()
+
+        assert full == fast
+        assert full["Layers"] == ["1", "2", "4", "6"]
+
+    def test_unknown_parse_mode_is_rejected(self, quote_page):
+        with pytest.raises(ValueError):
+            JLCCrawler(parse_mode="regex", html=quote_page)
@@ -0,0 +1,50 @@
+import pytest
+
+from src.scraper.readiness import RenderTimeout, wait_for_stable_count
+from src.scraper.web_scrapers import JLCCrawler
+from src.scraper.context_managers import WebDriverPool
+
+from .conftest import FakeDriver
+
+
+class TestWaitForStableCount:
+    def test_waits_until_option_count_is_stable(self):
+        """GIVEN a page whose options are rendered step by step
+
+        WHEN waiting for the page to be ready
+
+        THEN the wait ends once the option count has stopped changing.
+        """
+        driver = FakeDriver(option_counts=[None, None, 3, 9, 9, 12])
+
+        latency = wait_for_stable_count(driver, ".home-orderadd-pcb", initial_delay=0.001)
+
+        assert driver.polls == 5
+        assert latency >= 0
+
+    def test_raises_if_container_never_appears(self):
+        """GIVEN a page that never renders the option container
+
+        WHEN waiting for the page to be ready
+
+        THEN RenderTimeout is raised after the timeout.
+        """
+        driver = FakeDriver(option_counts=[None])
+
+        with pytest.raises(RenderTimeout):
+            wait_for_stable_count(driver, ".home-orderadd-pcb", timeout=0.05, initial_delay=0.01)
+
+
+class TestJLCCrawlerRenderLatency:
+    def test_render_latency_is_recorded(self, fake_driver_factory):
+        """GIVEN a driver pool serving a saved JLCPCB quote page
+
+        WHEN the JLC crawler fetches the page
+
+        THEN the page load and render latencies are recorded.
+        """
+        crawler = JLCCrawler(driver_pool=WebDriverPool(driver_factory=fake_driver_factory))
+
+        assert crawler.page_load_latency is not None
+        assert crawler.render_latency is not None
+        assert crawler.render_latency < JLCCrawler.render_timeout
@@ -0,0 +1,57 @@
+from src.scraper.replay import CORPUS_DIR, benchmark, load_corpus, replay, save_case
+from src.scraper.web_scrapers import PARSE_MODES, JLCCrawler
+
+from .conftest import QUOTE_PAGE_PATH
+
+
+QUOTE_PAGE = QUOTE_PAGE_PATH.read_text(encoding="utf-8")
+
+
+class TestCorpus:
+    def test_bundled_corpus_is_extracted_correctly(self):
+        """GIVEN the bundled corpus of saved shop pages
+
+        WHEN every case is replayed in every parse mode
+
+        THEN the extracted options equal the expected ones.
+        """
+        cases = load_corpus(CORPUS_DIR)
+        assert cases
+
+        for case in cases:
+            for parse_mode in PARSE_MODES:
+                result = replay(case, parse_mode=parse_mode)
+                assert result.ok, result
+                assert result.accuracy == 1.0
+
+    def test_differences_are_reported(self, tmp_path):
+        """GIVEN a case whose expected options differ from the page
+
+        WHEN it is replayed
+
+        THEN missing, unexpected and mismatched labels are reported.
+        """
+        options = JLCCrawler(html=QUOTE_PAGE).get_board_options()
+        options["Layers"] = ["1", "2"]
+        options["PCB Color"] = ["Green"]
+        del options["Dimensions"]
+        case = save_case(tmp_path, "changed", "JLCPCB", QUOTE_PAGE, options)
+
+        result = replay(case, JLCCrawler)
+
+        assert not result.ok
+        assert result.missing == ["PCB Color"]
+        assert result.unexpected == ["Dimensions"]
+        assert result.mismatched == ["Layers"]
+        assert result.accuracy == 2 / 5
+
+    def test_benchmark(self, tmp_path):
+        options = JLCCrawler(html=QUOTE_PAGE).get_board_options()
+        case = save_case(tmp_path, "quote", "JLCPCB", QUOTE_PAGE, options)
+
+        result = benchmark(case, repeat=2)
+
+        assert result.replay.ok
+        assert result.parse_time > 0
+        assert result.extract_time > 0
+        assert result.peak_memory > 0
@@ -0,0 +1,70 @@
+import time
+
+from src.scraper.runner import run_crawls
+
+
+class SlowCrawler:
+    """Stand-in for a crawler class whose crawl takes <delay> seconds."""
+    def __init__(self, url: str, delay: float, fail: bool = False):
+        self.url = url
+        self.delay = delay
+        self.fail = fail
+
+
+def fake_crawl(shop: str, crawler: SlowCrawler) -> dict:
+    time.sleep(crawler.delay)
+    if crawler.fail:
+        raise ConnectionError("Shop is down")
+    return {"Layers": ["1", "2"]}
+
+
+class TestCrawlRunner:
+    def test_shops_on_different_hosts_are_crawled_concurrently(self):
+        """GIVEN three shops on different hosts whose crawls take 0.2 seconds each
+
+        WHEN all shops are crawled
+
+        THEN the whole run takes about as long as a single crawl.
+        """
+        crawlers = {f"Shop {i}": SlowCrawler(f"https://shop{i}.example.com/quote", 0.2) for i in range(3)}
+
+        started = time.monotonic()
+        results = run_crawls(crawlers, crawl_function=fake_crawl)
+
+        assert time.monotonic() - started < 0.5
+        assert all(result.ok for result in results)
+        assert [result.shop for result in results] == list(crawlers)
+
+    def test_crawls_of_one_host_are_rate_limited(self):
+        """GIVEN two shops on the same host
+
+        WHEN both are crawled with one crawl per host at a time
+
+        THEN the second crawl waits for the first one and the rate limit interval.
+        """
+        crawlers = {
+            "Shop A": SlowCrawler("https://shop.example.com/a", 0.1),
+            "Shop B": SlowCrawler("https://shop.example.com/b", 0.1),
+        }
+
+        results = run_crawls(crawlers, max_per_host=1, min_interval=0.3, crawl_function=fake_crawl)
+
+        assert max(result.waited for result in results) >= 0.3
+
+    def test_failures_are_collected_per_shop(self):
+        """GIVEN two shops, one of which is down
+
+        WHEN both are crawled
+
+        THEN the options of the working shop and the error of the other one are returned.
+        """
+        crawlers = {
+            "Working Shop": SlowCrawler("https://working.example.com", 0),
+            "Broken Shop": SlowCrawler("https://broken.example.com", 0, fail=True),
+        }
+
+        working, broken = run_crawls(crawlers, crawl_function=fake_crawl)
+
+        assert working.options == {"Layers": ["1", "2"]}
+        assert not broken.ok
+        assert "Shop is down" in broken.error
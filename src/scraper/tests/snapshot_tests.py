@@ -0,0 +1,126 @@
+from src.scraper.snapshots import SnapshotStore, crawl_with_snapshot, save_snapshot
+from src.scraper.web_scrapers import Crawler, JLCCrawler
+
+from .conftest import QUOTE_PAGE_PATH
+
+
+QUOTE_PAGE = QUOTE_PAGE_PATH.read_text(encoding="utf-8")
+
+
+def make_jlc_crawler(html: str):
+    """Returns a JLC crawler class that is served <html> instead of fetching the quote page."""
+    class SavedPageCrawler(JLCCrawler):
+        def __init__(self, last_snapshot=None):
+            super().__init__(html=html, last_snapshot=last_snapshot)
+    return SavedPageCrawler
+
+
+class TestSnapshotStore:
+    def test_latest_snapshot_is_returned(self, tmp_path):
+        """GIVEN a snapshot store with two snapshots of a shop
+
+        WHEN the latest snapshot is requested
+
+        THEN the second one is returned, with its HTML and metadata.
+        """
+        store = SnapshotStore(tmp_path)
+        store.save("JLCPCB", "<p>first</p>", "hash-1")
+        store.save("JLCPCB", "<p>second</p>", "hash-2", etag='"abc"')
+
+        latest = store.latest("JLCPCB")
+        assert latest.read_html() == "<p>second</p>"
+        assert latest.content_hash == "hash-2"
+        assert latest.etag == '"abc"'
+
+    def test_only_newest_snapshots_are_kept(self, tmp_path):
+        store = SnapshotStore(tmp_path, keep=2)
+        for i in range(4):
+            store.save("JLCPCB", f"<p>{i}</p>", f"hash-{i}")
+
+        assert len(store.history("JLCPCB")) == 2
+        assert store.latest("JLCPCB").read_html() == "<p>3</p>"
+
+
+    def test_snapshots_are_kept_per_crawl_mode(self, tmp_path):
+        store = SnapshotStore(tmp_path)
+        store.save("JLCPCB", "<p>page</p>", "page-hash")
+        store.save("JLCPCB", '{"data": {}}', "payload-hash", mode="json")
+
+        assert store.latest("JLCPCB").content_hash == "page-hash"
+        assert store.latest("JLCPCB", "json").content_hash == "payload-hash"
+        assert len(store.history("JLCPCB", "json")) == 1
+
+class TestCrawlWithSnapshot:
+    def test_unchanged_option_section_is_detected(self, tmp_path):
+        """GIVEN a stored snapshot of the JLC quote page
+
+        WHEN the page is crawled again and only content outside the options changed
+
+        THEN the crawl is reported as unchanged.
+        """
+        store = SnapshotStore(tmp_path)
+        _, changed = crawl_with_snapshot("JLCPCB", make_jlc_crawler(QUOTE_PAGE), store)
+        assert changed
+
+        new_footer = QUOTE_PAGE.replace("&copy; JLCPCB", "&copy; 2026 JLCPCB")
+        _, changed = crawl_with_snapshot("JLCPCB", make_jlc_crawler(new_footer), store)
+        assert not changed
+
+    def test_changed_options_are_detected(self, tmp_path):
+        """GIVEN a stored snapshot of the JLC quote page
+
+        WHEN the page is crawled again and an option value was added
+
+        THEN the crawl is reported as changed.
+        """
+        store = SnapshotStore(tmp_path)
+        crawl_with_snapshot("JLCPCB", make_jlc_crawler(QUOTE_PAGE), store)
+
+        new_layers = QUOTE_PAGE.replace('<button class="btn">6</button>', '<button class="btn">6</button><button class="btn">8</button>')
+        crawler, changed = crawl_with_snapshot("JLCPCB", make_jlc_crawler(new_layers), store)
+
+        assert changed
+        assert crawler.get_board_options()["Layers"] == ["1", "2", "4", "6", "8"]
+
+    def test_unsaved_page_is_changed_until_saved(self, tmp_path):
+        """GIVEN a crawl whose page was not stored, e.g. because ingesting its options failed
+
+        WHEN the same page is crawled again
+
+        THEN it is still reported as changed, until it is stored with save_snapshot().
+        """
+        store = SnapshotStore(tmp_path)
+        crawl_with_snapshot("JLCPCB", make_jlc_crawler(QUOTE_PAGE), store, save=False)
+        assert store.latest("JLCPCB") is None
+
+        crawler, changed = crawl_with_snapshot("JLCPCB", make_jlc_crawler(QUOTE_PAGE), store, save=False)
+        assert changed
+
+        save_snapshot("JLCPCB", crawler, store)
+        _, changed = crawl_with_snapshot("JLCPCB", make_jlc_crawler(QUOTE_PAGE), store)
+        assert not changed
+
+    def test_conditional_request_uses_stored_etag(self, tmp_path, local_shop):
+        """GIVEN a plain HTTP shop page that was crawled before
+
+        WHEN it is crawled again and the server reports it as not modified
+
+        THEN the stored snapshot is used and the crawl is reported as unchanged.
+        """
+        url = local_shop.add_page("/options", QUOTE_PAGE)
+
+        class StaticCrawler(Crawler):
+            def __init__(self, last_snapshot=None):
+                super().__init__(url, last_snapshot=last_snapshot)
+
+            def get_board_options(self):
+                return {}
+
+        store = SnapshotStore(tmp_path)
+        crawl_with_snapshot("Static Shop", StaticCrawler, store)
+        crawler, changed = crawl_with_snapshot("Static Shop", StaticCrawler, store)
+
+        assert local_shop.requests[-1]["headers"]["If-None-Match"] == store.latest("Static Shop").etag
+        assert crawler.not_modified
+        assert not changed
+        assert crawler.html == QUOTE_PAGE
@@ -1,43 +1,132 @@
 import time
+import json
+import hashlib
 from pprint import pprint
+from functools import cached_property
 
-from typing import Dict, List, TypeVar, Optional
+from typing import Dict, Iterable, List, Sequence, TypeVar, Optional
 from abc import ABC, abstractmethod
-from bs4 import BeautifulSoup
+
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag, NavigableString, Comment
 
-from context_managers import WebDriver
+from .context_managers import WebDriver, WebDriverPool, get_default_pool
+from .http_client import FetchError, HttpClient, RequestTiming, get_default_client
+from .json_capture import PayloadNotCaptured, capture_json_payload, get_path
+from .readiness import wait_for_stable_count
 
 
 HtmlString = str
 
+# "full" parses the whole page with the pure-Python parser. "fast" uses the C-backed
+# lxml parser and only builds the subtree selected by the crawler's <parse_only> strainer.
+PARSE_MODES = ["full", "fast"]
+
+
+class CrawlerError(Exception):
+    """Raised if a crawler's page cannot be fetched."""
+
+
+def content_hash(strings: Iterable[str]) -> str:
+    """Returns the SHA-256 hex digest of <strings>, with whitespace normalized."""
+    normalized = "\n".join(" ".join(string.split()) for string in strings)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
 
 class Crawler(ABC):
-    """Abstract base class for web crawlers."""
+    """Abstract base class for web crawlers.
+
+    If <html> is given, it is used instead of fetching the crawler's URL.
+    If <last_snapshot> (see scraper.snapshots) is given, the page is requested
+    conditionally and its stored HTML is used if the server reports no change.
+    Pages are fetched with <http_client>, the process-wide client by default.
+    The page is only parsed when <self.doc> is first used.
+    """
+    # Part of the page that is needed for extraction, used by the fast parse mode
+    parse_only: Optional[SoupStrainer] = None
+
     @abstractmethod
-    def __init__(self, url):
+    def __init__(
+            self,
+            url,
+            parse_mode: str = "full",
+            html: Optional[HtmlString] = None,
+            last_snapshot=None,
+            http_client: Optional[HttpClient] = None
+    ):
+        if parse_mode not in PARSE_MODES:
+            raise ValueError(f"The parse mode '{parse_mode}' is not supported")
+
         self.url = url
-        self.doc = self._get_doc()
+        self.parse_mode = parse_mode
+        self.last_snapshot = last_snapshot
+        self.http_client = http_client
+
+        # Timing of the request that fetched the page, if it was fetched over HTTP
+        self.timing: Optional[RequestTiming] = None
+
+        # Cache validators sent by the server and whether it answered 304 Not Modified
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.not_modified = False
+
+        self.html = html if html is not None else self._get_html()
+
+    def _get_conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.last_snapshot is not None:
+            if self.last_snapshot.etag:
+                headers["If-None-Match"] = self.last_snapshot.etag
+            if self.last_snapshot.last_modified:
+                headers["If-Modified-Since"] = self.last_snapshot.last_modified
+        return headers
 
     def _get_html(self) -> HtmlString:
         """Returns a string representation of the HTML returned from a GET request
-        to the Crawler instance's URL as bytes.
+        to the Crawler instance's URL.
         """
+        return self._fetch(self.url)
+
+    def _fetch(self, url: str) -> str:
+        """Returns the body of a (conditional) GET request to <url>."""
+        client = self.http_client or get_default_client()
         try:
-            r = requests.get(self.url, timeout=3)
-            r.raise_for_status()
-        except requests.exceptions.HTTPError as http_err:
-            raise Error(http_err)
-        except requests.exceptions.RequestException as err:
-            raise Error("Connection denied:", err)
-
-        return r.content
-
-    def _get_doc(self):
-        """Returns a BeautifulSoup object around the crawler instance's HTML page."""
-        html = self._get_html()
+            r = client.get(url, headers=self._get_conditional_headers())
+        except FetchError as err:
+            raise CrawlerError(err)
+        self.timing = r.timing
+
+        if r.status == 304:
+            self.not_modified = True
+            return self.last_snapshot.read_html()
+
+        self.etag = r.headers.get("ETag")
+        self.last_modified = r.headers.get("Last-Modified")
+        return r.text
+
+    def parse(self, html: HtmlString) -> BeautifulSoup:
+        """Returns a BeautifulSoup object around <html>, parsed according to <self.parse_mode>."""
+        if self.parse_mode == "fast":
+            return BeautifulSoup(html, 'lxml', parse_only=self.parse_only)
         return BeautifulSoup(html, 'html.parser')
 
+    @cached_property
+    def doc(self) -> BeautifulSoup:
+        """BeautifulSoup object around the crawler instance's HTML page."""
+        return self.parse(self.html)
+
+    def get_option_section(self) -> Iterable[str]:
+        """Returns the text of the part of the page that holds the board options.
+        Defaults to the whole page; subclasses should narrow it down cheaply.
+        """
+        return self.doc.stripped_strings
+
+    def get_content_hash(self) -> str:
+        """Returns a hash of the normalized option section, which only changes
+        if the offered options (or their labels) change.
+        """
+        return content_hash(self.get_option_section())
+
     @abstractmethod
     def get_board_options(self) -> Dict:
         """Returns a dictionary with all current option labels as keys
@@ -49,38 +138,71 @@ class Crawler(ABC):
 class JLCCrawler(Crawler):
     url = "https://cart.jlcpcb.com/quote"
 
-    def __init__(self):
-        super().__init__(self.url)
+    # Seconds to wait for the option buttons to be rendered
+    render_timeout = 10
+
+    # All divs containing board option information are located within
+    # a large div with the class "home-orderadd-pcb"
+    parse_only = SoupStrainer("div", class_="home-orderadd-pcb")
+
+    def __init__(
+            self,
+            driver_pool: Optional[WebDriverPool] = None,
+            parse_mode: str = "fast",
+            html: Optional[HtmlString] = None,
+            last_snapshot=None
+    ):
+        self.driver_pool = driver_pool
+        self.page_load_latency: Optional[float] = None
+        self.render_latency: Optional[float] = None
+        super().__init__(self.url, parse_mode, html, last_snapshot)
 
     def _get_html(self) -> HtmlString:
         """Uses a webdriver to send a GET request to the crawler instance's <self.url>.
 
         The returned HTML page is already (dynamically) rendered by the web driver and
-        is represented as a string.
+        is represented as a string. The time the page took to load and the time until
+        its options were rendered are stored in <self.page_load_latency> and <self.render_latency>.
         """
-        with WebDriver("Chrome") as driver:
+        with WebDriver("Chrome", pool=self.driver_pool) as driver:
+            started = time.monotonic()
             driver.get(self.url)
-
-            # Ensure that HTML is fully rendered through JavaScript
-            time.sleep(2)
+            self.page_load_latency = time.monotonic() - started
+
+            # Ensure that HTML is fully rendered through JavaScript,
+            # i.e. the number of option buttons has stopped changing
+            self.render_latency = wait_for_stable_count(
+                driver,
+                ".home-orderadd-pcb",
+                timeout=self.render_timeout
+            )
             return driver.page_source
 
+    def get_option_section(self) -> Iterable[str]:
+        """Returns the text of the option container. In full parse mode,
+        the container is parsed on its own with lxml for this.
+        """
+        if self.parse_mode == "fast":
+            return self.doc.stripped_strings
+        return BeautifulSoup(self.html, 'lxml', parse_only=self.parse_only).stripped_strings
+
     def _get_board_option_divs(self) -> List[Tag]:
         """On the JLCPCB site, information about each board option is encapsulated in an HTML div
         that contains a label tag. This function returns a list of such container divs.
+
+        The divs are found in one pass over the labels in the main div, instead of
+        testing every tag in it.
         """
-        def is_div_with_label(tag: Tag) -> bool:
-            """Returns True if the <tag> is an HTML div that contains a label div,
-            otherwise False.
-            """
-            return (
-                tag.name == "div"
-                and any([child.name == "label" for child in tag.contents])
-            )
-        # All divs containing board option information are located within
-        # a large div with the class "home-orderadd-pcb":
         main_div = self.doc.find("div", class_="home-orderadd-pcb")
-        return main_div.find_all(is_div_with_label)
+
+        option_divs = []
+        seen = set()
+        for label in main_div.find_all("label"):
+            parent = label.parent
+            if parent.name == "div" and parent is not main_div and id(parent) not in seen:
+                seen.add(id(parent))
+                option_divs.append(parent)
+        return option_divs
 
     @staticmethod
     def _get_option_label(option_div: Tag) -> Optional[str]:
@@ -114,11 +236,9 @@ class JLCCrawler(Crawler):
         formgroup div, or None if none are found.
         """
         form_group_div = option_div.find("div", class_="formgroup")
-        try:
-            option_values = [button.text.strip() for button in form_group_div.find_all("button")]
-            return option_values
-        except TypeError:
+        if form_group_div is None:
             return None
+        return [button.text.strip() for button in form_group_div.find_all("button")]
 
     def get_board_options(self) -> Dict[str, List]:
         """Returns a dictionary with all current option labels as keys
@@ -150,6 +270,107 @@ class JLCCrawler(Crawler):
             print(div.prettify())
 
 
+class JsonCrawler(Crawler):
+    """Crawler that reads the board options from the JSON payload that the shop's
+    page renders them from, without rendering or parsing the page itself.
+
+    The payload is fetched from <endpoint> if there is one. Otherwise a browser
+    loads <url> and the payload is captured from its network log, as the first
+    JSON response whose URL matches <payload_pattern>.
+
+    The options are read from the list at <options_path> in the payload. Each
+    option is an object with a label at <label_key> and either a list of values
+    at <values_key> (plain values, or objects with the value at <value_key>)
+    or a range from <min_key> to <max_key>, which is returned as [min, max].
+    """
+    url: Optional[str] = None
+    endpoint: Optional[str] = None
+    payload_pattern: Optional[str] = None
+    capture_timeout = 10
+
+    options_path: Sequence = ()
+    label_key = "label"
+    values_key = "values"
+    value_key = "value"
+    min_key = "min"
+    max_key = "max"
+
+    def __init__(
+            self,
+            url: Optional[str] = None,
+            endpoint: Optional[str] = None,
+            driver_pool: Optional[WebDriverPool] = None,
+            parse_mode: str = "fast",
+            html: Optional[str] = None,
+            last_snapshot=None,
+            http_client: Optional[HttpClient] = None
+    ):
+        self.endpoint = endpoint or self.endpoint
+        self.driver_pool = driver_pool
+        super().__init__(url or self.url, parse_mode, html, last_snapshot, http_client)
+
+    def _get_html(self) -> str:
+        """Returns the JSON payload (despite the method's name)."""
+        if self.endpoint is not None:
+            return self._fetch(self.endpoint)
+        if self.payload_pattern is None:
+            raise CrawlerError(f"{type(self).__name__} needs an endpoint or a payload pattern.")
+
+        # Not raised within the driver's lease, since the browser itself did not fail
+        error = None
+        with WebDriver("Chrome", pool=self.driver_pool or get_default_pool(performance_log=True)) as driver:
+            try:
+                return capture_json_payload(driver, self.url, self.payload_pattern, self.capture_timeout)
+            except PayloadNotCaptured as e:
+                error = e
+        raise CrawlerError(error)
+
+    @cached_property
+    def payload(self):
+        try:
+            return json.loads(self.html)
+        except ValueError as e:
+            raise CrawlerError(f"The payload is not valid JSON: {e}")
+
+    def get_option_section(self) -> Iterable[str]:
+        return [json.dumps(get_path(self.payload, self.options_path), sort_keys=True)]
+
+    def _get_option_values(self, option: dict) -> Optional[List[str]]:
+        if self.values_key in option:
+            return [
+                str(value.get(self.value_key) if isinstance(value, dict) else value)
+                for value in option[self.values_key]
+            ]
+        if self.min_key in option and self.max_key in option:
+            return [str(option[self.min_key]), str(option[self.max_key])]
+        return None
+
+    def get_board_options(self) -> Dict[str, Optional[List[str]]]:
+        """Returns a dictionary with all option labels in the payload as keys
+        and lists of the according choices (as strings) as values.
+        """
+        options = get_path(self.payload, self.options_path)
+        if not isinstance(options, list):
+            raise CrawlerError(f"The payload has no list of options at {list(self.options_path)}.")
+
+        return {
+            option[self.label_key]: self._get_option_values(option)
+            for option in options
+            if isinstance(option, dict) and self.label_key in option
+        }
+
+
+class JLCJsonCrawler(JsonCrawler):
+    """Captures the option data that the JLCPCB quote page loads from the shop's API.
+
+    The payload pattern and layout have to match the JLCPCB API. A recorded
+    payload in the replay corpus catches changes to it.
+    """
+    url = JLCCrawler.url
+    payload_pattern = r"^https://cart\.jlcpcb\.com/api/"
+    options_path = ("data", "options")
+
+
 if __name__ == "__main__":
     crawler = JLCCrawler()
     pprint(crawler.get_board_options())
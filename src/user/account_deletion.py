@@ -0,0 +1,197 @@
+import datetime
+import logging
+from typing import Iterable, Optional
+
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from auditlog.models import LogEntry
+from auditlog.registry import auditlog
+
+from core.audit import log_bulk_changes
+from core.chunked_deletion import process_in_chunks, raw_delete
+from article.models import Board
+from article.board_management import delete_boards
+from .models import User, BasketItem
+from .address_management import Address, invalidate_default_addresses
+from .basket_management import invalidate_basket_summary
+
+
+logger = logging.getLogger(__name__)
+
+# A running job whose progress has not changed for this long is considered abandoned
+STALE_JOB_TIMEOUT = datetime.timedelta(minutes=30)
+
+
+# USER DELETION JOB MODEL
+
+class UserDeletionJob(models.Model):
+    """Model for the background deletion of a user account.
+
+    The user is deactivated when the job is created. The job then deletes
+    their dependents chunk by chunk and finally removes or, if they have
+    placed orders, anonymizes the user.
+    """
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (DONE, "Done"),
+        (FAILED, "Failed"),
+    ]
+
+    # Kept after the user is gone, so that progress can still be queried
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name="deletion_jobs")
+    user_pk = models.IntegerField()
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    # Number of deleted rows per table, and whether the user was deleted or anonymized
+    progress = models.JSONField(default=dict)
+    error = models.TextField(blank=True)
+
+    created = models.DateTimeField(auto_now_add=True)
+    changed = models.DateTimeField(auto_now=True)
+    finished = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['created']
+        constraints = [
+            # A user is enqueued at most once
+            models.UniqueConstraint(fields=["user_pk"], name="unique_deletion_job_per_user"),
+        ]
+
+    def __str__(self):
+        return f"<UserDeletionJob for user {self.user_pk}: {self.status}>"
+
+
+auditlog.register(UserDeletionJob)
+# UTILITY FUNCTIONS FOR USER DELETION
+
+
+def request_deletion(_user: User) -> UserDeletionJob:
+    """Deactivates the user, so that they can no longer log in,
+    and enqueues the deletion of their account.
+    """
+    with transaction.atomic():
+        _user.is_active = False
+        _user.save(update_fields=["is_active"])
+        job, _ = UserDeletionJob.objects.get_or_create(user_pk=_user.pk, defaults={"user": _user})
+    return job
+
+
+def _delete_owned_rows(model, owner_field: str, pks: Iterable[int]) -> int:
+    """Deletes the given rows with one DELETE and one bulk insert of audit log entries."""
+    with transaction.atomic():
+        owners = dict(model.objects.filter(pk__in=list(pks)).values_list("pk", f"{owner_field}_id"))
+        raw_delete(model.objects.filter(pk__in=owners))
+        log_bulk_changes(
+            model,
+            {pk: {owner_field: [str(owner_id), None]} for pk, owner_id in owners.items()},
+            action=LogEntry.Action.DELETE
+        )
+    return len(owners)
+
+
+def _anonymize(_user: User) -> None:
+    """Removes all personal data and login credentials from a user
+    who has to be kept for their orders.
+    """
+    for app_label, model_name in [("account", "EmailAddress"), ("socialaccount", "SocialAccount"), ("authtoken", "Token")]:
+        apps.get_model(app_label, model_name).objects.filter(user=_user).delete()
+
+    _user.email = f"deleted-{_user.pk}@invalid"
+    _user.username = f"deleted-{_user.pk}"
+    _user.first_name = ""
+    _user.last_name = ""
+    _user.is_active = False
+    _user.set_unusable_password()
+    _user.save()
+
+
+def claim_job(job: UserDeletionJob) -> bool:
+    """Marks the job as running, unless another process has claimed it in the meantime."""
+    claimed = (
+        UserDeletionJob.objects
+        .filter(pk=job.pk, status=job.status, changed=job.changed)
+        .update(status=UserDeletionJob.RUNNING, changed=timezone.now())
+    )
+    return claimed == 1
+
+
+def run_deletion_job(job: UserDeletionJob, chunk_size: int = 500, sleep: float = 0.0) -> Optional[UserDeletionJob]:
+    """Deletes the job's user with all of their boards, basket items and addresses,
+    in chunks of <chunk_size> rows per table.
+
+    Boards and addresses referenced by orders are kept. In that case, the user
+    is anonymized instead of deleted. Progress is saved after every chunk,
+    and a failed or interrupted job can simply be run again.
+
+    Returns None if the job is already being run by another process.
+    """
+    if not claim_job(job):
+        return None
+    job.refresh_from_db()
+
+    def track(table: str, delete_chunk):
+        def _process_chunk(pks: list) -> int:
+            deleted = delete_chunk(pks)
+            job.progress[table] = job.progress.get(table, 0) + deleted
+            job.save(update_fields=["progress", "changed"])
+            return deleted
+        return _process_chunk
+
+    user_pk = job.user_pk
+    try:
+        process_in_chunks(
+            BasketItem.objects.filter(owner_id=user_pk),
+            track("basket_items", lambda pks: _delete_owned_rows(BasketItem, "owner", pks)),
+            chunk_size=chunk_size,
+            sleep=sleep
+        )
+        process_in_chunks(
+            Board.objects.filter(owner_id=user_pk, article2order__isnull=True),
+            track("boards", delete_boards),
+            chunk_size=chunk_size,
+            sleep=sleep
+        )
+        process_in_chunks(
+            Address.objects.filter(user_id=user_pk, orders_shipping__isnull=True, orders_billing__isnull=True),
+            track("addresses", lambda pks: _delete_owned_rows(Address, "user", pks)),
+            chunk_size=chunk_size,
+            sleep=sleep
+        )
+        invalidate_basket_summary(user_pk)
+        invalidate_default_addresses(user_pk)
+
+        if job.user is not None:
+            if job.user.order_set.exists():
+                _anonymize(job.user)
+                job.progress["user"] = "anonymized"
+            else:
+                job.user.delete()
+                job.user = None
+                job.progress["user"] = "deleted"
+    except Exception as e:
+        logger.exception(f"Deletion of user {user_pk} failed")
+        job.status = UserDeletionJob.FAILED
+        job.error = str(e)
+        job.save()
+        return job
+
+    job.status = UserDeletionJob.DONE
+    job.finished = timezone.now()
+    job.save()
+    return job
+
+
+def get_pending_jobs():
+    """Returns all jobs that are pending, failed or abandoned while running, oldest first."""
+    abandoned = Q(status=UserDeletionJob.RUNNING, changed__lt=timezone.now() - STALE_JOB_TIMEOUT)
+    return UserDeletionJob.objects.filter(
+        Q(status__in=[UserDeletionJob.PENDING, UserDeletionJob.FAILED]) | abandoned
+    )
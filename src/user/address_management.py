@@ -1,8 +1,17 @@
-from django.db import models
+import uuid
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
 from django.core.validators import MinLengthValidator
 
 from auditlog.registry import auditlog
 
+from core.audit import log_bulk_changes
 from .models import User
 
 
@@ -24,35 +33,110 @@ class Address(models.Model):
     is_shipping_default = models.BooleanField(default=False)
     is_billing_default = models.BooleanField(default=False)
 
+    class Meta:
+        # A user can have at most one default address of each type
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user"],
+                condition=Q(is_shipping_default=True),
+                name="unique_shipping_default_per_user"
+            ),
+            models.UniqueConstraint(
+                fields=["user"],
+                condition=Q(is_billing_default=True),
+                name="unique_billing_default_per_user"
+            ),
+        ]
+
 
 auditlog.register(Address)
 # UTILITY FUNCTIONS FOR ADDRESS API
 
 
-def disable_old_default(_type: str, _user: User):
-    """Utility to disable default status of a user's current default address.
-    The _type parameter distinguishes billing and shipping addresses.
+def default_addresses_version_key(user_id: int) -> str:
+    return f"default-addresses-version:{user_id}"
+
+
+def invalidate_default_addresses(user_id: int) -> None:
+    """Makes the user's cached default address ids unreachable by giving them a new version.
+
+    Deleting the cached ids would not be enough: a reader that loaded the old
+    ids before the change could still write them back afterwards. With a new
+    version, it writes them under the old version's key, which is never read again.
     """
-    try:
-        if _type == "shipping":
-            current_default = _user.addresses.get(is_shipping_default=True)
-            current_default.is_shipping_default = False
-        else:
-            current_default = _user.addresses.get(is_billing_default=True)
-            current_default.is_billing_default = False
-        current_default.save()
-    except Address.DoesNotExist:
-        pass
-
-
-def set_new_default(_type: str, _user: User, _id: int):
-    """Utility to set new default address of a given user.
+    cache.set(default_addresses_version_key(user_id), uuid.uuid4().hex, timeout=None)
+
+
+def get_default_address_ids(_user: User) -> Dict[str, Optional[int]]:
+    """Returns the ids of the user's default shipping and billing address
+    (None if there is no default), keyed by address type.
+
+    The ids are cached per user and version, so this only queries the
+    database on the first call after they changed.
+    """
+    version = cache.get_or_set(default_addresses_version_key(_user.pk), uuid.uuid4().hex, timeout=None)
+    key = f"default-addresses:{_user.pk}:{version}"
+    defaults = cache.get(key)
+
+    if defaults is None:
+        defaults = {"shipping": None, "billing": None}
+        rows = (
+            _user.addresses
+            .filter(Q(is_shipping_default=True) | Q(is_billing_default=True))
+            .values_list("id", "is_shipping_default", "is_billing_default")
+        )
+        for address_id, is_shipping_default, is_billing_default in rows:
+            if is_shipping_default:
+                defaults["shipping"] = address_id
+            if is_billing_default:
+                defaults["billing"] = address_id
+        cache.set(key, defaults, timeout=settings.DEFAULT_ADDRESS_CACHE_TIMEOUT)
+
+    return defaults
+
+
+@receiver(post_delete, sender=Address)
+def invalidate_cached_defaults(sender, instance, **kwargs):
+    """Ensures that a deleted default address is no longer returned as the user's default."""
+    if instance.is_shipping_default or instance.is_billing_default:
+        invalidate_default_addresses(instance.user_id)
+
+
+def change_default(_type: str, _user: User, _id: int) -> bool:
+    """Utility to make an existing address the user's new default address,
+    removing the default status from the old one atomically.
     The _type parameter distinguishes billing and shipping addresses.
-    The _id parameter refers to an existing address.
+
+    Returns False, without changing anything, if the user has no address with the given _id.
     """
-    new_default = _user.addresses.get(id=_id)
-    if _type == "shipping":
-        new_default.is_shipping_default = True
-    else:
-        new_default.is_billing_default = True
-    new_default.save()
+    field = f"is_{_type}_default"
+
+    with transaction.atomic():
+        # Locking the old and the new default serializes concurrent changes
+        affected = dict(
+            _user.addresses
+            .select_for_update()
+            .filter(Q(id=_id) | Q(**{field: True}))
+            .values_list("id", field)
+        )
+        if _id not in affected:
+            return False
+
+        changes = {
+            pk: {field: [str(is_default), str(pk == _id)]}
+            for pk, is_default in affected.items()
+            if is_default != (pk == _id)
+        }
+        old_defaults = [pk for pk in changes if pk != _id]
+
+        # The partial unique index is checked row by row, so the old
+        # default has to be cleared before the new one is set.
+        if old_defaults:
+            Address.objects.filter(pk__in=old_defaults).update(**{field: False})
+        if _id in changes:
+            Address.objects.filter(pk=_id).update(**{field: True})
+
+        log_bulk_changes(Address, changes, actor=_user)
+        transaction.on_commit(lambda: invalidate_default_addresses(_user.pk))
+
+    return True
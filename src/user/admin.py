@@ -2,7 +2,9 @@ from django.contrib import admin
 
 from .models import BasketItem
 from .address_management import Address
+from .account_deletion import UserDeletionJob
 
 
 admin.site.register(BasketItem)
 admin.site.register(Address)
+admin.site.register(UserDeletionJob)
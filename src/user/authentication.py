@@ -0,0 +1,142 @@
+import time
+import uuid
+import threading
+from typing import Dict, Optional, Tuple
+
+import jwt
+from django.conf import settings
+from django.core.cache import cache
+from django.contrib.auth.models import User
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+
+
+ACCESS_TOKEN = "access"
+REFRESH_TOKEN = "refresh"
+ALGORITHM = "HS256"
+
+
+class RevocationCache:
+    """In-process set of revoked access token ids, each kept until its token expires.
+
+    Revocations are not shared between worker processes, which is why
+    access tokens are short-lived. Refresh tokens are revoked in the shared cache.
+    """
+    def __init__(self, max_entries: int = 100000):
+        self.max_entries = max_entries
+        self._expiries: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def revoke(self, jti: str, expires_at: float) -> None:
+        with self._lock:
+            now = time.time()
+            if len(self._expiries) >= self.max_entries:
+                self._expiries = {key: exp for key, exp in self._expiries.items() if exp > now}
+            self._expiries[jti] = expires_at
+
+    def is_revoked(self, jti: str) -> bool:
+        expires_at = self._expiries.get(jti)
+        return expires_at is not None and expires_at > time.time()
+
+
+revoked_tokens = RevocationCache()
+
+
+def revoked_refresh_token_cache_key(jti: str) -> str:
+    return f"revoked-refresh-token:{jti}"
+
+
+def create_token(user: User, token_type: str, lifetime: int) -> str:
+    """Returns a signed token of the given type for the user, valid for <lifetime> seconds."""
+    now = int(time.time())
+    payload = {
+        "type": token_type,
+        "jti": uuid.uuid4().hex,
+        "iat": now,
+        "exp": now + lifetime,
+        "user_id": user.pk,
+        "email": user.email,
+        "is_staff": user.is_staff,
+        "is_superuser": user.is_superuser,
+    }
+    return jwt.encode(payload, settings.JWT_SIGNING_KEY, algorithm=ALGORITHM)
+
+
+def create_token_pair(user: User) -> dict:
+    return {
+        ACCESS_TOKEN: create_token(user, ACCESS_TOKEN, settings.JWT_ACCESS_TOKEN_LIFETIME),
+        REFRESH_TOKEN: create_token(user, REFRESH_TOKEN, settings.JWT_REFRESH_TOKEN_LIFETIME),
+    }
+
+
+def decode_token(token: str, token_type: str) -> dict:
+    """Returns the payload of a valid, unrevoked token of the given type.
+    Raises AuthenticationFailed otherwise.
+    """
+    try:
+        payload = jwt.decode(token, settings.JWT_SIGNING_KEY, algorithms=[ALGORITHM])
+    except jwt.ExpiredSignatureError:
+        raise AuthenticationFailed("Token has expired.")
+    except jwt.InvalidTokenError:
+        raise AuthenticationFailed("Token is invalid.")
+
+    if payload.get("type") != token_type:
+        raise AuthenticationFailed(f"An {token_type} token is required.")
+    if token_type == REFRESH_TOKEN:
+        revoked = cache.get(revoked_refresh_token_cache_key(payload["jti"])) is not None
+    else:
+        revoked = revoked_tokens.is_revoked(payload["jti"])
+    if revoked:
+        raise AuthenticationFailed("Token has been revoked.")
+    return payload
+
+
+def revoke_token(payload: dict) -> bool:
+    """Revokes the token until it expires. Returns False if it was already revoked.
+
+    Refresh tokens are revoked in the cache shared by all worker processes,
+    so that each of them can be used once, whichever process receives it.
+    """
+    if payload["type"] == REFRESH_TOKEN:
+        timeout = max(payload["exp"] - int(time.time()), 1)
+        return cache.add(revoked_refresh_token_cache_key(payload["jti"]), True, timeout=timeout)
+
+    revoked = revoked_tokens.is_revoked(payload["jti"])
+    revoked_tokens.revoke(payload["jti"], payload["exp"])
+    return not revoked
+
+
+def user_from_payload(payload: dict) -> User:
+    """Returns an unsaved user instance built from the token claims.
+    It carries the primary key, so it can be used for filtering and
+    as a foreign key value without loading the user.
+    """
+    user = User(
+        pk=payload["user_id"],
+        email=payload["email"],
+        is_staff=payload["is_staff"],
+        is_superuser=payload["is_superuser"],
+        is_active=True
+    )
+    user._state.adding = False
+    user._state.db = "default"
+    return user
+
+
+class JWTAuthentication(BaseAuthentication):
+    """Authenticates requests with an 'Authorization: Bearer <access token>' header
+    by checking the token's signature alone, without any database query.
+
+    Requests without a bearer token are left to the other authentication classes.
+    """
+    keyword = "Bearer"
+
+    def authenticate(self, request) -> Optional[Tuple[User, dict]]:
+        header = request.META.get("HTTP_AUTHORIZATION", "").split()
+        if not header or header[0] != self.keyword:
+            return None
+        if len(header) != 2:
+            raise AuthenticationFailed("Invalid bearer header.")
+
+        payload = decode_token(header[1], ACCESS_TOKEN)
+        return user_from_payload(payload), payload
@@ -0,0 +1,179 @@
+from decimal import Decimal
+from typing import Dict, Iterable, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, When, Value, PositiveIntegerField
+from django.utils import timezone
+
+from auditlog.models import LogEntry
+
+from core.audit import log_bulk_changes
+from core.chunked_deletion import raw_delete
+from price.cache import get_configuration_prices
+
+
+# BASKET SUMMARY
+
+def basket_summary_cache_key(user_id: int) -> str:
+    return f"basket-summary:{user_id}"
+
+
+def invalidate_basket_summary(user_id: int) -> None:
+    """Removes the cached basket summary of the given user."""
+    cache.delete(basket_summary_cache_key(user_id))
+
+
+def build_basket_summary(user: User) -> dict:
+    """Returns all items in the user's basket with their board attributes
+    and prices, as well as the basket total.
+
+    All boards and their configurations are loaded with one query,
+    and all prices with one batch lookup.
+    """
+    BasketItem = apps.get_model("user", "BasketItem")
+    basket_items = list(
+        BasketItem.objects
+        .filter(owner=user)
+        .select_related("article__board__configuration")
+    )
+
+    boards = {item.pk: item.article.board for item in basket_items}
+    prices = get_configuration_prices(board.configuration for board in boards.values())
+
+    items = []
+    total = Decimal("0.00")
+    for item in basket_items:
+        board = boards[item.pk]
+        unit_price = prices[board.configuration_id]
+        item_total = unit_price * item.quantity
+        total += item_total
+
+        items.append({
+            "article": item.article_id,
+            "quantity": item.quantity,
+            "gerberFileName": board.gerberFileName,
+            "attributes": board.attributes,
+            "unit_price": unit_price,
+            "price": item_total,
+        })
+
+    return {"items": items, "total": total}
+
+
+def get_basket_summary(user: User) -> dict:
+    """Returns the user's basket summary, from the cache if possible."""
+    key = basket_summary_cache_key(user.pk)
+    summary = cache.get(key)
+
+    if summary is None:
+        summary = build_basket_summary(user)
+        cache.set(key, summary, timeout=settings.BASKET_SUMMARY_TIMEOUT)
+    return summary
+
+
+# BULK BASKET OPERATIONS
+# These bypass model signals, so they write their audit log entries
+# in bulk and invalidate the basket summary themselves.
+
+def remove_basket_items(user: User, article_ids: Iterable[int]) -> int:
+    """Removes the given articles from the user's basket with one DELETE.
+    Returns the number of removed basket items.
+    """
+    BasketItem = apps.get_model("user", "BasketItem")
+
+    with transaction.atomic():
+        basket_items = BasketItem.objects.filter(owner=user, article_id__in=set(article_ids))
+        removed = dict(basket_items.select_for_update().values_list("pk", "article_id"))
+        if not removed:
+            return 0
+
+        raw_delete(BasketItem.objects.filter(pk__in=removed))
+        log_bulk_changes(
+            BasketItem,
+            {pk: {"article": [str(article_id), None]} for pk, article_id in removed.items()},
+            action=LogEntry.Action.DELETE,
+            actor=user
+        )
+
+    invalidate_basket_summary(user.pk)
+    return len(removed)
+
+
+def update_basket_quantities(user: User, quantities: Dict[int, int]) -> int:
+    """Sets the quantities of the user's basket items, given as a mapping
+    from article id to quantity, with one UPDATE.
+    Returns the number of updated basket items.
+    """
+    BasketItem = apps.get_model("user", "BasketItem")
+
+    with transaction.atomic():
+        basket_items = BasketItem.objects.filter(owner=user, article_id__in=quantities)
+        previous = list(basket_items.select_for_update().values_list("pk", "article_id", "quantity"))
+        if not previous:
+            return 0
+
+        updated = basket_items.update(
+            quantity=Case(
+                *[When(article_id=article_id, then=Value(quantity)) for article_id, quantity in quantities.items()],
+                output_field=PositiveIntegerField()
+            ),
+            changed=timezone.now()
+        )
+        log_bulk_changes(
+            BasketItem,
+            {
+                pk: {"quantity": [str(quantity), str(quantities[article_id])]}
+                for pk, article_id, quantity in previous
+                if quantity != quantities[article_id]
+            },
+            actor=user
+        )
+
+    invalidate_basket_summary(user.pk)
+    return updated
+
+
+def add_order_to_basket(user: User, order_id: int) -> Optional[int]:
+    """Puts all boards of one of the user's past orders back into their basket,
+    with the ordered quantities. Boards that are already in the basket are skipped.
+
+    Returns the number of added basket items, or None if the user has no such order.
+    """
+    BasketItem = apps.get_model("user", "BasketItem")
+    Order = apps.get_model("order", "Order")
+    Article2Order = apps.get_model("order", "Article2Order")
+
+    ordered = dict(
+        Article2Order.objects
+        .filter(order_id=order_id, order__user=user)
+        .values_list("article_id", "quantity")
+    )
+    if not ordered:
+        return 0 if Order.objects.filter(pk=order_id, user=user).exists() else None
+
+    with transaction.atomic():
+        basket_items = BasketItem.objects.filter(owner=user, article_id__in=ordered)
+        present = set(basket_items.values_list("article_id", flat=True))
+
+        BasketItem.objects.bulk_create(
+            [
+                BasketItem(owner=user, article_id=article_id, quantity=quantity)
+                for article_id, quantity in ordered.items()
+                if article_id not in present
+            ],
+            ignore_conflicts=True
+        )
+        added = dict(basket_items.exclude(article_id__in=present).values_list("pk", "article_id"))
+        log_bulk_changes(
+            BasketItem,
+            {pk: {"article": [None, str(article_id)]} for pk, article_id in added.items()},
+            action=LogEntry.Action.CREATE,
+            actor=user
+        )
+
+    invalidate_basket_summary(user.pk)
+    return len(added)
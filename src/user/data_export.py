@@ -0,0 +1,114 @@
+from typing import Iterable, Iterator, List, Tuple
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q, QuerySet
+
+from auditlog.models import LogEntry
+
+from core.streaming import ndjson_lines, zip_stream
+from .models import User
+from .address_management import Address
+
+
+# Rows fetched per round trip from the server-side cursors.
+EXPORT_CHUNK_SIZE = 2000
+
+# (column name, lookup) pairs of each file in the personal data export.
+ACCOUNT_COLUMNS = [
+    ("id", "id"),
+    ("email", "email"),
+    ("first_name", "first_name"),
+    ("last_name", "last_name"),
+    ("date_joined", "date_joined"),
+    ("last_login", "last_login"),
+]
+
+BOARD_COLUMNS = [
+    ("id", "id"),
+    ("created", "created"),
+    ("gerber_file_name", "gerberFileName"),
+    ("gerber_hash", "gerberHash"),
+    ("attributes", "attributes"),
+]
+
+# Each row is one order item; orders without items appear once with empty item columns.
+ORDER_COLUMNS = [
+    ("order_id", "id"),
+    ("created", "created"),
+    ("order_state", "order_state__name"),
+    ("payment_state", "payment_state__name"),
+    ("amount", "amount"),
+    ("vat", "vat"),
+    ("shipping_cost", "shipping_cost"),
+    ("shipping_provider", "shipping_method__shipping_provider__name"),
+    ("shipping_address_id", "shipping_address_id"),
+    ("billing_address_id", "billing_address_id"),
+    ("article_id", "article2order__article_id"),
+    ("unit_price", "article2order__unit_price"),
+    ("quantity", "article2order__quantity"),
+    ("attributes", "article2order__configuration__attributes"),
+    ("legacy_items", "items"),
+]
+
+ADDRESS_COLUMNS = [
+    ("id", "id"),
+    ("receiver_first_name", "receiver_first_name"),
+    ("receiver_last_name", "receiver_last_name"),
+    ("address_extension", "address_extension"),
+    ("street", "street"),
+    ("house_number", "house_number"),
+    ("zip_code", "zip_code"),
+    ("city", "city"),
+    ("is_shipping_default", "is_shipping_default"),
+    ("is_billing_default", "is_billing_default"),
+]
+
+AUDIT_LOG_COLUMNS = [
+    ("timestamp", "timestamp"),
+    ("action", "action"),
+    ("model", "content_type__model"),
+    ("object_pk", "object_pk"),
+    ("object_repr", "object_repr"),
+    ("changes", "changes"),
+]
+
+
+def _stream(queryset: QuerySet, columns: List[Tuple[str, str]]) -> Iterator[str]:
+    """Returns the NDJSON lines of <queryset>, read through a server-side cursor."""
+    header = [column for column, _ in columns]
+    rows = queryset.values_list(*[lookup for _, lookup in columns]).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    return ndjson_lines(header, rows)
+
+
+def get_audit_log(_user: User) -> QuerySet:
+    """Returns all audit log entries of changes the user made
+    and of changes to their account itself, oldest first.
+    """
+    about_user = Q(content_type=ContentType.objects.get_for_model(User), object_id=_user.pk)
+    return LogEntry.objects.filter(Q(actor=_user) | about_user).order_by("timestamp", "id")
+
+
+def get_export_entries(_user: User) -> Iterable[Tuple[str, Iterator[str]]]:
+    """Returns (file name, NDJSON lines) pairs with all personal data of the user.
+
+    The queries only run when their lines are consumed, so one cursor
+    is open at a time.
+    """
+    Board = apps.get_model("article", "Board")
+    Order = apps.get_model("order", "Order")
+
+    return [
+        ("account.ndjson", _stream(User.objects.filter(pk=_user.pk), ACCOUNT_COLUMNS)),
+        ("boards.ndjson", _stream(Board.objects.filter(owner=_user).order_by("id"), BOARD_COLUMNS)),
+        ("orders.ndjson", _stream(Order.objects.filter(user=_user).order_by("id", "article2order__id"), ORDER_COLUMNS)),
+        ("addresses.ndjson", _stream(Address.objects.filter(user=_user).order_by("id"), ADDRESS_COLUMNS)),
+        ("audit_log.ndjson", _stream(get_audit_log(_user), AUDIT_LOG_COLUMNS)),
+    ]
+
+
+def export_personal_data(_user: User) -> Iterator[bytes]:
+    """Yields a zip archive with one NDJSON file per kind of personal data,
+    built chunk by chunk while the rows are read from the database.
+    """
+    return zip_stream(get_export_entries(_user))
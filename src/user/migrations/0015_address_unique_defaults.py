@@ -0,0 +1,37 @@
+# Generated by Django 3.1.6 on 2026-10-19 12:20
+
+from django.db import migrations, models
+
+
+def remove_duplicate_defaults(apps, schema_editor):
+    """Keeps only the newest default address of each type per user."""
+    Address = apps.get_model('user', 'Address')
+
+    for field in ['is_shipping_default', 'is_billing_default']:
+        seen_users = set()
+        defaults = Address.objects.filter(**{field: True}).order_by('user_id', '-id').values_list('id', 'user_id')
+        duplicates = []
+        for address_id, user_id in defaults:
+            if user_id in seen_users:
+                duplicates.append(address_id)
+            seen_users.add(user_id)
+        Address.objects.filter(id__in=duplicates).update(**{field: False})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0014_auto_20210430_1254'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_defaults, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='address',
+            constraint=models.UniqueConstraint(condition=models.Q(is_shipping_default=True), fields=('user',), name='unique_shipping_default_per_user'),
+        ),
+        migrations.AddConstraint(
+            model_name='address',
+            constraint=models.UniqueConstraint(condition=models.Q(is_billing_default=True), fields=('user',), name='unique_billing_default_per_user'),
+        ),
+    ]
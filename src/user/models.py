@@ -1,9 +1,12 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.dispatch import receiver
+from django.db.models.signals import post_save, post_delete
 
 from auditlog.registry import auditlog
 
-from article.models import Article
+from article.models import Article, Board
+from .basket_management import invalidate_basket_summary
 
 
 # **********
@@ -23,5 +26,21 @@ class BasketItem(models.Model):
         unique_together = ['owner', 'article']
 
 
+@receiver([post_save, post_delete], sender=BasketItem)
+def invalidate_basket_summary_on_item_change(sender, instance, **kwargs):
+    """Ensures that the owner's cached basket summary is rebuilt
+    after any change to their basket.
+    """
+    invalidate_basket_summary(instance.owner_id)
+
+
+@receiver(post_save, sender=Board)
+def invalidate_basket_summary_on_board_change(sender, instance, **kwargs):
+    """Ensures that the owner's cached basket summary reflects
+    the current attributes of their boards.
+    """
+    invalidate_basket_summary(instance.owner_id)
+
+
 auditlog.register(User)
 auditlog.register(BasketItem)
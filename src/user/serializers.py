@@ -1,9 +1,28 @@
 from rest_framework import serializers
+
+from core.fieldsets import SparseFieldsetSerializerMixin
 from .models import User, BasketItem
 from .address_management import Address
+from .account_deletion import UserDeletionJob
+from .zip_codes import get_zip_code_index
+
+
+class AddressSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    def validate(self, data):
+        """Checks zip code and city against the German zip code index, if it is available."""
+        index = get_zip_code_index()
+        if index is None:
+            return data
 
+        zip_code = data.get("zip_code", getattr(self.instance, "zip_code", None))
+        city = data.get("city", getattr(self.instance, "city", None))
+
+        if zip_code is not None and not index.is_valid_zip_code(zip_code):
+            raise serializers.ValidationError({"zip_code": ["This zip code does not exist."]})
+        if zip_code is not None and city and not index.is_valid_pair(zip_code, city):
+            raise serializers.ValidationError({"city": [f"The city does not match zip code {zip_code}."]})
+        return data
 
-class AddressSerializer(serializers.ModelSerializer):
     class Meta:
         model = Address
         fields = '__all__'
@@ -26,7 +45,37 @@ class UserSerializer(serializers.ModelSerializer):
         return user
 
 
-class BasketItemSerializer(serializers.ModelSerializer):
+class BasketItemSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = BasketItem
         fields = ('owner', 'article')
+
+
+class BasketItemQuantitySerializer(serializers.Serializer):
+    article = serializers.IntegerField()
+    quantity = serializers.IntegerField(min_value=1)
+
+
+class BasketBulkUpdateSerializer(serializers.Serializer):
+    """Input for setting the quantities of several basket items at once."""
+    items = BasketItemQuantitySerializer(many=True, allow_empty=False)
+
+
+class BasketBulkDeleteSerializer(serializers.Serializer):
+    """Input for removing several articles from the basket at once."""
+    articles = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=1000)
+
+
+class TokenLoginSerializer(serializers.Serializer):
+    email = serializers.EmailField()
+    password = serializers.CharField(write_only=True)
+
+
+class RefreshTokenSerializer(serializers.Serializer):
+    refresh = serializers.CharField()
+
+
+class UserDeletionJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = UserDeletionJob
+        fields = ('user_pk', 'status', 'progress', 'error', 'created', 'changed', 'finished')
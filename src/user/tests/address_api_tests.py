@@ -1,8 +1,11 @@
 import pytest
 
+from django.core.cache import cache
+from django.urls import reverse
+
 from src.user.tests.conftest import VALID_ADDRESS, OTHER_VALID_ADDRESS, INVALID_ADDRESS_FIELDS
 
-from src.user.address_management import Address
+from src.user.address_management import Address, default_addresses_version_key, get_default_address_ids
 
 
 @pytest.mark.django_db
@@ -134,7 +137,28 @@ class TestAddressCreationFailure:
 
 @pytest.mark.django_db
 class TestAddressListSuccess:
-    pass
+    @pytest.mark.parametrize("address_type", ["shipping", "billing"])
+    def test_default_filter_follows_default_change(
+            self,
+            address_type,
+            authenticated_client,
+            create_and_set_as_default
+    ):
+        """GIVEN an authenticated user who has changed their default address
+
+        WHEN that user requests their default shipping or billing address
+
+        THEN only the new default address is returned.
+        """
+        create_and_set_as_default(address_type, VALID_ADDRESS)
+        create_and_set_as_default(address_type, OTHER_VALID_ADDRESS)
+
+        path = reverse("user:address_list") + f"?is{address_type.capitalize()}Default=true"
+        response = authenticated_client.get(path=path)
+
+        addresses = response.json()
+        assert len(addresses) == 1
+        assert OTHER_VALID_ADDRESS.items() <= addresses[0].items()
 
 
 @pytest.mark.django_db
@@ -318,6 +342,22 @@ class TestAddressDefaultChangeSuccess:
         new_default = user.addresses.get(**OTHER_VALID_ADDRESS)
         assert getattr(new_default, f"is_{address_type}_default")
 
+    def test_switching_defaults_leaves_one_default_per_type(self, create_address, set_as_default, user):
+        """GIVEN an authenticated user with two addresses
+
+        WHEN the user switches the shipping and billing default between them several times
+
+        THEN there is exactly one default address of each type after every switch."""
+        first_id = create_address(VALID_ADDRESS).json()["id"]
+        second_id = create_address(OTHER_VALID_ADDRESS).json()["id"]
+
+        for shipping_id, billing_id in [(first_id, second_id), (second_id, first_id), (second_id, second_id)]:
+            assert set_as_default("shipping", shipping_id).status_code == 200
+            assert set_as_default("billing", billing_id).status_code == 200
+
+            assert list(user.addresses.filter(is_shipping_default=True).values_list("id", flat=True)) == [shipping_id]
+            assert list(user.addresses.filter(is_billing_default=True).values_list("id", flat=True)) == [billing_id]
+
 
 @pytest.mark.django_db
 class TestAddressDefaultChangeFailure:
@@ -385,3 +425,59 @@ class TestAddressDefaultChangeFailure:
         # First address should still be the default
         expected_default_address = user.addresses.get(**VALID_ADDRESS)
         assert getattr(expected_default_address, f"is_{address_type}_default")
+
+    @pytest.mark.parametrize("address_type", ["shipping", "billing"])
+    def test_foreign_address_id_changes_nothing(
+            self,
+            address_type,
+            create_and_set_as_default,
+            set_as_default,
+            user,
+            other_user
+    ):
+        """GIVEN an authenticated user with a default address and another
+        user with a default address of her own
+
+        WHEN the user tries to set the other user's address as her default
+
+        THEN a 404 is returned and the defaults of both users are unchanged."""
+        create_and_set_as_default(address_type, VALID_ADDRESS)
+        foreign_address = Address.objects.create(user=other_user, **OTHER_VALID_ADDRESS)
+        Address.objects.filter(pk=foreign_address.pk).update(**{f"is_{address_type}_default": True})
+        defaults_before = list(Address.objects.order_by("id").values_list(
+            "id", "user_id", "is_shipping_default", "is_billing_default"
+        ))
+
+        response = set_as_default(address_type, foreign_address.id)
+
+        assert response.status_code == 404
+        assert list(Address.objects.order_by("id").values_list(
+            "id", "user_id", "is_shipping_default", "is_billing_default"
+        )) == defaults_before
+        assert user.addresses.get(**{f"is_{address_type}_default": True}).user_id == user.id
+
+
+@pytest.mark.django_db
+class TestDefaultAddressCache:
+    @pytest.fixture(autouse=True)
+    def run_on_commit_immediately(self, mocker):
+        """The test transaction is never committed, so on_commit callbacks would not run."""
+        mocker.patch("django.db.transaction.on_commit", side_effect=lambda callback: callback())
+
+    def test_late_write_of_old_defaults_is_not_read(self, create_address, set_as_default, user):
+        """GIVEN a reader that loaded the user's default address ids
+
+        WHEN the default changes and the reader only then writes the old ids to the cache
+
+        THEN the new default is returned, since the old ids belong to an old version.
+        """
+        old_id = create_address(VALID_ADDRESS).json()["id"]
+        new_id = create_address(OTHER_VALID_ADDRESS).json()["id"]
+        set_as_default("shipping", old_id)
+
+        old_version = cache.get(default_addresses_version_key(user.pk))
+        stale_defaults = get_default_address_ids(user)
+        set_as_default("shipping", new_id)
+        cache.set(f"default-addresses:{user.pk}:{old_version}", stale_defaults)
+
+        assert get_default_address_ids(user)["shipping"] == new_id
@@ -0,0 +1,147 @@
+import pytest
+
+from django.urls import reverse
+
+from src.article.models import Board
+from src.order.models import Order, OrderState, PaymentState, ShippingMethod
+from src.user.address_management import Address
+from src.user.models import BasketItem
+
+from .conftest import BOARD_ATTRIBUTES
+
+
+@pytest.fixture
+def create_board(user):
+    def _create_board(**attributes) -> Board:
+        """Closure to create a board (and thereby a basket item) for the user."""
+        board_attributes = BOARD_ATTRIBUTES.copy()
+        board_attributes.update(attributes)
+        return Board.objects.create(
+            owner=user,
+            gerberFileName="gerber.zip",
+            gerberHash="blablub123",
+            attributes=board_attributes
+        )
+    return _create_board
+
+
+@pytest.mark.django_db
+class TestBasketSummary:
+    def test_summary_contains_all_basket_items(self, authenticated_client, create_board):
+        """GIVEN an authenticated user with some boards in their basket
+
+        WHEN that user requests their basket summary
+
+        THEN every board is listed with its attributes and price,
+        and the total is the sum of all item prices.
+        """
+        boards = [create_board(dimensionX=100 + i) for i in range(3)]
+
+        response = authenticated_client.get(path=reverse("user:basket_summary"))
+        assert response.status_code == 200
+
+        summary = response.json()
+        assert {item["article"] for item in summary["items"]} == {board.pk for board in boards}
+        assert all(item["attributes"] == Board.objects.get(pk=item["article"]).attributes for item in summary["items"])
+        assert float(summary["total"]) == pytest.approx(sum(float(item["price"]) for item in summary["items"]))
+
+    def test_summary_reflects_new_board(self, authenticated_client, create_board):
+        """GIVEN an authenticated user whose basket summary has been requested
+
+        WHEN the user creates another board
+
+        THEN the next basket summary contains that board as well.
+        """
+        create_board()
+        authenticated_client.get(path=reverse("user:basket_summary"))
+
+        new_board = create_board(dimensionX=200)
+        response = authenticated_client.get(path=reverse("user:basket_summary"))
+
+        assert new_board.pk in {item["article"] for item in response.json()["items"]}
+
+
+@pytest.mark.django_db
+class TestBasketBulkOperations:
+    def test_bulk_delete_removes_given_articles(self, authenticated_client, create_board, user):
+        """GIVEN an authenticated user with three boards in their basket
+
+        WHEN that user removes two of them in one request
+
+        THEN only the third board is left in the basket.
+        """
+        boards = [create_board(dimensionX=100 + i) for i in range(3)]
+
+        response = authenticated_client.delete(
+            path=reverse("user:basket_bulk"),
+            data={"articles": [boards[0].pk, boards[1].pk]},
+            content_type="application/json"
+        )
+        assert response.status_code == 200
+        assert response.json() == {"deleted": 2}
+        assert list(user.basketitem_set.values_list("article_id", flat=True)) == [boards[2].pk]
+
+    def test_bulk_patch_sets_quantities(self, authenticated_client, create_board, user):
+        """GIVEN an authenticated user with two boards in their basket
+
+        WHEN that user sets new quantities for both in one request
+
+        THEN both basket items have the new quantities.
+        """
+        boards = [create_board(dimensionX=100 + i) for i in range(2)]
+        quantities = {boards[0].pk: 3, boards[1].pk: 5}
+
+        response = authenticated_client.patch(
+            path=reverse("user:basket_bulk"),
+            data={"items": [{"article": pk, "quantity": quantity} for pk, quantity in quantities.items()]},
+            content_type="application/json"
+        )
+        assert response.status_code == 200
+        assert dict(user.basketitem_set.values_list("article_id", "quantity")) == quantities
+
+    def test_reorder_adds_only_missing_boards(self, authenticated_client, create_board, user):
+        """GIVEN a past order of three boards, one of which is back in the user's basket
+
+        WHEN that user puts the order back into their basket
+
+        THEN the two other boards are added with their ordered quantities.
+        """
+        boards = [create_board(dimensionX=100 + i) for i in range(3)]
+        user.basketitem_set.update(quantity=4)
+        address = Address.objects.create(
+            user=user, receiver_first_name="Max", receiver_last_name="Mustermann",
+            street="Musterstraße", house_number="99", zip_code="99999", city="Berlin"
+        )
+        order = Order.objects.create(
+            user=user,
+            shipping_method=ShippingMethod.objects.first(),
+            shipping_address=address,
+            billing_address=address,
+            amount=15.99,
+            vat=1.12,
+            order_state=OrderState.objects.get(name="received"),
+            payment_state=PaymentState.objects.get(name="pending")
+        )
+        assert not user.basketitem_set.exists()
+        BasketItem.objects.create(owner=user, article=boards[0], quantity=1)
+
+        response = authenticated_client.post(path=reverse("user:basket_reorder", args=[order.pk]))
+
+        assert response.status_code == 200
+        assert response.json() == {"added": 2}
+        assert dict(user.basketitem_set.values_list("article_id", "quantity")) == {
+            boards[0].pk: 1,
+            boards[1].pk: 4,
+            boards[2].pk: 4,
+        }
+
+    def test_reorder_of_unknown_order_returns_404(self, authenticated_client):
+        """GIVEN an authenticated user
+
+        WHEN that user tries to put an order that does not exist back into their basket
+
+        THEN a 404 status code is returned.
+        """
+        NON_EXISTING_ORDER_ID = 9999
+        response = authenticated_client.post(path=reverse("user:basket_reorder", args=[NON_EXISTING_ORDER_ID]))
+        assert response.status_code == 404
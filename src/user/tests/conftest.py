@@ -19,6 +19,14 @@ OTHER_VALID_ADDRESS = {
     "zip_code": "88888"
 }
 
+BOARD_ATTRIBUTES = {
+    "dimensionX": 100,
+    "dimensionY": 100,
+    "castellatedHoles": "no",
+    "num_designs": 1,
+    "quantity": 10
+}
+
 INVALID_ADDRESS_FIELDS = [
     (pytest.param({"zip_code": "1234"}, id="Zip too short")),
     (pytest.param({"zip_code": "123456"}, id="Zip too long")),
@@ -1,8 +1,16 @@
+import io
+import json
+import zipfile
+
+import jwt
 import pytest
 
+from django.core.cache import cache
 from django.urls import reverse
 
+from src.user.authentication import revoked_refresh_token_cache_key
 from src.user.models import User
+from src.user.account_deletion import UserDeletionJob, get_pending_jobs, run_deletion_job
 
 
 @pytest.mark.django_db
@@ -145,6 +153,42 @@ class TestUserDetailsSuccess:
         assert response_body == expected_response_body
 
 
+@pytest.mark.django_db
+class TestUserDeletion:
+    def test_deletion_deactivates_user_and_enqueues_job(self, authenticated_client, user):
+        """GIVEN an authenticated user
+
+        WHEN that user deletes their account
+
+        THEN a 202 status code is returned, the user is deactivated
+        and a pending deletion job exists.
+        """
+        response = authenticated_client.delete(path=reverse("user:user_details"))
+        assert response.status_code == 202
+        assert response.json()["status"] == UserDeletionJob.PENDING
+
+        user.refresh_from_db()
+        assert not user.is_active
+        assert UserDeletionJob.objects.filter(user_pk=user.pk).exists()
+
+    def test_deletion_job_deletes_user_without_orders(self, authenticated_client, user):
+        """GIVEN a user without orders who deleted their account
+
+        WHEN the pending deletion jobs are run
+
+        THEN the user is removed from the database and the job is done.
+        """
+        authenticated_client.delete(path=reverse("user:user_details"))
+
+        for job in get_pending_jobs():
+            run_deletion_job(job)
+
+        assert not User.objects.filter(pk=user.pk).exists()
+        job = UserDeletionJob.objects.get(user_pk=user.pk)
+        assert job.status == UserDeletionJob.DONE
+        assert job.progress["user"] == "deleted"
+
+
 @pytest.mark.django_db
 class TestUserDetailsFailure:
     def test_anonymous_user_does_not_retrieve_user_details(self, client):
@@ -160,3 +204,103 @@ class TestUserDetailsFailure:
         response_body = response.json()
         expected_response_body = {'detail': 'Authentication credentials were not provided.'}
         assert response_body == expected_response_body
+
+
+@pytest.mark.django_db
+class TestTokenAuthentication:
+    @pytest.fixture
+    def token_pair(self, client, user):
+        response = client.post(
+            path=reverse("user:token_login"),
+            data={"email": user.email, "password": "pcb_password"}
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    def test_access_token_authenticates_user(self, client, user, token_pair):
+        """GIVEN a user who logged in with email and password
+
+        WHEN that user requests their user details with the access token
+
+        THEN the user details are returned.
+        """
+        response = client.get(
+            path=reverse("user:user_details"),
+            HTTP_AUTHORIZATION=f"Bearer {token_pair['access']}"
+        )
+        assert response.status_code == 200
+        assert response.json()["id"] == user.pk
+
+    def test_revoked_access_token_is_rejected(self, client, token_pair):
+        """GIVEN a user who logged in and logged out again
+
+        WHEN that user requests their user details with the old access token
+
+        THEN a 403 status code is returned.
+        """
+        auth_header = f"Bearer {token_pair['access']}"
+        response = client.post(
+            path=reverse("user:token_logout"),
+            data={"refresh": token_pair["refresh"]},
+            HTTP_AUTHORIZATION=auth_header
+        )
+        assert response.status_code == 204
+
+        response = client.get(path=reverse("user:user_details"), HTTP_AUTHORIZATION=auth_header)
+        assert response.status_code == 403
+
+    def test_revoked_refresh_token_is_shared_between_processes(self, client, token_pair):
+        """GIVEN a user who logged out with their refresh token
+
+        WHEN that refresh token is used again
+
+        THEN its revocation is found in the cache shared by all worker processes
+        and the refresh is rejected.
+        """
+        auth_header = f"Bearer {token_pair['access']}"
+        client.post(
+            path=reverse("user:token_logout"),
+            data={"refresh": token_pair["refresh"]},
+            HTTP_AUTHORIZATION=auth_header
+        )
+        jti = jwt.decode(token_pair["refresh"], options={"verify_signature": False})["jti"]
+        assert cache.get(revoked_refresh_token_cache_key(jti)) is True
+
+        response = client.post(path=reverse("user:token_refresh"), data={"refresh": token_pair["refresh"]})
+        assert response.status_code == 403
+
+    def test_refresh_token_can_only_be_used_once(self, client, token_pair):
+        """GIVEN a user who logged in
+
+        WHEN that user uses their refresh token twice
+
+        THEN the first refresh returns a new token pair and the second one fails.
+        """
+        response = client.post(path=reverse("user:token_refresh"), data={"refresh": token_pair["refresh"]})
+        assert response.status_code == 200
+        assert set(response.json()) == {"access", "refresh"}
+
+        response = client.post(path=reverse("user:token_refresh"), data={"refresh": token_pair["refresh"]})
+        assert response.status_code == 403
+
+
+@pytest.mark.django_db
+class TestPersonalDataExport:
+    def test_export_contains_all_files(self, authenticated_client, user):
+        """GIVEN an authenticated user
+
+        WHEN that user requests their personal data export
+
+        THEN a zip archive with one NDJSON file per kind of data
+        and their account details is returned.
+        """
+        response = authenticated_client.get(path=reverse("user:personal_data_export"))
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/zip"
+
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content)))
+        assert set(archive.namelist()) == {
+            "account.ndjson", "boards.ndjson", "orders.ndjson", "addresses.ndjson", "audit_log.ndjson"
+        }
+        account = json.loads(archive.read("account.ndjson"))
+        assert account["email"] == user.email
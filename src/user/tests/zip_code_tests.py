@@ -0,0 +1,49 @@
+import pytest
+
+from src.user.zip_codes import ZipCodeIndex, build_index
+
+
+ZIP_CODE_PAIRS = [
+    ("10115", "Berlin"),
+    ("10117", "Berlin"),
+    ("16321", "Bernau bei Berlin"),
+    ("80331", "München"),
+    ("01067", "Dresden"),
+    ("8033", "Too Short"),
+]
+
+
+@pytest.fixture
+def index(tmp_path) -> ZipCodeIndex:
+    path = tmp_path / "zip_codes.bin"
+    build_index(ZIP_CODE_PAIRS, path)
+    return ZipCodeIndex(path)
+
+
+class TestZipCodeValidation:
+    def test_known_zip_code_is_valid(self, index):
+        assert index.is_valid_zip_code("01067")
+
+    @pytest.mark.parametrize("zip_code", ["99999", "8033", "abcde"])
+    def test_unknown_or_malformed_zip_code_is_invalid(self, index, zip_code):
+        assert not index.is_valid_zip_code(zip_code)
+
+    def test_matching_city_is_valid_case_insensitively(self, index):
+        assert index.is_valid_pair("80331", "münchen")
+
+    def test_city_of_other_zip_code_is_invalid(self, index):
+        assert not index.is_valid_pair("80331", "Berlin")
+
+
+class TestCityAutocomplete:
+    def test_prefix_returns_matching_cities_with_zip_codes(self, index):
+        assert index.autocomplete("ber") == [
+            {"city": "Berlin", "zip_codes": ["10115", "10117"]},
+            {"city": "Bernau bei Berlin", "zip_codes": ["16321"]},
+        ]
+
+    def test_limit_is_respected(self, index):
+        assert len(index.autocomplete("ber", limit=1)) == 1
+
+    def test_unknown_prefix_returns_nothing(self, index):
+        assert index.autocomplete("xyz") == []
@@ -5,10 +5,19 @@ from . import views
 app_name = 'user'
 
 urlpatterns = [
+    path('auth/token/', views.TokenLogin.as_view(), name='token_login'),
+    path('auth/token/refresh/', views.TokenRefresh.as_view(), name='token_refresh'),
+    path('auth/token/logout/', views.TokenLogout.as_view(), name='token_logout'),
     path('user/info/', views.UserDetails.as_view(), name='user_details'),
+    path('user/export/', views.PersonalDataExport.as_view(), name='personal_data_export'),
+    path('user/deletion-jobs/<int:user_pk>/', views.UserDeletionJobDetails.as_view(), name='deletion_job_details'),
     path('user/addresses/', views.AddressList.as_view(), name='address_list'),
     path('user/addresses/<int:pk>/', views.AddressDetails.as_view(), name='address_details'),
+    path('user/addresses/city-autocomplete/', views.CityAutocomplete.as_view(), name='city_autocomplete'),
     path('user/addresses/change-default/', views.change_address_default, name='change_address_default'),
     path('shop/user/basket/', views.BasketItemList.as_view(), name='basket_items'),
+    path('shop/user/basket/summary/', views.BasketSummary.as_view(), name='basket_summary'),
+    path('shop/user/basket/bulk/', views.BasketBulk.as_view(), name='basket_bulk'),
+    path('shop/user/basket/reorder/<int:order_pk>/', views.BasketReorder.as_view(), name='basket_reorder'),
     path('shop/user/basket/<int:article_pk>/', views.BasketItemDetails.as_view(), name='basket_item_details'),
 ]
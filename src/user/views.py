@@ -1,20 +1,51 @@
 from django.shortcuts import get_object_or_404
-from django.http import JsonResponse
-from django.views.decorators.http import require_GET
-from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse, StreamingHttpResponse
+from django.contrib.auth import authenticate
 
 from rest_framework import generics
-from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.decorators import api_view
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.permissions import IsAdminUser, IsAuthenticated, AllowAny
+
+from core.fieldsets import SparseFieldsetMixin
 
 from .models import User, BasketItem
-from .address_management import Address, disable_old_default, set_new_default
-from .serializers import UserSerializer, AddressSerializer, BasketItemSerializer
+from .address_management import Address, change_default, get_default_address_ids
+from .account_deletion import UserDeletionJob, request_deletion
+from .data_export import export_personal_data
+from .zip_codes import get_zip_code_index
+from .authentication import (
+    REFRESH_TOKEN,
+    JWTAuthentication,
+    create_token_pair,
+    decode_token,
+    revoke_token
+)
+from .basket_management import (
+    get_basket_summary,
+    remove_basket_items,
+    update_basket_quantities,
+    add_order_to_basket
+)
+from .serializers import (
+    UserSerializer,
+    AddressSerializer,
+    BasketItemSerializer,
+    BasketBulkUpdateSerializer,
+    BasketBulkDeleteSerializer,
+    TokenLoginSerializer,
+    RefreshTokenSerializer,
+    UserDeletionJobSerializer
+)
 
 
 class UserDetails(generics.RetrieveDestroyAPIView):
     """GET: Returns details for current user.
 
-    DELETE: Deletes current user.
+    DELETE: Deactivates current user immediately and enqueues the deletion
+    of their account, which is carried out by a background job.
     """
     queryset = User.objects.all()
     serializer_class = UserSerializer
@@ -24,11 +55,104 @@ class UserDetails(generics.RetrieveDestroyAPIView):
         current_user_pk = self.request.user.pk
         return get_object_or_404(User, pk=current_user_pk)
 
+    def destroy(self, request, *args, **kwargs):
+        job = request_deletion(self.get_object())
+
+        # Token authentication does not look at the user table,
+        # so the token used for this request has to be revoked explicitly.
+        if isinstance(request.auth, dict):
+            revoke_token(request.auth)
+        return Response(UserDeletionJobSerializer(job).data, status=202)
+
+
+class UserDeletionJobDetails(generics.RetrieveAPIView):
+    """GET: Returns status and progress of the deletion job
+    for the user with the given id. Admins only.
+    """
+    queryset = UserDeletionJob.objects.all()
+    serializer_class = UserDeletionJobSerializer
+    permission_classes = [IsAdminUser]
+    lookup_field = "user_pk"
+
+
+class PersonalDataExport(APIView):
+    """GET: Streams all personal data of the current user (account, boards,
+    orders with their items, addresses and audit history) as a zip archive
+    with one NDJSON file each.
+    """
+    def get(self, request):
+        response = StreamingHttpResponse(export_personal_data(request.user), content_type="application/zip")
+        response["Content-Disposition"] = f'attachment; filename="personal-data-{request.user.pk}.zip"'
+        return response
+
+
+class TokenLogin(APIView):
+    """POST: Accepts email and password and returns a short-lived access token
+    and a refresh token. Requests sent with an 'Authorization: Bearer <access token>'
+    header are authenticated by the token signature alone.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        serializer = TokenLoginSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        user = authenticate(
+            request,
+            email=serializer.validated_data["email"],
+            password=serializer.validated_data["password"]
+        )
+        if user is None:
+            raise AuthenticationFailed("Unable to log in with provided credentials.")
+        return Response(create_token_pair(user))
+
+
+class TokenRefresh(APIView):
+    """POST: Accepts a refresh token and returns a new pair of access and refresh token.
+    The old refresh token cannot be used again.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        serializer = RefreshTokenSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        payload = decode_token(serializer.validated_data[REFRESH_TOKEN], REFRESH_TOKEN)
+        user = User.objects.filter(pk=payload["user_id"], is_active=True).first()
+        if user is None:
+            raise AuthenticationFailed("User is inactive or does not exist.")
+
+        # Adding the revocation fails if a concurrent request used the token first
+        if not revoke_token(payload):
+            raise AuthenticationFailed("Token has been revoked.")
+        return Response(create_token_pair(user))
+
+
+class TokenLogout(APIView):
+    """POST: Revokes the access token used for this request and,
+    if given, the refresh token.
+    """
+    authentication_classes = [JWTAuthentication]
 
-class AddressList(generics.ListCreateAPIView):
+    def post(self, request):
+        revoke_token(request.auth)
+
+        serializer = RefreshTokenSerializer(data=request.data)
+        if serializer.is_valid():
+            try:
+                revoke_token(decode_token(serializer.validated_data[REFRESH_TOKEN], REFRESH_TOKEN))
+            except AuthenticationFailed:
+                pass
+        return Response(status=204)
+
+
+class AddressList(SparseFieldsetMixin, generics.ListCreateAPIView):
     """GET: Returns list of current user's addresses. If query parameters isBillingDefault
     or isShippingDefault (not both at the same time) are added with the value "true",
-    the respective default address is returned.
+    the respective default address is returned. The returned fields can be
+    restricted, e.g. ?fields=id,city.
 
     POST: Saves new address to the database.
     """
@@ -44,8 +168,10 @@ class AddressList(generics.ListCreateAPIView):
         for address_type in ["billing", "shipping"]:
             if self.request.query_params.get(f"is{address_type.capitalize()}Default") == "true":
 
-                default_address = current_user.addresses.filter(**{f"is_{address_type}_default": True})
-                return default_address
+                default_address_id = get_default_address_ids(current_user)[address_type]
+                if default_address_id is None:
+                    return Address.objects.none()
+                return Address.objects.filter(pk=default_address_id)
 
         return current_user.addresses.all()
 
@@ -68,8 +194,20 @@ class AddressDetails(generics.RetrieveUpdateDestroyAPIView):
         return Address.objects.filter(user_id=self.request.user.pk)
 
 
-@require_GET
-@login_required
+class CityAutocomplete(APIView):
+    """GET: Returns up to ten German cities, with their zip codes, whose names
+    start with the given prefix query param.
+    """
+    def get(self, request):
+        index = get_zip_code_index()
+        if index is None:
+            return JsonResponse(status=503, data={"Error": "City autocomplete is currently not available."})
+
+        prefix = request.query_params.get("prefix", "")
+        return Response(index.autocomplete(prefix))
+
+
+@api_view(["GET"])
 def change_address_default(request):
     """GET: Changes a user's default shipping or billing address.
     The new default is given by the address id and the type URL parameter
@@ -85,19 +223,19 @@ def change_address_default(request):
     current_user = request.user
     new_default_address_id = int(new_default_address_id)
 
-    # Make sure current user owns the new default address
-    if not current_user.addresses.filter(id=new_default_address_id):
+    # Fails if the current user does not own the new default address
+    if not change_default(address_type, current_user, new_default_address_id):
         response_body = {"Error": "Address does not exist for this user."}
         return JsonResponse(status=404, data=response_body)
 
-    disable_old_default(address_type, current_user)
-    set_new_default(address_type, current_user, new_default_address_id)
     response_body = {"Success": f"Default {address_type} address changed successfully"}
     return JsonResponse(response_body)
 
 
-class BasketItemList(generics.ListAPIView):
-    """Retrieve a list of all items present in the current user's basket."""
+class BasketItemList(SparseFieldsetMixin, generics.ListAPIView):
+    """Retrieve a list of all items present in the current user's basket.
+    The returned fields can be restricted, e.g. ?fields=article.
+    """
     serializer_class = BasketItemSerializer
 
     def get_queryset(self):
@@ -105,6 +243,48 @@ class BasketItemList(generics.ListAPIView):
         return BasketItem.objects.filter(owner=user)
 
 
+class BasketSummary(APIView):
+    """Returns all items in the current user's basket together with their
+    board attributes, unit prices and the basket total (GET).
+    """
+    def get(self, request):
+        return Response(get_basket_summary(request.user))
+
+
+class BasketBulk(APIView):
+    """PATCH: Sets the quantities of several basket items, given as a list
+    of items with article id and quantity.
+
+    DELETE: Removes several articles, given as a list of article ids,
+    from the current user's basket.
+    """
+    def patch(self, request):
+        serializer = BasketBulkUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        quantities = {item["article"]: item["quantity"] for item in serializer.validated_data["items"]}
+        updated = update_basket_quantities(request.user, quantities)
+        return Response({"updated": updated})
+
+    def delete(self, request):
+        serializer = BasketBulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        deleted = remove_basket_items(request.user, serializer.validated_data["articles"])
+        return Response({"deleted": deleted})
+
+
+class BasketReorder(APIView):
+    """POST: Puts all boards of one of the current user's past orders
+    back into their basket.
+    """
+    def post(self, request, order_pk):
+        added = add_order_to_basket(request.user, order_pk)
+        if added is None:
+            return JsonResponse(status=404, data={"Error": "Order does not exist for this user."})
+        return Response({"added": added})
+
+
 class BasketItemDetails(generics.RetrieveDestroyAPIView):
     """Retrieve details of the current user's basket item specified by its ID."""
     serializer_class = BasketItemSerializer
@@ -0,0 +1,185 @@
+import mmap
+import struct
+import sys
+import threading
+from array import array
+from typing import Iterable, List, Optional, Tuple
+
+from django.conf import settings
+
+
+MAGIC = b"PLZ1"
+HEADER = struct.Struct("<4sIII")
+NUM_ZIP_CODES = 100000
+UINT32_SIZE = 4
+
+
+def parse_zip_code(zip_code: str) -> Optional[int]:
+    """Returns the zip code as an integer, or None if it is not five digits."""
+    if len(zip_code) != 5 or not zip_code.isdigit():
+        return None
+    return int(zip_code)
+
+
+class ZipCodeIndex:
+    """Read-only view of a zip code index file.
+
+    The file consists of flat uint32 arrays and is mapped into memory,
+    so lookups read directly from the mapping and all worker processes
+    share the same pages. Layout (little-endian):
+
+        header        magic, number of cities, number of (zip, city) pairs, size of the name blob
+        zip_offsets   cities of zip z are pair_cities[zip_offsets[z]:zip_offsets[z + 1]]
+        pair_cities   city ids
+        city_offsets  zip codes of city c are city_zips[city_offsets[c]:city_offsets[c + 1]]
+        city_zips     zip codes as integers
+        name_offsets  city names are names[name_offsets[c]:name_offsets[c + 1]]
+        names         UTF-8 city names, ordered by their casefolded form for prefix search
+    """
+    def __init__(self, path):
+        if sys.byteorder != "little":
+            raise RuntimeError("The zip code index can only be read on little-endian machines.")
+
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, num_cities, num_pairs, names_size = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"'{path}' is not a zip code index.")
+        self.num_cities = num_cities
+
+        view = memoryview(self._mmap)
+        position = HEADER.size
+
+        def take_uint32(count: int) -> memoryview:
+            nonlocal position
+            section = view[position:position + count * UINT32_SIZE].cast("I")
+            position += count * UINT32_SIZE
+            return section
+
+        self._zip_offsets = take_uint32(NUM_ZIP_CODES + 1)
+        self._pair_cities = take_uint32(num_pairs)
+        self._city_offsets = take_uint32(num_cities + 1)
+        self._city_zips = take_uint32(num_pairs)
+        self._name_offsets = take_uint32(num_cities + 1)
+        self._names = view[position:position + names_size]
+
+    def _city_name(self, city_id: int) -> str:
+        return str(self._names[self._name_offsets[city_id]:self._name_offsets[city_id + 1]], "utf-8")
+
+    def _city_ids(self, zip_number: int) -> memoryview:
+        return self._pair_cities[self._zip_offsets[zip_number]:self._zip_offsets[zip_number + 1]]
+
+    def _zip_codes(self, city_id: int) -> List[str]:
+        zips = self._city_zips[self._city_offsets[city_id]:self._city_offsets[city_id + 1]]
+        return [f"{zip_number:05d}" for zip_number in zips]
+
+    def cities(self, zip_code: str) -> List[str]:
+        """Returns the names of all cities with the given zip code."""
+        zip_number = parse_zip_code(zip_code)
+        if zip_number is None:
+            return []
+        return [self._city_name(city_id) for city_id in self._city_ids(zip_number)]
+
+    def is_valid_zip_code(self, zip_code: str) -> bool:
+        zip_number = parse_zip_code(zip_code)
+        return zip_number is not None and self._zip_offsets[zip_number] != self._zip_offsets[zip_number + 1]
+
+    def is_valid_pair(self, zip_code: str, city: str) -> bool:
+        """Returns True if the city (compared case-insensitively) has the given zip code."""
+        city = city.strip().casefold()
+        return any(name.casefold() == city for name in self.cities(zip_code))
+
+    def _first_city_from(self, prefix: str) -> int:
+        """Binary search for the first city whose casefolded name is not smaller than <prefix>."""
+        low, high = 0, self.num_cities
+        while low < high:
+            middle = (low + high) // 2
+            if self._city_name(middle).casefold() < prefix:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def autocomplete(self, prefix: str, limit: int = 10) -> List[dict]:
+        """Returns up to <limit> cities whose names start with <prefix>
+        (case-insensitive), each with its zip codes.
+        """
+        prefix = prefix.strip().casefold()
+        if not prefix:
+            return []
+
+        matches = []
+        city_id = self._first_city_from(prefix)
+        while city_id < self.num_cities and len(matches) < limit:
+            name = self._city_name(city_id)
+            if not name.casefold().startswith(prefix):
+                break
+            matches.append({"city": name, "zip_codes": self._zip_codes(city_id)})
+            city_id += 1
+        return matches
+
+
+def build_index(pairs: Iterable[Tuple[str, str]], path) -> int:
+    """Writes an index file for the given (zip code, city) pairs.
+    Invalid zip codes are skipped. Returns the number of indexed pairs.
+    """
+    pairs = {
+        (parse_zip_code(zip_code.strip()), city.strip())
+        for zip_code, city in pairs
+        if parse_zip_code(zip_code.strip()) is not None and city.strip()
+    }
+
+    names = sorted({city for _, city in pairs}, key=lambda name: (name.casefold(), name))
+    city_ids = {name: city_id for city_id, name in enumerate(names)}
+
+    zip_cities = [[] for _ in range(NUM_ZIP_CODES)]
+    city_zips = [[] for _ in names]
+    for zip_number, city in sorted(pairs):
+        zip_cities[zip_number].append(city_ids[city])
+        city_zips[city_ids[city]].append(zip_number)
+
+    def flatten(lists: List[List[int]]) -> Tuple[array, array]:
+        offsets, values = array("I", [0]), array("I")
+        for entries in lists:
+            values.extend(entries)
+            offsets.append(len(values))
+        return offsets, values
+
+    zip_offsets, pair_cities = flatten(zip_cities)
+    city_offsets, flat_city_zips = flatten(city_zips)
+
+    encoded_names = [name.encode("utf-8") for name in names]
+    name_offsets = array("I", [0])
+    for encoded in encoded_names:
+        name_offsets.append(name_offsets[-1] + len(encoded))
+    names_blob = b"".join(encoded_names)
+
+    sections = [zip_offsets, pair_cities, city_offsets, flat_city_zips, name_offsets]
+    if sys.byteorder != "little":
+        for section in sections:
+            section.byteswap()
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(names), len(pairs), len(names_blob)))
+        for section in sections:
+            section.tofile(f)
+        f.write(names_blob)
+
+    return len(pairs)
+
+
+_index: Optional[ZipCodeIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_zip_code_index() -> Optional[ZipCodeIndex]:
+    """Returns the index at settings.ZIP_CODE_INDEX_PATH, loading it on first use,
+    or None if no index file has been built.
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None and settings.ZIP_CODE_INDEX_PATH.exists():
+                _index = ZipCodeIndex(settings.ZIP_CODE_INDEX_PATH)
+    return _index